@@ -0,0 +1,10 @@
+# Benchmarks package
+
+
+def quiet_streamlit_logs():
+    """bare 모드/사용 중단 경고로 벤치마크 출력이 묻히지 않도록 Streamlit 로그를 error로 제한"""
+    from streamlit import config, logger
+
+    # config를 처음 파싱할 때 logger.level 값으로 다시 설정되므로 먼저 파싱시킨다
+    config.get_option('logger.level')
+    logger.set_log_level('error')
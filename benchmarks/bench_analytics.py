@@ -0,0 +1,74 @@
+"""
+워라밸 분석 벤치마크
+일정 블록 100k개 기준으로 벡터화 분석(utils.analytics)과
+일별 불리언 마스크 반복 계산(utils.data_utils 방식)을 비교
+
+실행: python -m benchmarks.bench_analytics [--blocks 100000] [--days 31]
+"""
+
+import argparse
+import time
+from datetime import date
+
+import numpy as np
+import pandas as pd
+
+from utils.analytics import SCHEDULE_CATEGORIES, build_schedule_frame, summarize_schedule
+from utils.data_utils import calculate_worklife_score
+
+
+def generate_blocks(count: int, days: int, seed: int = 42) -> pd.DataFrame:
+    """샘플 형식(date/time/duration/category) 합성 일정"""
+    rng = np.random.default_rng(seed)
+    start_day = pd.Timestamp(date.today()).normalize()
+    minutes = rng.integers(0, 24 * 60, count)
+    return pd.DataFrame({
+        'date': start_day + pd.to_timedelta(rng.integers(0, days, count), unit='D'),
+        'time': [f"{m // 60:02d}:{m % 60:02d}" for m in minutes],
+        'duration': rng.integers(10, 120, count),
+        'category': rng.choice(SCHEDULE_CATEGORIES, count),
+        'task': '블록',
+        'state': rng.choice(['scheduled', 'completed'], count),
+    })
+
+
+def naive_daily(df: pd.DataFrame, current_time: str):
+    """기존 방식: 날짜마다 마스크 필터 + 문자열 시각 비교"""
+    result = {}
+    for day in df['date'].unique():
+        day_df = df[df['date'] == day]
+        completed = len(day_df[day_df['time'] <= current_time])
+        result[day] = (calculate_worklife_score(day_df), completed, len(day_df))
+    return result
+
+
+def _timed(func, *args, repeat: int = 3) -> float:
+    best = float('inf')
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func(*args)
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--blocks', type=int, default=100_000)
+    parser.add_argument('--days', type=int, default=31)
+    args = parser.parse_args()
+
+    df = generate_blocks(args.blocks, args.days)
+    frame = build_schedule_frame(df)
+
+    build = _timed(build_schedule_frame, df)
+    summarize = _timed(summarize_schedule, frame)
+    naive = _timed(naive_daily, df, "12:00")
+
+    print(f"blocks={args.blocks:,} days={args.days}")
+    print(f"  build_schedule_frame : {build * 1000:8.1f} ms")
+    print(f"  summarize_schedule   : {summarize * 1000:8.1f} ms")
+    print(f"  naive per-day loop   : {naive * 1000:8.1f} ms  ({naive / summarize:.1f}x slower)")
+
+
+if __name__ == '__main__':
+    main()
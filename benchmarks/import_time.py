@@ -0,0 +1,115 @@
+"""
+import 시간 리포트
+python -X importtime 결과로 앱 모듈의 콜드 스타트 import 시간을 집계하고,
+AppTest로 로그인 페이지 첫 렌더링 시간을 측정해 예산과 비교
+
+실행: python -m benchmarks.import_time [--top 15]
+예산 초과 또는 로그인 경로에서 무거운 라이브러리가 import되면 종료 코드 1
+"""
+
+import argparse
+import subprocess
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+# 로그인 화면까지 필요한 앱 모듈 (src/app.py의 최상위 import)
+COLD_START_MODULES = ['components.sidebar', 'components.auth', 'utils.styling']
+# 로그인 화면 렌더링 중 import되면 안 되는 무거운 라이브러리
+LAZY_MODULES = ['pandas', 'numpy', 'plotly.graph_objects', 'plotly.express']
+# streamlit이 page_icon 이미지 처리에 자체적으로 쓰는 모듈 (첫 렌더링 검사에서 제외)
+STREAMLIT_RUNTIME_MODULES = {'numpy'}
+
+# 예산 (ms) - streamlit 자체 import 시간은 제외
+COLD_START_BUDGET_MS = 150
+# 로그인 페이지 첫 렌더링 예산 (ms) - AppTest 실행 기준
+LOGIN_FIRST_PAINT_BUDGET_MS = 1500
+
+
+def parse_importtime(stderr: str):
+    """-X importtime 출력 → [(모듈, self us, cumulative us)]"""
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, cumulative_us, name = line[len('import time:'):].split('|')
+        # 들여쓰기(중첩 깊이)는 유지
+        rows.append((name[1:].rstrip(), int(self_us), int(cumulative_us)))
+    return rows
+
+
+def measure_cold_start(modules):
+    """streamlit을 먼저 import한 뒤 앱 모듈만의 import 시간 측정 (새 프로세스)"""
+    code = 'import streamlit\nimport sys\nmark = set(sys.modules)\n' + ''.join(
+        f'import {module}\n' for module in modules
+    ) + 'print(",".join(sorted(set(sys.modules) - mark)))'
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', code],
+        cwd=PROJECT_ROOT, capture_output=True, text=True, check=True,
+    )
+    rows = parse_importtime(result.stderr)
+    # streamlit 이후 import된 모듈만 집계
+    start = max(i for i, (name, _, _) in enumerate(rows) if name == 'streamlit') + 1
+    rows = rows[start:]
+    loaded = set(result.stdout.strip().split(','))
+    return rows, loaded
+
+
+def measure_login_first_paint():
+    """로그인 전 상태로 src/app.py 한 번 실행 (새 프로세스, 소요 ms와 import된 모듈 반환)"""
+    code = (
+        'import sys, time\n'
+        'from streamlit.testing.v1 import AppTest\n'
+        'mark = set(sys.modules)\n'
+        'started = time.perf_counter()\n'
+        'at = AppTest.from_file("src/app.py", default_timeout=30).run()\n'
+        'elapsed = (time.perf_counter() - started) * 1000\n'
+        'print(elapsed)\n'
+        'print(",".join(sorted(set(sys.modules) - mark)))\n'
+    )
+    result = subprocess.run(
+        [sys.executable, '-c', code], cwd=PROJECT_ROOT, capture_output=True, text=True, check=True,
+    )
+    elapsed, loaded = result.stdout.strip().splitlines()[-2:]
+    return float(elapsed), set(loaded.split(','))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--top', type=int, default=15, help='가장 느린 모듈 표시 개수')
+    args = parser.parse_args()
+
+    failures = []
+
+    rows, loaded = measure_cold_start(COLD_START_MODULES)
+    top_level = [row for row in rows if not row[0].startswith(' ')]
+    cold_start_ms = sum(cumulative for _, _, cumulative in top_level) / 1000
+    print(f"cold start (app modules after streamlit): {cold_start_ms:8.1f} ms  (budget {COLD_START_BUDGET_MS} ms)")
+    for name, self_us, cumulative_us in sorted(rows, key=lambda r: -r[1])[:args.top]:
+        print(f"  {self_us / 1000:7.1f} ms self  {cumulative_us / 1000:7.1f} ms cum  {name.strip()}")
+    if cold_start_ms > COLD_START_BUDGET_MS:
+        failures.append(f"cold start {cold_start_ms:.1f} ms > {COLD_START_BUDGET_MS} ms")
+
+    first_paint_ms, paint_loaded = measure_login_first_paint()
+    print(f"login first paint (AppTest): {first_paint_ms:8.1f} ms  (budget {LOGIN_FIRST_PAINT_BUDGET_MS} ms)")
+    if first_paint_ms > LOGIN_FIRST_PAINT_BUDGET_MS:
+        failures.append(f"login first paint {first_paint_ms:.1f} ms > {LOGIN_FIRST_PAINT_BUDGET_MS} ms")
+
+    eager = sorted(
+        m for m in LAZY_MODULES
+        if m in loaded or (m in paint_loaded and m not in STREAMLIT_RUNTIME_MODULES)
+    )
+    if eager:
+        failures.append(f"heavy modules imported on login path: {', '.join(eager)}")
+
+    if failures:
+        print("FAIL")
+        for failure in failures:
+            print(f"  - {failure}")
+        sys.exit(1)
+    print("OK")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,296 @@
+"""
+다중 사용자 부하 테스트
+로컬 스텁 백엔드(benchmarks.stub_backend)를 띄우고 AppTest 세션 N개를 워커 프로세스에서 번갈아 돌려
+실제 사용 흐름(로그인 → 대시보드 → 태스크 필터 → 스케줄 주 이동 → AI 채팅)을 재현
+한 Streamlit 서버 프로세스가 세션을 얼마나 감당하는지 보기 위한 도구
+
+실행: python -m benchmarks.load_test [--sessions 20] [--workers 1] [--iterations 1] [--latency-ms 20]
+결과: 초당 리런 수, 리런 지연 p50/p95/p99, 상호작용별 백엔드 호출 수, 세션당 메모리
+--max-p95-ms를 주면 p95가 그보다 클 때 종료 코드 1
+"""
+
+import argparse
+import gc
+import multiprocessing
+import os
+import sys
+import tempfile
+import time
+from collections import defaultdict
+from datetime import timedelta
+from pathlib import Path
+from typing import Callable, Dict, List, Tuple
+
+from benchmarks import quiet_streamlit_logs
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+APP_PATH = PROJECT_ROOT / "src" / "app.py"
+
+# AppTest 한 번 실행의 제한 시간 (초) - AI 스트림 응답까지 포함
+RUN_TIMEOUT = 120
+# 보고할 지연 백분위
+LATENCY_PERCENTILES = (50, 95, 99)
+# AI 채팅 단계에서 보낼 메시지
+CHAT_MESSAGE = "오늘 할 일을 추천해줘"
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """최근접 순위 방식 백분위 (값이 없으면 0)"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = max(0, min(len(ordered) - 1, int(round(pct / 100 * len(ordered) + 0.5)) - 1))
+    return ordered[index]
+
+
+def rss_bytes() -> int:
+    """현재 프로세스의 상주 메모리 (bytes, 알 수 없으면 0)"""
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, IndexError):
+        pass
+    try:
+        import resource
+        # /proc이 없는 환경(macOS 등)에서는 최대 상주 메모리로 대체
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak if sys.platform == 'darwin' else peak * 1024
+    except (ImportError, OSError):
+        return 0
+
+
+def _click_nav(at, page_name: str):
+    """사이드바 메뉴 클릭 (현재 페이지는 버튼이 없으므로 리런만)"""
+    key = f"nav_{page_name}"
+    if any(button.key == key for button in at.sidebar.button):
+        at.sidebar.button(key=key).click().run()
+    else:
+        at.run()
+
+
+def step_login(at):
+    at.run()
+    next(b for b in at.sidebar.button if b.label == "데모 로그인").click().run()
+
+
+def step_dashboard(at):
+    _click_nav(at, "스프린트 대시보드")
+
+
+def step_tasks(at):
+    _click_nav(at, "태스크 관리")
+
+
+def step_tasks_filter(at):
+    at.text_input(key="search_term").input("대시보드").run()
+
+
+def step_schedule(at):
+    _click_nav(at, "스케줄 관리")
+
+
+def step_schedule_next_week(at):
+    week = at.date_input(key="week_date")
+    week.set_value(week.value + timedelta(days=7)).run()
+
+
+def step_ai(at):
+    _click_nav(at, "AI 어시스턴트")
+
+
+def step_ai_chat(at):
+    at.text_input[0].input(CHAT_MESSAGE)
+    next(b for b in at.button if b.label == "전송").click().run()
+
+
+# 한 번의 사용 흐름 (상호작용 이름, 실행 함수) - 상호작용마다 AppTest 실행 1회 이상
+FLOW: List[Tuple[str, Callable]] = [
+    ('login', step_login),
+    ('dashboard', step_dashboard),
+    ('tasks', step_tasks),
+    ('tasks_filter', step_tasks_filter),
+    ('schedule', step_schedule),
+    ('schedule_next_week', step_schedule_next_week),
+    ('ai', step_ai),
+    ('ai_chat', step_ai_chat),
+]
+
+
+class Session:
+    """시뮬레이션 세션 하나 (AppTest 인스턴스와 측정 결과)"""
+
+    def __init__(self, index: int):
+        from streamlit.testing.v1 import AppTest
+
+        self.index = index
+        self.at = AppTest.from_file(str(APP_PATH), default_timeout=RUN_TIMEOUT)
+        self.latencies: Dict[str, List[float]] = defaultdict(list)
+        self.errors: List[str] = []
+
+    def run_step(self, name: str, step: Callable) -> bool:
+        """상호작용 하나 실행 (소요 ms 기록, 실패 시 오류 저장)"""
+        started = time.perf_counter()
+        try:
+            step(self.at)
+        except Exception as e:
+            self.errors.append(f"session {self.index} {name}: {type(e).__name__}: {e}")
+            return False
+        self.latencies[name].append((time.perf_counter() - started) * 1000)
+        if self.at.exception:
+            self.errors.append(f"session {self.index} {name}: {self.at.exception[0].value}")
+            return False
+        return True
+
+
+def measure_backend_calls(server) -> Dict[str, int]:
+    """세션 하나로 흐름을 순서대로 실행하며 상호작용별 백엔드 호출 수 측정 (다른 세션 없음)"""
+    session = Session(-1)
+    calls = {}
+    for name, step in FLOW:
+        before = server.stats_snapshot()['total']
+        if not session.run_step(name, step):
+            raise RuntimeError(session.errors[-1])
+        # AI 컨텍스트 프리페치 등 백그라운드 요청이 끝날 때까지 잠시 대기
+        time.sleep(0.2)
+        calls[name] = server.stats_snapshot()['total'] - before
+    return calls
+
+
+def session_steps(iterations: int) -> List[Tuple[str, Callable]]:
+    """세션 하나가 실행할 상호작용 순서 (로그인은 첫 반복에만)"""
+    return FLOW + FLOW[1:] * (iterations - 1)
+
+
+def run_worker(session_indices: List[int], iterations: int, barrier, results):
+    """워커 프로세스: 맡은 세션들을 상호작용 단위로 번갈아 실행 (한 서버 프로세스에 여러 사용자가 붙은 상황)
+
+    AppTest는 실행 중 전역 Runtime을 바꿔 끼우므로 같은 프로세스에서 스레드로 동시에 돌릴 수 없다.
+    """
+    quiet_streamlit_logs()
+    # 모듈 import/차트 지연 로딩 비용이 측정에 섞이지 않도록 먼저 한 세션 실행
+    warmup = Session(-1)
+    for name, step in FLOW:
+        warmup.run_step(name, step)
+    del warmup
+    gc.collect()
+    rss_before = rss_bytes()
+    sessions = [Session(index) for index in session_indices]
+    barrier.wait()
+
+    for name, step in session_steps(iterations):
+        for session in sessions:
+            if not session.errors:
+                session.run_step(name, step)
+
+    # 세션 상태를 유지한 채로 측정해야 세션이 붙잡고 있는 메모리가 보임
+    gc.collect()
+    results.put({
+        'latencies': [dict(session.latencies) for session in sessions],
+        'errors': [error for session in sessions for error in session.errors],
+        'memory': max(0, rss_bytes() - rss_before) // max(1, len(sessions)),
+    })
+
+
+def run_load(server, session_count: int, workers: int, iterations: int) -> Dict:
+    """워커 프로세스들로 세션 실행. 측정 결과와 경과 초, 부하 중 백엔드 호출 수 반환"""
+    # 스텁 서버 스레드가 있는 프로세스를 fork하지 않도록 spawn 사용
+    context = multiprocessing.get_context('spawn')
+    # AppTest 실행이 sys.modules['__main__']을 바꿔 끼우므로 워커 함수는 모듈 경로로 참조
+    from benchmarks.load_test import run_worker as worker
+    barrier = context.Barrier(workers + 1)
+    results = context.Queue()
+    processes = [
+        context.Process(target=worker, daemon=True,
+                        args=(list(range(i, session_count, workers)), iterations, barrier, results))
+        for i in range(workers)
+    ]
+    for process in processes:
+        process.start()
+
+    barrier.wait()
+    calls_before = server.stats_snapshot()['total']
+    started = time.perf_counter()
+    outcomes = [results.get() for _ in processes]
+    elapsed = time.perf_counter() - started
+    total_calls = server.stats_snapshot()['total'] - calls_before
+    for process in processes:
+        process.join()
+
+    return {
+        'latencies': [latencies for outcome in outcomes for latencies in outcome['latencies']],
+        'errors': [error for outcome in outcomes for error in outcome['errors']],
+        'memory': sum(outcome['memory'] for outcome in outcomes) // len(outcomes),
+        'elapsed': elapsed,
+        'total_calls': total_calls,
+    }
+
+
+def report(load: Dict, backend_calls: Dict[str, int]) -> Dict[str, float]:
+    """결과 출력 및 전체 지연 요약 반환"""
+    by_step: Dict[str, List[float]] = defaultdict(list)
+    for latencies in load['latencies']:
+        for name, values in latencies.items():
+            by_step[name].extend(values)
+    everything = [value for values in by_step.values() for value in values]
+    reruns = len(everything)
+
+    header = ''.join(f"{f'p{pct}':>9s}" for pct in LATENCY_PERCENTILES)
+    print(f"{'interaction':22s} {'count':>6s}{header} {'calls':>6s}")
+    for name, _ in FLOW:
+        values = by_step.get(name, [])
+        row = ''.join(f"{percentile(values, pct):9.1f}" for pct in LATENCY_PERCENTILES)
+        print(f"{name:22s} {len(values):6d}{row} {backend_calls.get(name, 0):6d}")
+    row = ''.join(f"{percentile(everything, pct):9.1f}" for pct in LATENCY_PERCENTILES)
+    print(f"{'all':22s} {reruns:6d}{row}")
+    print()
+    elapsed = load['elapsed']
+    print(f"sessions:                  {len(load['latencies'])}")
+    print(f"wall time:                 {elapsed:.1f} s")
+    print(f"reruns/sec:                {reruns / elapsed if elapsed else 0:.2f}")
+    print(f"backend calls/interaction: {load['total_calls'] / reruns if reruns else 0:.2f} (under load)")
+    print(f"memory/session:            {load['memory'] / 1024 / 1024:.2f} MiB (RSS delta)")
+
+    return {f'p{pct}': percentile(everything, pct) for pct in LATENCY_PERCENTILES}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sessions', type=int, default=20, help='시뮬레이션 세션 수')
+    parser.add_argument('--workers', type=int, default=1, help='워커 프로세스 수 (Streamlit 서버 프로세스 수에 해당)')
+    parser.add_argument('--iterations', type=int, default=1, help='세션당 흐름 반복 횟수')
+    parser.add_argument('--latency-ms', type=float, default=20.0, help='스텁 백엔드 응답 지연')
+    parser.add_argument('--jitter-ms', type=float, default=5.0)
+    parser.add_argument('--tasks', type=int, default=500, help='스텁 태스크 수')
+    parser.add_argument('--max-p95-ms', type=float, default=0.0, help='p95 지연 상한 (0이면 검사 안 함)')
+    args = parser.parse_args()
+
+    # 스텁 백엔드를 먼저 띄우고 앱 모듈이 그 주소를 쓰도록 설정 (앱 모듈 import 전)
+    from benchmarks.stub_backend import start_stub_backend
+    server, base_url = start_stub_backend(latency_ms=args.latency_ms, jitter_ms=args.jitter_ms,
+                                          tasks=args.tasks)
+    os.environ['FLANDY_API_URL'] = base_url
+    os.environ['FLANDY_CACHE_DIR'] = tempfile.mkdtemp(prefix='flandy-load-')
+    sys.path.insert(0, str(PROJECT_ROOT))
+    quiet_streamlit_logs()
+
+    try:
+        backend_calls = measure_backend_calls(server)
+        load = run_load(server, args.sessions, max(1, min(args.workers, args.sessions)), args.iterations)
+    finally:
+        server.shutdown()
+
+    summary = report(load, backend_calls)
+
+    errors = load['errors']
+    if errors:
+        print(f"\n{len(errors)} session error(s):")
+        for error in errors[:10]:
+            print(f"  - {error}")
+        sys.exit(1)
+    if args.max_p95_ms and summary['p95'] > args.max_p95_ms:
+        print(f"\nFAIL: p95 {summary['p95']:.1f} ms > {args.max_p95_ms:.1f} ms")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
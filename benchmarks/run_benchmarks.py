@@ -0,0 +1,331 @@
+"""
+벤치마크 실행기
+로컬 스텁 백엔드(benchmarks.stub_backend)를 띄운 뒤 API 클라이언트, SSE 파싱, 5 MB JSON 디코딩,
+대역폭 제한 환경의 압축 전송(zstd/br/gzip), 태스크 필터/정렬/검색, 스케줄 그룹화, 차트 빌더, AppTest 페이지 리런 시간을 측정하고
+저장된 기준값(benchmarks/baselines.json)과 비교
+
+실행: python -m benchmarks.run_benchmarks [--only api,tasks] [--quick] [--update-baseline]
+기준값 대비 REGRESSION_THRESHOLD배 이상 느려진 항목이 있으면 종료 코드 1
+"""
+
+import argparse
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Callable, Dict, List
+
+from benchmarks import quiet_streamlit_logs
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+BASELINE_PATH = Path(__file__).resolve().parent / "baselines.json"
+
+# 기준값 대비 이 배수 이상 느려지면 회귀
+REGRESSION_THRESHOLD = 1.5
+# 이보다 작은 차이(ms)는 측정 잡음으로 보고 무시
+REGRESSION_MIN_DELTA_MS = 2.0
+# 태스크/스케줄 벤치마크 데이터 크기
+TASK_SIZES = (1_000, 10_000, 100_000)
+BLOCK_SIZES = (1_000, 10_000)
+# JSON 디코딩 벤치마크 응답 크기 (bytes)
+JSON_PAYLOAD_BYTES = 5 * 1024 * 1024
+# 압축 전송 벤치마크의 태스크 수와 대역폭 (원격 배포 흉내)
+COMPRESSION_TASKS = 5_000
+COMPRESSION_BANDWIDTH_MBPS = 20.0
+# 페이지 리런 측정 대상 (페이지 이름 → 기준값 키)
+PAGES = {
+    "스프린트 대시보드": "dashboard",
+    "태스크 관리": "tasks",
+    "스케줄 관리": "schedule",
+    "팀 관리": "team",
+    "AI 어시스턴트": "ai_assistant",
+}
+
+
+def measure(func: Callable, repeat: int = 5, number: int = 1) -> float:
+    """func를 number번 실행하는 것을 repeat번 반복해 호출당 최솟값(ms) 반환
+
+    다른 프로세스 등 외부 요인은 시간을 늘리기만 하므로 최솟값이 가장 안정적이다.
+    """
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for _ in range(number):
+            func()
+        samples.append((time.perf_counter() - started) * 1000 / number)
+    return min(samples)
+
+
+class FakeSSEResponse:
+    """iter_ai_stream_events 입력용 (iter_lines만 구현)"""
+
+    def __init__(self, lines: List[str]):
+        self.lines = lines
+
+    def iter_lines(self, decode_unicode: bool = True):
+        return iter(self.lines)
+
+
+def bench_api(results: Dict[str, float], base_url: str, token: str):
+    import requests
+    from components.api_client import PlandyAPIClient
+
+    client = PlandyAPIClient(base_url, raise_errors=True)
+    client.set_token(token)
+    headers = client.get_headers()
+
+    results['api.raw_requests_get_me'] = measure(
+        lambda: requests.get(f"{base_url}/auth/me", headers=headers).json(), number=20)
+    results['api.make_request_get_me'] = measure(lambda: client._make_request("GET", "/auth/me"), number=20)
+    results['api.make_request_get_tasks'] = measure(lambda: client._make_request("GET", "/tasks"), number=5)
+
+
+def bench_sse(results: Dict[str, float]):
+    from components.api_client import PlandyAPIClient
+
+    lines = []
+    for i in range(20_000):
+        lines += [f"id: {i}", "event: progress", f'data: {{"step": {i}, "message": "분석 중"}}', ""]
+    lines += ["event: ai_response", 'data: {"ai_response": "완료", "session_id": "s1"}', "", "data: [DONE]"]
+
+    def parse():
+        for _ in PlandyAPIClient.iter_ai_stream_events(FakeSSEResponse(lines)):
+            pass
+
+    results['sse.parse_20k_events'] = measure(parse)
+
+
+def bench_json(results: Dict[str, float]):
+    import json
+    import requests
+    from benchmarks.stub_backend import StubData
+    from components.api_client import TaskListResponse
+    from utils import json_codec
+
+    tasks = list(StubData(tasks=2_000, blocks=0).tasks.values())
+    data = []
+    while len(json.dumps({'success': True, 'data': data}).encode('utf-8')) < JSON_PAYLOAD_BYTES:
+        data += tasks
+    payload = json.dumps({'success': True, 'data': data}, ensure_ascii=False).encode('utf-8')
+
+    def requests_json():
+        # 기존 경로: requests가 인코딩을 추정해 문자열로 바꾼 뒤 표준 json으로 디코딩
+        response = requests.Response()
+        response._content = payload
+        response.encoding = None
+        response.json()
+
+    print(f"json codec: {json_codec.JSON_BACKEND}, payload {len(payload) / 1024 / 1024:.1f} MB, {len(data)} tasks")
+    results['json.requests_json_5mb'] = measure(requests_json, repeat=3)
+    results['json.stdlib_loads_5mb'] = measure(lambda: json.loads(payload), repeat=3)
+    results['json.codec_loads_5mb'] = measure(lambda: json_codec.loads(payload), repeat=3)
+    results['json.codec_typed_5mb'] = measure(lambda: json_codec.decode(payload, TaskListResponse), repeat=3)
+
+
+def bench_compression(results: Dict[str, float]):
+    from benchmarks.stub_backend import COMPRESSORS, start_stub_backend
+    from components.api_client import PlandyAPIClient
+    from utils.compression import SUPPORTED_ENCODINGS
+
+    server, base_url = start_stub_backend(tasks=COMPRESSION_TASKS, blocks=0,
+                                          bandwidth_mbps=COMPRESSION_BANDWIDTH_MBPS)
+    try:
+        client = PlandyAPIClient(base_url, raise_errors=True)
+        client.login('demo@flandy.kr', 'demo1234')
+        headers = client.get_headers()
+        # 클라이언트와 스텁 서버가 모두 지원하는 압축만
+        for encoding in ('identity',) + tuple(e for e in SUPPORTED_ENCODINGS if e in COMPRESSORS):
+            # 압축 방식 하나만 허용하도록 헤더 고정
+            client.get_headers = lambda encoding=encoding: {**headers, 'Accept-Encoding': encoding}
+            before = server.stats_snapshot()
+            results[f'compression.get_tasks_{encoding}'] = measure(
+                lambda: client._make_request("GET", "/tasks"), repeat=3)
+            after = server.stats_snapshot()
+            wire = after['bytes_sent'] - before['bytes_sent']
+            body = after['body_bytes'] - before['body_bytes']
+            print(f"compression {encoding:8s} ratio {body / wire if wire else 0:5.1f}x "
+                  f"({body / 3 / 1024:.0f} KB -> {wire / 3 / 1024:.0f} KB per request)")
+    finally:
+        server.shutdown()
+
+
+def bench_tasks(results: Dict[str, float], sizes):
+    from benchmarks.stub_backend import StubData
+    from utils.helpers import filter_tasks, sort_tasks, get_task_statistics
+
+    for size in sizes:
+        tasks = list(StubData(tasks=size, blocks=0).tasks.values())
+        label = f"{size // 1000}k"
+        results[f'tasks.filter_search_{label}'] = measure(
+            lambda: filter_tasks(tasks, sprint_id=5, search_term="대시보드"))
+        results[f'tasks.sort_priority_{label}'] = measure(lambda: sort_tasks(tasks, "우선순위"))
+        results[f'tasks.sort_created_{label}'] = measure(lambda: sort_tasks(tasks, "생성일"))
+        results[f'tasks.statistics_{label}'] = measure(lambda: get_task_statistics(tasks))
+
+
+def bench_schedule(results: Dict[str, float], sizes):
+    from benchmarks.stub_backend import StubData
+    from utils.helpers import group_schedules_by_day, group_schedules_by_hour
+
+    week_start = date.today() - timedelta(days=date.today().weekday())
+    for size in sizes:
+        data = StubData(tasks=100, blocks=size)
+        blocks = [data.block_view(b) for b in data.blocks.values()]
+        label = f"{size // 1000}k"
+        results[f'schedule.group_by_day_{label}'] = measure(lambda: group_schedules_by_day(blocks, week_start))
+        results[f'schedule.group_by_hour_{label}'] = measure(lambda: group_schedules_by_hour(blocks))
+
+
+def bench_charts(results: Dict[str, float]):
+    import pandas as pd
+    from benchmarks.stub_backend import StubData
+    from components import charts
+
+    data = StubData(teams=1, members=200, tasks=2_000, blocks=500)
+    dashboard = data.sprint_dashboard(next(s for s in data.sprints.values() if s['status'] == 'active'))
+    long_burndown = [
+        {'date': f"d{i}", 'remaining': 5000 - i, 'ideal': 5000 - i} for i in range(5_000)
+    ]
+    velocity = [{'name': f"Sprint {i}", 'completed_points': 20 + i % 7} for i in range(20)]
+    schedule = pd.DataFrame([
+        {'time': f"{(i * 7) % 24:02d}:{(i * 13) % 60:02d}", 'duration': 30, 'category': '업무', 'task': '블록'}
+        for i in range(500)
+    ])
+
+    cases = {
+        'burndown': lambda: charts.create_burndown_chart(dashboard['burndown'], 'Sprint'),
+        'burndown_5k_points': lambda: charts.create_burndown_chart(long_burndown, 'Long'),
+        'task_status': lambda: charts.create_task_status_chart(dashboard['status_counts']),
+        'workload_200_members': lambda: charts.create_member_workload_chart(dashboard['member_workload']),
+        'velocity': lambda: charts.create_velocity_chart(velocity),
+        'schedule_500_blocks': lambda: charts.create_schedule_chart(schedule),
+    }
+    # Plotly 검증기 등 첫 생성 시 지연 로딩되는 비용은 제외
+    for build in cases.values():
+        build()
+
+    for name, build in cases.items():
+        def cold():
+            charts.clear_figure_cache()
+            build()
+        results[f'charts.{name}'] = measure(cold)
+        build()
+        results[f'charts.{name}_cached'] = measure(build, number=5)
+
+
+def bench_pages(results: Dict[str, float], token: str, user: Dict, team_id: int):
+    from streamlit.testing.v1 import AppTest
+
+    def run_page(page_name=None):
+        at = AppTest.from_file(str(PROJECT_ROOT / "src" / "app.py"), default_timeout=60)
+        if page_name:
+            at.session_state['user_token'] = token
+            at.session_state['user_info'] = user
+            at.session_state['selected_page'] = page_name
+            at.session_state['selected_team_id'] = team_id
+        started = time.perf_counter()
+        at.run()
+        first = (time.perf_counter() - started) * 1000
+        if at.exception:
+            raise RuntimeError(f"{page_name or 'login'}: {at.exception[0].value}")
+        rerun = measure(at.run, repeat=3)
+        return first, rerun
+
+    first, rerun = run_page()
+    results['pages.login_first'] = first
+    results['pages.login_rerun'] = rerun
+    for page_name, key in PAGES.items():
+        first, rerun = run_page(page_name)
+        results[f'pages.{key}_first'] = first
+        results[f'pages.{key}_rerun'] = rerun
+
+
+def compare(results: Dict[str, float], baseline: Dict[str, float]) -> List[str]:
+    """결과 출력 및 회귀 항목 반환"""
+    regressions = []
+    print(f"{'benchmark':40s} {'ms':>10s} {'baseline':>10s} {'ratio':>7s}")
+    for name, value in results.items():
+        base = baseline.get(name)
+        if base is None:
+            print(f"{name:40s} {value:10.3f} {'-':>10s} {'-':>7s}")
+            continue
+        ratio = value / base if base > 0 else float('inf')
+        regressed = ratio >= REGRESSION_THRESHOLD and value - base >= REGRESSION_MIN_DELTA_MS
+        print(f"{name:40s} {value:10.3f} {base:10.3f} {ratio:6.2f}x{'  REGRESSION' if regressed else ''}")
+        if regressed:
+            regressions.append(f"{name}: {value:.3f} ms vs baseline {base:.3f} ms ({ratio:.2f}x)")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--only', default='', help='실행할 그룹 (api,sse,json,compression,tasks,schedule,charts,pages)')
+    parser.add_argument('--quick', action='store_true', help='100k 태스크와 페이지 리런 생략')
+    parser.add_argument('--update-baseline', action='store_true', help='현재 결과를 기준값으로 저장')
+    args = parser.parse_args()
+
+    groups = set(filter(None, args.only.split(','))) or {'api', 'sse', 'json', 'compression', 'tasks', 'schedule',
+                                                         'charts', 'pages'}
+    if args.quick:
+        groups.discard('pages')
+
+    # 스텁 백엔드를 먼저 띄우고 앱 모듈이 그 주소를 쓰도록 설정 (앱 모듈 import 전)
+    from benchmarks.stub_backend import start_stub_backend
+    server, base_url = start_stub_backend(tasks=500, blocks=2_000)
+    os.environ['FLANDY_API_URL'] = base_url
+    os.environ['FLANDY_CACHE_DIR'] = tempfile.mkdtemp(prefix='flandy-bench-')
+    sys.path.insert(0, str(PROJECT_ROOT))
+    quiet_streamlit_logs()
+
+    from components.api_client import PlandyAPIClient
+    client = PlandyAPIClient(base_url, raise_errors=True)
+    client.login('demo@flandy.kr', 'demo1234')
+    team_id = client.get_teams()[0]['id']
+
+    results: Dict[str, float] = {}
+    try:
+        if 'api' in groups:
+            bench_api(results, base_url, client.token)
+        if 'sse' in groups:
+            bench_sse(results)
+        if 'json' in groups:
+            bench_json(results)
+        if 'compression' in groups:
+            bench_compression(results)
+        if 'tasks' in groups:
+            bench_tasks(results, TASK_SIZES[:-1] if args.quick else TASK_SIZES)
+        if 'schedule' in groups:
+            bench_schedule(results, BLOCK_SIZES)
+        if 'charts' in groups:
+            bench_charts(results)
+        if 'pages' in groups:
+            bench_pages(results, client.token, client.user, team_id)
+    finally:
+        server.shutdown()
+
+    stored = json.loads(BASELINE_PATH.read_text(encoding='utf-8')) if BASELINE_PATH.exists() else {}
+    regressions = compare(results, stored.get('results', {}))
+
+    if args.update_baseline:
+        merged = {**stored.get('results', {}), **{k: round(v, 3) for k, v in results.items()}}
+        BASELINE_PATH.write_text(json.dumps({
+            'machine': f"{platform.system()} {platform.machine()} / Python {platform.python_version()}",
+            'results': dict(sorted(merged.items())),
+        }, indent=2, ensure_ascii=False) + "\n", encoding='utf-8')
+        print(f"baseline updated: {BASELINE_PATH}")
+        return
+
+    if regressions:
+        print("FAIL")
+        for regression in regressions:
+            print(f"  - {regression}")
+        sys.exit(1)
+    print("OK")
+
+
+if __name__ == '__main__':
+    main()
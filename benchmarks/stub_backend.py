@@ -0,0 +1,971 @@
+"""
+로컬 대체 백엔드 (벤치마크용)
+PlandyAPIClient가 사용하는 엔드포인트를 표준 라이브러리 HTTP 서버로 구현
+시드 고정 합성 데이터(N팀, M태스크, K일정 블록)와 지연/지터/대역폭 설정, ETag,
+응답 압축(Accept-Encoding에 따라 zstd/br/gzip), 변경 피드(GET /api/changes),
+팀 변경 알림 SSE(GET /api/teams/{id}/events), 요청 통계 지원
+
+실행: python -m benchmarks.stub_backend [--port 8000] [--teams 3] [--tasks 500] [--blocks 2000]
+                                         [--latency-ms 20] [--jitter-ms 10] [--bandwidth-mbps 50]
+                                         [--no-compress] [--seed 42]
+코드에서: server, base_url = start_stub_backend(tasks=1000) ... server.shutdown()
+
+모든 사용자의 비밀번호는 demo1234 (demo@flandy.kr 포함)
+"""
+
+import argparse
+import gzip
+import hashlib
+import json
+import random
+import re
+import threading
+import time
+import uuid
+from collections import Counter
+from datetime import date, datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+try:
+    from compression import zstd
+except ImportError:
+    try:
+        from backports import zstd
+    except ImportError:
+        zstd = None
+
+LOCAL_TZ = timezone(timedelta(hours=9))
+DEMO_PASSWORD = "demo1234"
+
+TASK_STATUSES = ['pending', 'in_progress', 'completed', 'cancelled']
+TASK_PRIORITIES = ['low', 'medium', 'high', 'urgent']
+TASK_LABELS = ['frontend', 'backend', 'design', 'docs', 'bug', 'infra']
+TASK_WORDS = ['로그인', '대시보드', '스프린트', '일정', '알림', '검색', '리포트', 'API', '차트', '설정']
+BLOCK_STATES = ['scheduled', 'in_progress', 'completed', 'cancelled']
+
+# 보관하는 변경 로그 수 (더 오래된 커서는 410으로 전체 동기화 요구)
+CHANGE_LOG_MAX = 10_000
+# 변경 피드 한 번에 돌려주는 최대 변경 수 (limit 생략 시)
+CHANGE_FEED_LIMIT = 500
+# 변경이 없을 때 팀 이벤트 스트림에 보내는 하트비트 간격 (초)
+EVENT_HEARTBEAT_SECONDS = 15
+
+# 이보다 작은 응답은 압축하지 않음 (bytes)
+COMPRESS_MIN_BYTES = 1024
+# 서버가 지원하는 압축 (같은 q 값이면 앞쪽 우선)
+COMPRESSORS = {
+    name: compress for name, compress in (
+        ('zstd', (lambda body: zstd.compress(body, 3)) if zstd else None),
+        ('br', (lambda body: brotli.compress(body, quality=5)) if brotli else None),
+        ('gzip', lambda body: gzip.compress(body, 6)),
+    ) if compress
+}
+
+
+def negotiate_encoding(accept_encoding: str) -> Optional[str]:
+    """Accept-Encoding 헤더에서 q 값이 가장 높은 지원 압축 선택 (없으면 None)"""
+    weights = {}
+    for item in accept_encoding.split(','):
+        name, _, params = item.strip().partition(';')
+        q = 1.0
+        if params.strip().startswith('q='):
+            try:
+                q = float(params.strip()[2:])
+            except ValueError:
+                continue
+        weights[name.strip().lower()] = q
+    candidates = [(weights.get(name, weights.get('*', 0.0)), -i, name) for i, name in enumerate(COMPRESSORS)]
+    q, _, name = max(candidates)
+    return name if q > 0 else None
+
+
+def _now_iso() -> str:
+    return datetime.now(LOCAL_TZ).isoformat(timespec='seconds')
+
+
+class StubData:
+    """시드 고정 합성 데이터 저장소 (스레드 안전)"""
+
+    def __init__(self, teams: int = 3, members: int = 5, tasks: int = 500, blocks: int = 2000,
+                 sprints: int = 6, days: int = 14, seed: int = 42):
+        self.lock = threading.RLock()
+        self.rng = random.Random(seed)
+        self.tokens: Dict[str, int] = {}
+        self._next_id = Counter()
+
+        self.users: Dict[int, Dict] = {}
+        self.teams: Dict[int, Dict] = {}
+        self.sprints: Dict[int, Dict] = {}
+        self.tasks: Dict[int, Dict] = {}
+        self.blocks: Dict[int, Dict] = {}
+        # 변경 로그 (seq 오름차순) - 생성 데이터는 포함하지 않음
+        self.changes: List[Dict] = []
+        self.change_seq = 0
+        # 변경이 추가되면 대기 중인 이벤트 스트림을 깨움
+        self.changed = threading.Condition(self.lock)
+
+        self._generate(teams, members, tasks, blocks, sprints, days)
+
+    def next_id(self, kind: str) -> int:
+        self._next_id[kind] += 1
+        return self._next_id[kind]
+
+    # 데이터 생성
+    def _generate(self, team_count, member_count, task_count, block_count, sprint_count, days):
+        rng = self.rng
+        stamp = _now_iso()
+
+        demo = self._add_user("demo@flandy.kr", "데모 사용자")
+        for team_index in range(team_count):
+            team_id = self.next_id('team')
+            members = [demo] + [
+                self._add_user(f"user{team_index}_{i}@flandy.kr", f"멤버{team_index}-{i}")
+                for i in range(member_count - 1)
+            ]
+            self.teams[team_id] = {
+                'id': team_id,
+                'name': f"팀 {team_index + 1}",
+                'description': f"합성 데이터 팀 {team_index + 1}",
+                'invite_code': f"INVITE{team_id:04d}",
+                'members': [
+                    {'user_id': u['id'], 'role': 'owner' if i == 0 else 'member'}
+                    for i, u in enumerate(members)
+                ],
+                'created_at': stamp,
+                'updated_at': stamp,
+            }
+
+            # 완료 → 활성 → 계획 순으로 2주 단위 스프린트
+            start = date.today() - timedelta(days=days * (sprint_count - 1))
+            for sprint_index in range(sprint_count):
+                sprint_id = self.next_id('sprint')
+                if sprint_index < sprint_count - 2:
+                    status = 'completed'
+                elif sprint_index == sprint_count - 2:
+                    status = 'active'
+                else:
+                    status = 'planning'
+                sprint_start = start + timedelta(days=days * sprint_index)
+                self.sprints[sprint_id] = {
+                    'id': sprint_id,
+                    'team_id': team_id,
+                    'name': f"Sprint {sprint_index + 1}",
+                    'goal': '',
+                    'status': status,
+                    'start_date': sprint_start.isoformat(),
+                    'end_date': (sprint_start + timedelta(days=days - 1)).isoformat(),
+                    'created_at': stamp,
+                    'updated_at': stamp,
+                }
+
+        team_ids = list(self.teams)
+        for _ in range(task_count):
+            team_id = rng.choice(team_ids)
+            team = self.teams[team_id]
+            sprint_ids = [s['id'] for s in self.sprints.values() if s['team_id'] == team_id]
+            sprint = self.sprints[rng.choice(sprint_ids)]
+            if sprint['status'] == 'completed':
+                status = rng.choices(TASK_STATUSES, weights=[1, 1, 12, 1])[0]
+            elif sprint['status'] == 'planning':
+                status = 'pending'
+            else:
+                status = rng.choice(TASK_STATUSES)
+            assignee_id = rng.choice(team['members'])['user_id']
+            deadline = date.fromisoformat(sprint['end_date']) - timedelta(days=rng.randint(0, days - 1))
+            self._add_task({
+                'title': f"{rng.choice(TASK_WORDS)} {rng.choice(['구현', '개선', '수정', '검토', '테스트'])} #{rng.randint(1, 9999)}",
+                'description': '합성 태스크',
+                'status': status,
+                'priority': rng.choice(TASK_PRIORITIES),
+                'deadline': deadline.isoformat(),
+                'labels': rng.sample(TASK_LABELS, rng.randint(0, 2)),
+                'story_points': rng.choice([1, 2, 3, 5, 8, 13]),
+                'sprint_id': sprint['id'],
+                'team_id': team_id,
+                'assignee_id': assignee_id,
+                'user_id': assignee_id,
+            })
+
+        task_ids = list(self.tasks)
+        user_ids = list(self.users)
+        today = datetime.combine(date.today(), datetime.min.time(), LOCAL_TZ)
+        for i in range(block_count):
+            # 절반은 데모 사용자에게, 오늘 기준 ±7일 30분 단위
+            user_id = demo['id'] if i % 2 == 0 else rng.choice(user_ids)
+            starts = today + timedelta(days=rng.randint(-7, 7), minutes=30 * rng.randint(12, 44))
+            task_id = rng.choice(task_ids) if task_ids and rng.random() < 0.7 else None
+            self._add_block({
+                'user_id': user_id,
+                'task_id': task_id,
+                'starts_at': starts.isoformat(timespec='seconds'),
+                'ends_at': (starts + timedelta(minutes=30 * rng.randint(1, 4))).isoformat(timespec='seconds'),
+                'state': rng.choice(BLOCK_STATES),
+                'source': rng.choice(['user', 'ai']),
+            })
+
+    def _add_user(self, email: str, name: str) -> Dict:
+        user_id = self.next_id('user')
+        user = {'id': user_id, 'email': email, 'name': name, 'timezone': 'Asia/Seoul', 'created_at': _now_iso()}
+        self.users[user_id] = user
+        return user
+
+    def _add_task(self, fields: Dict) -> Dict:
+        task_id = self.next_id('task')
+        stamp = _now_iso()
+        task = {'id': task_id, 'created_at': stamp, 'updated_at': stamp, **fields}
+        assignee = self.users.get(task.get('assignee_id'))
+        task['assignee_name'] = assignee['name'] if assignee else None
+        self.tasks[task_id] = task
+        return task
+
+    def _add_block(self, fields: Dict) -> Dict:
+        block_id = self.next_id('block')
+        stamp = _now_iso()
+        block = {'id': block_id, 'created_at': stamp, 'updated_at': stamp, **fields}
+        self.blocks[block_id] = block
+        return block
+
+    def record_change(self, kind: str, record: Dict, op: str = 'upsert'):
+        """변경 로그 추가 (kind: tasks / schedule / sprints). 삭제 후에도 권한을 판단할 수 있도록 범위를 함께 저장"""
+        with self.changed:
+            self.change_seq += 1
+            self.changes.append({
+                'seq': self.change_seq, 'kind': kind, 'id': record['id'], 'op': op,
+                'team_id': record.get('team_id'), 'user_id': record.get('user_id'),
+            })
+            if len(self.changes) > CHANGE_LOG_MAX:
+                del self.changes[:len(self.changes) - CHANGE_LOG_MAX]
+            self.changed.notify_all()
+
+    # 조회 헬퍼
+    def user_team_ids(self, user_id: int) -> List[int]:
+        return [t['id'] for t in self.teams.values() if any(m['user_id'] == user_id for m in t['members'])]
+
+    def team_view(self, team: Dict, user_id: int) -> Dict:
+        members = [
+            {**m, 'user': self.users.get(m['user_id'], {})}
+            for m in team['members']
+        ]
+        role = next((m['role'] for m in team['members'] if m['user_id'] == user_id), None)
+        return {**team, 'members': members, 'my_role': role}
+
+    def block_view(self, block: Dict) -> Dict:
+        task = self.tasks.get(block.get('task_id'))
+        return {**block, 'task': {'id': task['id'], 'title': task['title']} if task else None}
+
+    def sprint_dashboard(self, sprint: Dict) -> Dict:
+        tasks = [t for t in self.tasks.values() if t.get('sprint_id') == sprint['id']]
+        total_points = sum(t.get('story_points') or 0 for t in tasks)
+        completed_points = sum(t.get('story_points') or 0 for t in tasks if t['status'] == 'completed')
+        status_counts = Counter(t['status'] for t in tasks)
+
+        start = date.fromisoformat(sprint['start_date'])
+        end = date.fromisoformat(sprint['end_date'])
+        span = max((end - start).days, 1)
+        # 완료 태스크는 마감일에 소진한 것으로 간주
+        burned_by_day = Counter()
+        for t in tasks:
+            if t['status'] == 'completed' and t.get('deadline'):
+                burned_by_day[t['deadline'][:10]] += t.get('story_points') or 0
+        burndown, remaining = [], total_points
+        for offset in range(span + 1):
+            day = start + timedelta(days=offset)
+            if day > date.today():
+                break
+            remaining -= burned_by_day.get(day.isoformat(), 0)
+            burndown.append({
+                'date': day.isoformat(),
+                'remaining': remaining,
+                'ideal': round(total_points * (1 - offset / span), 1),
+            })
+
+        workload = {}
+        for t in tasks:
+            entry = workload.setdefault(t.get('assignee_id'), {
+                'user_id': t.get('assignee_id'), 'name': t.get('assignee_name') or '미배정',
+                'total': 0, 'points': 0, 'completed': 0,
+            })
+            entry['total'] += 1
+            entry['points'] += t.get('story_points') or 0
+            entry['completed'] += t['status'] == 'completed'
+
+        return {
+            'sprint': sprint,
+            'total_points': total_points,
+            'completed_points': completed_points,
+            'status_counts': {s: status_counts.get(s, 0) for s in TASK_STATUSES},
+            'burndown': burndown,
+            'member_workload': list(workload.values()),
+        }
+
+
+class StubBackend(ThreadingHTTPServer):
+    """지연/지터와 요청 통계를 가진 HTTP 서버"""
+
+    daemon_threads = True
+
+    def __init__(self, address: Tuple[str, int], data: StubData,
+                 latency_ms: float = 0.0, jitter_ms: float = 0.0,
+                 bandwidth_mbps: float = 0.0, compress: bool = True):
+        super().__init__(address, StubHandler)
+        self.data = data
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        # 0이면 대역폭 제한 없음 (원격 배포 흉내용)
+        self.bandwidth_mbps = bandwidth_mbps
+        self.compress = compress
+        self.stats_lock = threading.Lock()
+        # 종료 시 열린 이벤트 스트림을 끝내기 위한 플래그
+        self.stopping = threading.Event()
+        self.reset_stats()
+
+    def shutdown(self):
+        self.stopping.set()
+        with self.data.changed:
+            self.data.changed.notify_all()
+        super().shutdown()
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}/api"
+
+    def reset_stats(self):
+        with self.stats_lock:
+            self.stats = {'requests': Counter(), 'status': Counter(), 'encodings': Counter(),
+                          'bytes_sent': 0, 'body_bytes': 0}
+
+    def record(self, route: str, status: int, size: int, body_size: Optional[int] = None,
+               encoding: str = 'identity'):
+        with self.stats_lock:
+            self.stats['requests'][route] += 1
+            self.stats['status'][str(status)] += 1
+            self.stats['encodings'][encoding] += 1
+            self.stats['bytes_sent'] += size
+            self.stats['body_bytes'] += size if body_size is None else body_size
+
+    def stats_snapshot(self) -> Dict:
+        with self.stats_lock:
+            return {
+                'requests': dict(self.stats['requests']),
+                'status': dict(self.stats['status']),
+                'encodings': dict(self.stats['encodings']),
+                'bytes_sent': self.stats['bytes_sent'],
+                'body_bytes': self.stats['body_bytes'],
+                'total': sum(self.stats['requests'].values()),
+            }
+
+    def simulate_latency(self):
+        delay = self.latency_ms + random.uniform(-self.jitter_ms, self.jitter_ms)
+        if delay > 0:
+            time.sleep(delay / 1000)
+
+    def simulate_transfer(self, size: int):
+        """대역폭 제한이 있으면 전송 시간만큼 대기"""
+        if self.bandwidth_mbps > 0:
+            time.sleep(size * 8 / (self.bandwidth_mbps * 1_000_000))
+
+
+# (메서드, 경로 패턴, 핸들러 이름, 인증 필요 여부)
+ROUTES = [
+    ('GET', r'/api/health', 'health', False),
+    ('GET', r'/api/changes', 'changes', True),
+    ('POST', r'/api/auth/login', 'login', False),
+    ('POST', r'/api/auth/register', 'register', False),
+    ('GET', r'/api/auth/me', 'me', True),
+    ('POST', r'/api/auth/logout', 'logout', True),
+    ('GET', r'/api/tasks', 'list_tasks', True),
+    ('POST', r'/api/tasks', 'create_task', True),
+    ('PUT', r'/api/tasks/(\d+)', 'update_task', True),
+    ('DELETE', r'/api/tasks/(\d+)', 'delete_task', True),
+    ('GET', r'/api/schedule', 'list_schedule', True),
+    ('GET', r'/api/schedule/date/([\d-]+)', 'schedule_by_date', True),
+    ('POST', r'/api/schedule', 'create_block', True),
+    ('PUT', r'/api/schedule/(\d+)', 'update_block', True),
+    ('DELETE', r'/api/schedule/(\d+)', 'delete_block', True),
+    ('POST', r'/api/ai/chat', 'ai_chat', True),
+    ('POST', r'/api/ai/optimize-schedule', 'optimize_schedule', True),
+    ('POST', r'/api/ai/reschedule', 'reschedule', True),
+    ('GET', r'/api/teams', 'list_teams', True),
+    ('POST', r'/api/teams', 'create_team', True),
+    ('POST', r'/api/teams/join', 'join_team', True),
+    ('GET', r'/api/teams/(\d+)', 'get_team', True),
+    ('GET', r'/api/teams/(\d+)/events', 'team_events', True),
+    ('PUT', r'/api/teams/(\d+)', 'update_team', True),
+    ('DELETE', r'/api/teams/(\d+)', 'delete_team', True),
+    ('POST', r'/api/teams/(\d+)/leave', 'leave_team', True),
+    ('PUT', r'/api/teams/(\d+)/members/(\d+)', 'update_member', True),
+    ('DELETE', r'/api/teams/(\d+)/members/(\d+)', 'remove_member', True),
+    ('GET', r'/api/teams/(\d+)/sprints', 'list_sprints', True),
+    ('POST', r'/api/teams/(\d+)/sprints', 'create_sprint', True),
+    ('GET', r'/api/sprints/(\d+)', 'get_sprint', True),
+    ('PUT', r'/api/sprints/(\d+)', 'update_sprint', True),
+    ('DELETE', r'/api/sprints/(\d+)', 'delete_sprint', True),
+    ('POST', r'/api/sprints/(\d+)/activate', 'activate_sprint', True),
+    ('POST', r'/api/sprints/(\d+)/complete', 'complete_sprint', True),
+    ('GET', r'/api/sprints/(\d+)/dashboard', 'sprint_dashboard', True),
+    ('GET', r'/__stats', 'stats', False),
+    ('POST', r'/__stats/reset', 'reset_stats', False),
+]
+_COMPILED_ROUTES = [(m, re.compile(p + r'$'), h, a) for m, p, h, a in ROUTES]
+
+
+class HTTPError(Exception):
+    def __init__(self, status: int, message: str, errors: Optional[Dict] = None):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+        self.errors = errors
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    """라우팅과 JSON/SSE 응답"""
+
+    protocol_version = 'HTTP/1.1'
+    server: StubBackend
+
+    def log_message(self, format, *args):
+        # 벤치마크 출력을 어지럽히지 않도록 접근 로그 생략
+        pass
+
+    def do_GET(self):
+        self._dispatch('GET')
+
+    def do_POST(self):
+        self._dispatch('POST')
+
+    def do_PUT(self):
+        self._dispatch('PUT')
+
+    def do_DELETE(self):
+        self._dispatch('DELETE')
+
+    # 요청 처리
+    def _dispatch(self, method: str):
+        parts = urlsplit(self.path)
+        self.query = {k: v[-1] for k, v in parse_qs(parts.query).items()}
+        length = int(self.headers.get('Content-Length') or 0)
+        raw = self.rfile.read(length) if length else b''
+
+        for route_method, pattern, handler_name, needs_auth in _COMPILED_ROUTES:
+            match = pattern.match(parts.path)
+            if route_method != method or not match:
+                continue
+            self.route = f"{method} {pattern.pattern[:-1]}"
+            if not handler_name.startswith(('stats', 'reset_stats')):
+                self.server.simulate_latency()
+            try:
+                self.body = json.loads(raw) if raw else {}
+                with self.server.data.lock:
+                    self.user_id = self._authenticate() if needs_auth else None
+                    result = getattr(self, f'handle_{handler_name}')(*[int(g) if g.isdigit() else g for g in match.groups()])
+            except HTTPError as e:
+                payload = {'message': e.message}
+                if e.errors:
+                    payload['errors'] = e.errors
+                self._send_json(payload, e.status)
+                return
+            except json.JSONDecodeError:
+                self._send_json({'message': 'Invalid JSON'}, 400)
+                return
+            if callable(result):
+                # 스트림 응답은 데이터 잠금을 놓은 뒤 보냄 (열려 있는 동안 다른 요청을 막지 않도록)
+                result()
+            elif isinstance(result, tuple):
+                self._send_json(*result)
+            elif result is not None:
+                self._send_json(result)
+            return
+
+        self.route = f"{method} (unmatched)"
+        self._send_json({'message': 'Not Found'}, 404)
+
+    def _authenticate(self) -> int:
+        header = self.headers.get('Authorization', '')
+        user_id = self.server.data.tokens.get(header[7:]) if header.startswith('Bearer ') else None
+        if user_id is None:
+            raise HTTPError(401, 'Unauthenticated.')
+        return user_id
+
+    def _send_json(self, payload, status: int = 200):
+        body = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+        etag = f'"{hashlib.sha1(body).hexdigest()}"'
+        if self.command == 'GET' and status == 200 and self.headers.get('If-None-Match') == etag:
+            self.send_response(304)
+            self.send_header('ETag', etag)
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            self.server.record(self.route, 304, 0)
+            return
+
+        encoding = None
+        if self.server.compress and len(body) >= COMPRESS_MIN_BYTES:
+            encoding = negotiate_encoding(self.headers.get('Accept-Encoding', ''))
+        wire = COMPRESSORS[encoding](body) if encoding else body
+
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(wire)))
+        if encoding:
+            self.send_header('Content-Encoding', encoding)
+        if self.server.compress:
+            self.send_header('Vary', 'Accept-Encoding')
+        if self.command == 'GET' and status == 200:
+            self.send_header('ETag', etag)
+        self.end_headers()
+        self.server.simulate_transfer(len(wire))
+        self.wfile.write(wire)
+        self.server.record(self.route, status, len(wire), len(body), encoding or 'identity')
+
+    @staticmethod
+    def _ok(data=None, status: int = 200, **extra):
+        payload = {'success': True, **extra}
+        if data is not None:
+            payload['data'] = data
+        return payload, status
+
+    def _require(self, mapping: Dict, key: int, label: str) -> Dict:
+        item = mapping.get(key)
+        if item is None:
+            raise HTTPError(404, f'{label} not found')
+        return item
+
+    def _member_team(self, team_id: int) -> Dict:
+        team = self._require(self.server.data.teams, team_id, 'Team')
+        if team_id not in self.server.data.user_team_ids(self.user_id):
+            raise HTTPError(403, 'Forbidden')
+        return team
+
+    def _member_sprint(self, sprint_id: int) -> Dict:
+        sprint = self._require(self.server.data.sprints, sprint_id, 'Sprint')
+        self._member_team(sprint['team_id'])
+        return sprint
+
+    @staticmethod
+    def _touch(item: Dict, fields: Dict, allowed) -> Dict:
+        item.update({k: v for k, v in fields.items() if k in allowed})
+        item['updated_at'] = _now_iso()
+        return item
+
+    # 시스템 / 통계
+    def handle_health(self):
+        return {'status': 'healthy', 'timestamp': _now_iso(), 'version': 'stub'}
+
+    def handle_stats(self):
+        return self.server.stats_snapshot()
+
+    def handle_reset_stats(self):
+        self.server.reset_stats()
+        return self._ok()
+
+    # 변경 피드
+    def _visible(self, change: Dict, team_ids) -> bool:
+        if change['kind'] == 'schedule':
+            return change['user_id'] == self.user_id
+        if change['kind'] == 'sprints':
+            return change['team_id'] in team_ids
+        return change['team_id'] in team_ids or change['user_id'] == self.user_id
+
+    def handle_changes(self):
+        """cursor 이후 변경 (같은 항목의 여러 변경은 마지막 것만). cursor가 없으면 현재 커서만 반환"""
+        data = self.server.data
+        if 'cursor' not in self.query:
+            return self._ok({'cursor': data.change_seq, 'changes': [], 'has_more': False})
+        try:
+            cursor = int(self.query['cursor'])
+            limit = max(1, int(self.query.get('limit') or CHANGE_FEED_LIMIT))
+        except ValueError:
+            raise HTTPError(422, 'The given data was invalid.', {'cursor': ['The cursor must be an integer.']})
+        oldest = data.changes[0]['seq'] if data.changes else data.change_seq + 1
+        if cursor < oldest - 1:
+            raise HTTPError(410, 'Cursor expired. Full resync required.')
+
+        kinds = set(self.query['kinds'].split(',')) if self.query.get('kinds') else None
+        team_ids = set(data.user_team_ids(self.user_id))
+        latest: Dict[Tuple[str, int], Dict] = {}
+        next_cursor, has_more = cursor, False
+        for change in data.changes[max(0, cursor - oldest + 1):]:
+            if len(latest) >= limit:
+                has_more = True
+                break
+            next_cursor = change['seq']
+            if (kinds and change['kind'] not in kinds) or not self._visible(change, team_ids):
+                continue
+            latest.pop((change['kind'], change['id']), None)
+            latest[(change['kind'], change['id'])] = change
+
+        sources = {'tasks': data.tasks, 'schedule': data.blocks, 'sprints': data.sprints}
+        changes = []
+        for (kind, record_id), change in latest.items():
+            record = sources[kind].get(record_id)
+            if change['op'] == 'delete' or record is None:
+                changes.append({'seq': change['seq'], 'kind': kind, 'id': record_id, 'op': 'delete'})
+            else:
+                changes.append({'seq': change['seq'], 'kind': kind, 'id': record_id, 'op': 'upsert',
+                                'record': data.block_view(record) if kind == 'schedule' else record})
+        return self._ok({'cursor': next_cursor, 'changes': changes, 'has_more': has_more})
+
+    def handle_team_events(self, team_id):
+        """팀 변경 알림 SSE 스트림 (연결 이후 변경의 kind/id/op만 - 내용은 변경 피드로 받음)"""
+        self._member_team(team_id)
+        cursor = self.server.data.change_seq
+        return lambda: self._stream_team_events(team_id, cursor)
+
+    def _stream_team_events(self, team_id: int, cursor: int):
+        """팀 범위(팀 태스크/스프린트)와 본인 범위(개인 태스크/일정) 변경을 알림, 변경이 없으면 하트비트 주석"""
+        server, data = self.server, self.server.data
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/event-stream; charset=utf-8')
+        self.send_header('Cache-Control', 'no-cache')
+        self.send_header('Connection', 'close')
+        self.end_headers()
+        self.close_connection = True
+
+        size = 0
+        try:
+            while not server.stopping.is_set():
+                with data.changed:
+                    if data.change_seq == cursor:
+                        data.changed.wait(EVENT_HEARTBEAT_SECONDS)
+                    oldest = data.changes[0]['seq'] if data.changes else data.change_seq + 1
+                    pending = data.changes[max(0, cursor - oldest + 1):]
+                    team_ids = set(data.user_team_ids(self.user_id))
+                    cursor = data.change_seq
+                if team_id not in team_ids:
+                    # 팀에서 나갔거나 팀이 삭제됨
+                    break
+                chunk = ''.join(
+                    f"id: {change['seq']}\nevent: change\ndata: "
+                    f"{json.dumps({k: change[k] for k in ('seq', 'kind', 'id', 'op')})}\n\n"
+                    for change in pending
+                    if self._visible(change, team_ids)
+                    and (change['team_id'] == team_id or change['user_id'] == self.user_id)
+                ) or ": ping\n\n"
+                self.wfile.write(chunk.encode('utf-8'))
+                self.wfile.flush()
+                size += len(chunk)
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+        server.record(self.route, 200, size)
+
+    # 인증
+    def _issue_token(self, user: Dict):
+        token = uuid.uuid4().hex
+        self.server.data.tokens[token] = user['id']
+        return self._ok({'token': token, 'user': user})
+
+    def handle_login(self):
+        data = self.server.data
+        user = next((u for u in data.users.values() if u['email'] == self.body.get('email')), None)
+        if not user or self.body.get('password') != DEMO_PASSWORD:
+            raise HTTPError(422, 'The provided credentials are incorrect.',
+                            {'email': ['The provided credentials are incorrect.']})
+        return self._issue_token(user)
+
+    def handle_register(self):
+        data = self.server.data
+        email = self.body.get('email')
+        if not email or any(u['email'] == email for u in data.users.values()):
+            raise HTTPError(422, 'The given data was invalid.', {'email': ['The email has already been taken.']})
+        return self._issue_token(data._add_user(email, self.body.get('name', '')))
+
+    def handle_me(self):
+        return self._ok(self.server.data.users[self.user_id])
+
+    def handle_logout(self):
+        token = self.headers.get('Authorization', '')[7:]
+        self.server.data.tokens.pop(token, None)
+        return self._ok()
+
+    # 태스크
+    def handle_list_tasks(self):
+        data = self.server.data
+        team_ids = set(data.user_team_ids(self.user_id))
+        tasks = [
+            t for t in data.tasks.values()
+            if t.get('team_id') in team_ids or t.get('user_id') == self.user_id
+        ]
+        for key in ('status', 'priority'):
+            if key in self.query:
+                tasks = [t for t in tasks if t.get(key) == self.query[key]]
+        if 'date' in self.query:
+            tasks = [t for t in tasks if (t.get('deadline') or '')[:10] == self.query['date']]
+        if 'updated_since' in self.query:
+            # 같은 초에 바뀐 항목을 놓치지 않도록 경계 포함
+            tasks = [t for t in tasks if t['updated_at'] >= self.query['updated_since']]
+        return self._ok(tasks)
+
+    def handle_create_task(self):
+        if not self.body.get('title'):
+            raise HTTPError(422, 'The given data was invalid.', {'title': ['The title field is required.']})
+        fields = {'status': 'pending', 'user_id': self.user_id, **self.body}
+        task = self.server.data._add_task(fields)
+        self.server.data.record_change('tasks', task)
+        return self._ok(task, 201)
+
+    def handle_update_task(self, task_id):
+        task = self._require(self.server.data.tasks, task_id, 'Task')
+        self._touch(task, self.body, set(task) | {'deadline', 'story_points', 'sprint_id', 'assignee_id'})
+        assignee = self.server.data.users.get(task.get('assignee_id'))
+        task['assignee_name'] = assignee['name'] if assignee else None
+        self.server.data.record_change('tasks', task)
+        return self._ok(task)
+
+    def handle_delete_task(self, task_id):
+        task = self._require(self.server.data.tasks, task_id, 'Task')
+        del self.server.data.tasks[task_id]
+        self.server.data.record_change('tasks', task, 'delete')
+        return self._ok()
+
+    # 스케줄
+    def _user_blocks(self):
+        return [b for b in self.server.data.blocks.values() if b['user_id'] == self.user_id]
+
+    def handle_list_schedule(self):
+        blocks = self._user_blocks()
+        start = self.query.get('start_date') or self.query.get('date')
+        end = self.query.get('end_date') or self.query.get('date')
+        if start:
+            blocks = [b for b in blocks if b['starts_at'][:10] >= start]
+        if end:
+            blocks = [b for b in blocks if b['starts_at'][:10] <= end]
+        if 'updated_since' in self.query:
+            blocks = [b for b in blocks if b['updated_at'] >= self.query['updated_since']]
+        view = self.server.data.block_view
+        return self._ok([view(b) for b in sorted(blocks, key=lambda b: b['starts_at'])])
+
+    def handle_schedule_by_date(self, day):
+        view = self.server.data.block_view
+        blocks = [b for b in self._user_blocks() if b['starts_at'][:10] == day]
+        return self._ok([view(b) for b in sorted(blocks, key=lambda b: b['starts_at'])])
+
+    def handle_create_block(self):
+        if not self.body.get('starts_at') or not self.body.get('ends_at'):
+            raise HTTPError(422, 'The given data was invalid.', {'starts_at': ['The starts at field is required.']})
+        block = self.server.data._add_block({'state': 'scheduled', 'source': 'user', **self.body, 'user_id': self.user_id})
+        self.server.data.record_change('schedule', block)
+        return self._ok(self.server.data.block_view(block), 201)
+
+    def handle_update_block(self, block_id):
+        block = self._require(self.server.data.blocks, block_id, 'Schedule')
+        self._touch(block, self.body, {'starts_at', 'ends_at', 'state', 'source', 'task_id'})
+        self.server.data.record_change('schedule', block)
+        return self._ok(self.server.data.block_view(block))
+
+    def handle_delete_block(self, block_id):
+        block = self._require(self.server.data.blocks, block_id, 'Schedule')
+        del self.server.data.blocks[block_id]
+        self.server.data.record_change('schedule', block, 'delete')
+        return self._ok()
+
+    # AI
+    def handle_ai_chat(self):
+        """SSE 스트림: ai_response → complete 이벤트 (청크 사이 지연 포함)"""
+        session_id = self.body.get('session_id') or uuid.uuid4().hex
+        answer = f"'{self.body.get('message', '')}'에 대한 스텁 응답입니다. " \
+                 f"컨텍스트 키: {', '.join(sorted((self.body.get('context') or {}).keys())) or '없음'}"
+        events = [
+            ('ai_response', {'ai_response': answer, 'session_id': session_id}),
+            ('complete', {'ai_response': answer, 'session_id': session_id}),
+        ]
+        return lambda: self._stream_ai_chat(events)
+
+    def _stream_ai_chat(self, events: List[Tuple[str, Dict]]):
+        """청크 사이 지연을 두고 SSE 이벤트 전송 (데이터 잠금 밖에서 실행)"""
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/event-stream; charset=utf-8')
+        self.send_header('Cache-Control', 'no-cache')
+        self.send_header('Connection', 'close')
+        self.end_headers()
+        self.close_connection = True
+
+        size = 0
+        for index, (event, payload) in enumerate(events):
+            chunk = f"id: {index}\nevent: {event}\ndata: {json.dumps(payload, ensure_ascii=False)}\n\n".encode('utf-8')
+            self.wfile.write(chunk)
+            self.wfile.flush()
+            size += len(chunk)
+            self.server.simulate_latency()
+        self.wfile.write(b"data: [DONE]\n\n")
+        self.server.record(self.route, 200, size)
+
+    def handle_optimize_schedule(self):
+        day = self.body.get('date') or date.today().isoformat()
+        blocks = [b for b in self._user_blocks() if b['starts_at'][:10] == day][:3]
+        changes = []
+        for block in blocks:
+            starts = datetime.fromisoformat(block['starts_at']) + timedelta(minutes=30)
+            ends = datetime.fromisoformat(block['ends_at']) + timedelta(minutes=30)
+            task = self.server.data.tasks.get(block.get('task_id'))
+            changes.append({
+                'schedule_id': block['id'],
+                'task_title': task['title'] if task else '',
+                'original_starts_at': block['starts_at'],
+                'original_ends_at': block['ends_at'],
+                'new_starts_at': starts.isoformat(timespec='seconds'),
+                'new_ends_at': ends.isoformat(timespec='seconds'),
+            })
+        return self._ok(changes=changes, reasoning='스텁 최적화: 각 블록을 30분 뒤로 이동')
+
+    def handle_reschedule(self):
+        return self._ok({'task_id': self.body.get('task_id'), 'suggestions': []})
+
+    # 팀
+    def handle_list_teams(self):
+        data = self.server.data
+        return self._ok([data.team_view(data.teams[t], self.user_id) for t in data.user_team_ids(self.user_id)])
+
+    def handle_create_team(self):
+        data = self.server.data
+        team_id = data.next_id('team')
+        stamp = _now_iso()
+        data.teams[team_id] = {
+            'id': team_id,
+            'name': self.body.get('name', ''),
+            'description': self.body.get('description', ''),
+            'invite_code': f"INVITE{team_id:04d}",
+            'members': [{'user_id': self.user_id, 'role': 'owner'}],
+            'created_at': stamp,
+            'updated_at': stamp,
+        }
+        return self._ok(data.team_view(data.teams[team_id], self.user_id), 201)
+
+    def handle_join_team(self):
+        data = self.server.data
+        team = next((t for t in data.teams.values() if t['invite_code'] == self.body.get('invite_code')), None)
+        if not team:
+            raise HTTPError(422, 'The given data was invalid.', {'invite_code': ['Invalid invite code.']})
+        if not any(m['user_id'] == self.user_id for m in team['members']):
+            team['members'].append({'user_id': self.user_id, 'role': 'member'})
+            team['updated_at'] = _now_iso()
+        return self._ok(data.team_view(team, self.user_id))
+
+    def handle_get_team(self, team_id):
+        return self._ok(self.server.data.team_view(self._member_team(team_id), self.user_id))
+
+    def handle_update_team(self, team_id):
+        team = self._touch(self._member_team(team_id), self.body, {'name', 'description'})
+        return self._ok(self.server.data.team_view(team, self.user_id))
+
+    def handle_delete_team(self, team_id):
+        self._member_team(team_id)
+        del self.server.data.teams[team_id]
+        return self._ok()
+
+    def handle_leave_team(self, team_id):
+        team = self._member_team(team_id)
+        team['members'] = [m for m in team['members'] if m['user_id'] != self.user_id]
+        team['updated_at'] = _now_iso()
+        return self._ok()
+
+    def handle_update_member(self, team_id, member_id):
+        team = self._member_team(team_id)
+        for member in team['members']:
+            if member['user_id'] == member_id:
+                member['role'] = self.body.get('role', member['role'])
+        team['updated_at'] = _now_iso()
+        return self._ok()
+
+    def handle_remove_member(self, team_id, member_id):
+        team = self._member_team(team_id)
+        team['members'] = [m for m in team['members'] if m['user_id'] != member_id]
+        team['updated_at'] = _now_iso()
+        return self._ok()
+
+    # 스프린트
+    def handle_list_sprints(self, team_id):
+        self._member_team(team_id)
+        return self._ok([s for s in self.server.data.sprints.values() if s['team_id'] == team_id])
+
+    def handle_create_sprint(self, team_id):
+        self._member_team(team_id)
+        data = self.server.data
+        sprint_id = data.next_id('sprint')
+        stamp = _now_iso()
+        data.sprints[sprint_id] = {
+            'goal': '', 'start_date': date.today().isoformat(), 'end_date': date.today().isoformat(),
+            **self.body, 'id': sprint_id, 'team_id': team_id, 'status': 'planning',
+            'created_at': stamp, 'updated_at': stamp,
+        }
+        data.record_change('sprints', data.sprints[sprint_id])
+        return self._ok(data.sprints[sprint_id], 201)
+
+    def handle_get_sprint(self, sprint_id):
+        return self._ok(self._member_sprint(sprint_id))
+
+    def _sprint_changed(self, sprint: Dict):
+        self.server.data.record_change('sprints', sprint)
+        return self._ok(sprint)
+
+    def handle_update_sprint(self, sprint_id):
+        return self._sprint_changed(
+            self._touch(self._member_sprint(sprint_id), self.body, {'name', 'goal', 'start_date', 'end_date'}))
+
+    def handle_delete_sprint(self, sprint_id):
+        sprint = self._member_sprint(sprint_id)
+        del self.server.data.sprints[sprint_id]
+        self.server.data.record_change('sprints', sprint, 'delete')
+        return self._ok()
+
+    def handle_activate_sprint(self, sprint_id):
+        return self._sprint_changed(self._touch(self._member_sprint(sprint_id), {'status': 'active'}, {'status'}))
+
+    def handle_complete_sprint(self, sprint_id):
+        return self._sprint_changed(self._touch(self._member_sprint(sprint_id), {'status': 'completed'}, {'status'}))
+
+    def handle_sprint_dashboard(self, sprint_id):
+        return self._ok(self.server.data.sprint_dashboard(self._member_sprint(sprint_id)))
+
+
+def start_stub_backend(host: str = '127.0.0.1', port: int = 0, latency_ms: float = 0.0,
+                       jitter_ms: float = 0.0, bandwidth_mbps: float = 0.0, compress: bool = True,
+                       **data_options) -> Tuple[StubBackend, str]:
+    """백그라운드 스레드에서 스텁 서버 시작 (port=0이면 빈 포트 사용). (서버, base_url) 반환"""
+    server = StubBackend((host, port), StubData(**data_options), latency_ms, jitter_ms,
+                         bandwidth_mbps, compress)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, server.base_url
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8000)
+    parser.add_argument('--teams', type=int, default=3)
+    parser.add_argument('--members', type=int, default=5, help='팀당 멤버 수')
+    parser.add_argument('--tasks', type=int, default=500)
+    parser.add_argument('--blocks', type=int, default=2000)
+    parser.add_argument('--sprints', type=int, default=6, help='팀당 스프린트 수')
+    parser.add_argument('--latency-ms', type=float, default=0.0)
+    parser.add_argument('--jitter-ms', type=float, default=0.0)
+    parser.add_argument('--bandwidth-mbps', type=float, default=0.0, help='응답 대역폭 제한 (0이면 제한 없음)')
+    parser.add_argument('--no-compress', action='store_true', help='응답 압축 끄기')
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    data = StubData(teams=args.teams, members=args.members, tasks=args.tasks,
+                    blocks=args.blocks, sprints=args.sprints, seed=args.seed)
+    server = StubBackend((args.host, args.port), data, args.latency_ms, args.jitter_ms,
+                         args.bandwidth_mbps, not args.no_compress)
+    encodings = ','.join(COMPRESSORS) if server.compress else 'off'
+    print(f"stub backend on {server.base_url} "
+          f"(teams={args.teams} tasks={args.tasks} blocks={args.blocks}, "
+          f"latency={args.latency_ms}±{args.jitter_ms} ms, compression={encodings}) "
+          f"- login demo@flandy.kr / {DEMO_PASSWORD}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,117 @@
+"""
+AI 컨텍스트 빌더
+AI 채팅 전송 시 블로킹 호출 없이 첨부할 태스크/오늘 일정 요약을 세션별로 미리 준비
+"""
+
+import threading
+import time
+from datetime import date
+from typing import Optional, Dict, Any
+
+import streamlit as st
+from components.api_client import PlandyAPIClient, PlandyAPIError
+
+# 모델에 전달하는 태스크 최대 개수
+CONTEXT_TASK_LIMIT = 10
+# 모델이 사용하는 태스크 필드
+CONTEXT_TASK_FIELDS = ('title', 'status', 'priority')
+# 요약 유지 시간 (초) - 지나면 다음 prefetch 때 백그라운드로 갱신
+CONTEXT_TTL_SECONDS = 60
+
+
+class AIContextBuilder:
+    """세션별 AI 컨텍스트 요약 (백그라운드 갱신)"""
+
+    def __init__(self, token: Optional[str], ttl: int = CONTEXT_TTL_SECONDS):
+        self.token = token
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._worker: Optional[threading.Thread] = None
+        self._tasks_summary: Optional[Dict[str, Any]] = None
+        self._tasks_fetched_at = 0.0
+        self._schedule_count: Optional[int] = None
+        self._schedule_date: Optional[str] = None
+        self._schedule_fetched_at = 0.0
+
+    def _tasks_stale(self, now: float) -> bool:
+        return self._tasks_summary is None or now - self._tasks_fetched_at > self.ttl
+
+    def _schedule_stale(self, now: float) -> bool:
+        return (self._schedule_count is None
+                or self._schedule_date != date.today().isoformat()
+                or now - self._schedule_fetched_at > self.ttl)
+
+    def prefetch(self):
+        """오래된 부분이 있으면 백그라운드 스레드로 갱신 시작 (즉시 반환)"""
+        now = time.time()
+        with self._lock:
+            if self._worker and self._worker.is_alive():
+                return
+            if not (self._tasks_stale(now) or self._schedule_stale(now)):
+                return
+            self._worker = threading.Thread(target=self.refresh, daemon=True)
+            self._worker.start()
+
+    def refresh(self):
+        """오래된 부분만 백엔드에서 다시 가져옴 (블로킹)"""
+        api_client = PlandyAPIClient(raise_errors=True)
+        api_client.set_token(self.token)
+        now = time.time()
+
+        if self._tasks_stale(now):
+            try:
+                tasks = api_client.get_tasks()
+            except PlandyAPIError:
+                tasks = None
+            if tasks is not None:
+                summary = {
+                    'total_tasks': len(tasks),
+                    'tasks': [
+                        {field: t.get(field, '') for field in CONTEXT_TASK_FIELDS}
+                        for t in tasks[:CONTEXT_TASK_LIMIT]
+                    ],
+                }
+                with self._lock:
+                    self._tasks_summary = summary
+                    self._tasks_fetched_at = time.time()
+
+        if self._schedule_stale(now):
+            today = date.today().isoformat()
+            try:
+                today_schedule = api_client.get_schedule_by_date(today)
+            except PlandyAPIError:
+                today_schedule = None
+            if today_schedule is not None:
+                with self._lock:
+                    self._schedule_count = len(today_schedule)
+                    self._schedule_date = today
+                    self._schedule_fetched_at = time.time()
+
+    def invalidate(self, tasks: bool = True, schedule: bool = True):
+        """데이터 변경 후 다음 prefetch에서 다시 가져오도록 표시"""
+        with self._lock:
+            if tasks:
+                self._tasks_fetched_at = 0.0
+            if schedule:
+                self._schedule_fetched_at = 0.0
+
+    def snapshot(self, team_id: Optional[int] = None) -> Dict[str, Any]:
+        """현재 준비된 요약 반환 (네트워크 호출 없음)"""
+        with self._lock:
+            context: Dict[str, Any] = {}
+            if self._tasks_summary is not None:
+                context.update(self._tasks_summary)
+            if self._schedule_count is not None and self._schedule_date == date.today().isoformat():
+                context['today_schedule_count'] = self._schedule_count
+        context['team_id'] = team_id
+        return context
+
+
+def get_ai_context_builder() -> AIContextBuilder:
+    """현재 세션의 AI 컨텍스트 빌더 반환 (토큰이 바뀌면 새로 생성)"""
+    token = st.session_state.get('user_token')
+    builder = st.session_state.get('ai_context_builder')
+    if builder is None or builder.token != token:
+        builder = AIContextBuilder(token)
+        st.session_state.ai_context_builder = builder
+    return builder
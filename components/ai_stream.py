@@ -0,0 +1,136 @@
+"""
+AI 스트림 워커
+SSE 응답 소비를 별도 스레드에서 실행하고, 큐를 통해 스크립트 스레드의 placeholder로 전달
+"""
+
+import queue
+import threading
+import time
+from typing import Optional, Dict
+
+import requests
+from components.api_client import PlandyAPIClient
+
+# 서버 연결 대기 시간 (초)
+AI_STREAM_CONNECT_TIMEOUT = 10
+# 데이터 없이 기다리는 최대 시간 (초)
+AI_STREAM_IDLE_TIMEOUT = 60
+# 스트림 전체 최대 시간 (초)
+AI_STREAM_TOTAL_TIMEOUT = 180
+# 스크립트 스레드의 큐 확인 간격 (초)
+AI_STREAM_POLL_INTERVAL = 0.1
+
+
+class AIStreamWorker:
+    """AI 채팅 스트림을 백그라운드에서 소비하는 워커"""
+
+    def __init__(self, token: Optional[str], message: str, context: Optional[Dict] = None,
+                 session_id: Optional[str] = None, user_id=None, team_id=None,
+                 idle_timeout: float = AI_STREAM_IDLE_TIMEOUT,
+                 total_timeout: float = AI_STREAM_TOTAL_TIMEOUT):
+        self.token = token
+        self.message = message
+        self.context = context
+        self.request_session_id = session_id
+        self.user_id = user_id
+        self.team_id = team_id
+        self.idle_timeout = idle_timeout
+        self.total_timeout = total_timeout
+
+        self.queue: "queue.Queue" = queue.Queue()
+        self._cancel_event = threading.Event()
+        self._response_lock = threading.Lock()
+        self._response: Optional[requests.Response] = None
+        self._thread: Optional[threading.Thread] = None
+        self.started_at = 0.0
+
+        # 스크립트 스레드가 drain()으로 채우는 상태
+        self.content = ""
+        self.session_id: Optional[str] = None
+        self.error: Optional[str] = None
+        self.done = False
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancel_event.is_set()
+
+    def start(self):
+        """워커 스레드 시작"""
+        self.started_at = time.monotonic()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        api_client = PlandyAPIClient(raise_errors=True)
+        api_client.set_token(self.token)
+        try:
+            response = api_client.open_ai_chat_stream(
+                self.message, context=self.context, session_id=self.request_session_id,
+                user_id=self.user_id, team_id=self.team_id,
+                timeout=(AI_STREAM_CONNECT_TIMEOUT, self.idle_timeout),
+            )
+            with self._response_lock:
+                self._response = response
+            if self.cancelled:
+                return
+
+            if response.status_code != 200:
+                self.queue.put(('error', f"스트림 요청 실패: {response.status_code}"))
+                return
+
+            for event in api_client.iter_ai_stream_events(response):
+                if self.cancelled:
+                    break
+                self.queue.put(('event', event))
+                if self.elapsed() > self.total_timeout:
+                    self.queue.put(('error', "응답 시간이 초과되었습니다."))
+                    break
+        except requests.exceptions.Timeout:
+            self.queue.put(('error', "응답 대기 시간이 초과되었습니다."))
+        except requests.exceptions.ConnectionError:
+            if not self.cancelled:
+                self.queue.put(('error', "서버에 연결할 수 없습니다. 백엔드 서버가 실행 중인지 확인해주세요."))
+        except Exception as e:
+            # cancel()에서 응답을 닫으면 읽기 중 예외가 날 수 있음
+            if not self.cancelled:
+                self.queue.put(('error', f"요청 중 오류가 발생했습니다: {str(e)}"))
+        finally:
+            self._close_response()
+            self.queue.put(('done', None))
+
+    def _close_response(self):
+        with self._response_lock:
+            response = self._response
+            self._response = None
+        if response is not None:
+            response.close()
+
+    def elapsed(self) -> float:
+        return time.monotonic() - self.started_at if self.started_at else 0.0
+
+    def expired(self) -> bool:
+        """전체 스트림 제한 시간 초과 여부"""
+        return self.elapsed() > self.total_timeout
+
+    def cancel(self):
+        """생성 중지 - HTTP 응답을 닫아 서버 스레드를 해제"""
+        self._cancel_event.set()
+        self._close_response()
+
+    def drain(self) -> bool:
+        """큐에 쌓인 이벤트를 상태에 반영 (스크립트 스레드에서 호출), 종료 시 True"""
+        while True:
+            try:
+                kind, payload = self.queue.get_nowait()
+            except queue.Empty:
+                break
+            if kind == 'event':
+                if 'ai_response' in payload:
+                    self.content = payload['ai_response']
+                if payload.get('session_id'):
+                    self.session_id = payload['session_id']
+            elif kind == 'error':
+                self.error = payload
+            elif kind == 'done':
+                self.done = True
+        return self.done
@@ -1,15 +1,55 @@
 import requests
 import streamlit as st
-from typing import Optional, Dict, Any, List
-import json
+from typing import Optional, Dict, Any, List, Tuple, Union, TypedDict
+import time
 from datetime import datetime, date
+from urllib.parse import quote
+from config.constants import API_BASE_URL
+from utils.instrumentation import span
+from utils.metrics import metrics, current_page
+from utils import json_codec
+from utils.compression import ACCEPT_ENCODING, read_body
+
+
+class PlandyAPIError(Exception):
+    """API 요청 실패 (raise_errors 모드에서 발생)"""
+
+    def __init__(self, message: str, status_code: Optional[int] = None):
+        super().__init__(message)
+        self.status_code = status_code
+
+
+class TaskRecord(TypedDict, total=False):
+    """태스크 응답 항목 (검증하는 필드만 정의 - 이 타입으로 디코딩하면 나머지 필드는 버려짐)"""
+    id: int
+    title: Optional[str]
+    status: Optional[str]
+    priority: Optional[str]
+    sprint_id: Optional[int]
+    assignee_id: Optional[int]
+    story_points: Optional[Union[int, float]]
+    labels: Union[List[str], str, None]
+
+
+class TaskListResponse(TypedDict, total=False):
+    """GET /tasks 응답"""
+    success: bool
+    data: List[TaskRecord]
+    message: str
+
 
 class PlandyAPIClient:
     """Plandy 백엔드 API 클라이언트"""
     
-    def __init__(self, base_url: str = "http://127.0.0.1:8000/api"):
+    def __init__(self, base_url: str = API_BASE_URL, raise_errors: bool = False, timeout=None):
         self.base_url = base_url
         self.token = None
+        # 로그인/회원가입 응답에 포함된 사용자 정보
+        self.user = None
+        # True면 st.error 대신 PlandyAPIError 발생 (백그라운드 스레드용)
+        self.raise_errors = raise_errors
+        # requests 형식 (connect, read) 제한 시간 - None이면 제한 없음
+        self.timeout = timeout
     
     def set_token(self, token: str):
         """인증 토큰 설정"""
@@ -19,53 +59,122 @@ class PlandyAPIClient:
         """API 요청 헤더 생성"""
         headers = {
             "Content-Type": "application/json",
-            "Accept": "application/json"
+            "Accept": "application/json",
+            "Accept-Encoding": ACCEPT_ENCODING,
         }
         if self.token:
             headers["Authorization"] = f"Bearer {self.token}"
         return headers
+
+    def _report_error(self, message: str, status_code: Optional[int] = None):
+        """오류 보고 (UI 모드: st.error 표시, 예외 모드: PlandyAPIError 발생)"""
+        if self.raise_errors:
+            raise PlandyAPIError(message, status_code)
+        st.error(message)
     
-    def _make_request(self, method: str, endpoint: str, data: Optional[Dict] = None) -> Optional[Dict]:
-        """API 요청 실행"""
+    def _make_request(self, method: str, endpoint: str, data: Optional[Dict] = None,
+                      etag: Optional[str] = None, response_type: Optional[Any] = None) -> Optional[Dict]:
+        """API 요청 실행
+
+        etag를 주면 If-None-Match 조건부 요청을 보내고, 변경이 없으면(304)
+        {"success": True, "not_modified": True}를 반환. 응답의 ETag는 "_etag" 키로 전달.
+        response_type(TypedDict)을 주면 msgspec이 있을 때 디코딩하면서 응답 구조를 검증 (타입에 없는 필드는 버려짐).
+        """
         url = f"{self.base_url}{endpoint}"
         headers = self.get_headers()
+        if etag:
+            headers["If-None-Match"] = etag
         
+        if method.upper() not in ("GET", "POST", "PUT", "DELETE"):
+            self._report_error(f"지원하지 않는 HTTP 메서드: {method}")
+            return None
+
         try:
-            if method.upper() == "GET":
-                response = requests.get(url, headers=headers)
-            elif method.upper() == "POST":
-                response = requests.post(url, json=data, headers=headers)
-            elif method.upper() == "PUT":
-                response = requests.put(url, json=data, headers=headers)
-            elif method.upper() == "DELETE":
-                response = requests.delete(url, headers=headers)
-            else:
-                st.error(f"지원하지 않는 HTTP 메서드: {method}")
-                return None
+            response, body = self._send(method.upper(), endpoint, url, headers, data)
             
             if response.status_code in [200, 201]:
-                return response.json()
+                # 백엔드 대기 시간과 JSON 디코딩 시간을 구분해 기록
+                decode_started = time.perf_counter()
+                try:
+                    with span("json.decode", codec=json_codec.JSON_BACKEND):
+                        result = json_codec.decode(body, response_type)
+                except json_codec.DecodeError as e:
+                    self._report_error(f"응답 형식 오류 ({endpoint}): {str(e)}", response.status_code)
+                    return None
+                metrics.record_decode(endpoint, time.perf_counter() - decode_started)
+                if isinstance(result, dict) and response.headers.get("ETag"):
+                    result["_etag"] = response.headers["ETag"]
+                return result
+            elif response.status_code == 304:
+                return {"success": True, "not_modified": True}
             elif response.status_code == 401:
-                st.error("인증이 필요합니다. 다시 로그인해주세요.")
+                self._report_error("인증이 필요합니다. 다시 로그인해주세요.", 401)
                 st.session_state.user_token = None
                 st.session_state.user_info = None
                 st.rerun()
             elif response.status_code == 422:
-                errors = response.json().get('errors', {})
+                errors = json_codec.loads(body).get('errors', {})
+                if self.raise_errors:
+                    raise PlandyAPIError("; ".join(f"{field}: {', '.join(messages)}" for field, messages in errors.items()), 422)
                 for field, messages in errors.items():
                     st.error(f"{field}: {', '.join(messages)}")
             else:
-                st.error(f"API 오류: {response.status_code} - {response.text}")
+                self._report_error(f"API 오류: {response.status_code} - {body.decode(response.encoding or 'utf-8', 'replace')}",
+                                   response.status_code)
             
             return None
             
+        except PlandyAPIError:
+            raise
+        except requests.exceptions.Timeout:
+            self._report_error("서버 응답 시간이 초과되었습니다.")
+            return None
         except requests.exceptions.ConnectionError:
-            st.error("서버에 연결할 수 없습니다. 백엔드 서버가 실행 중인지 확인해주세요.")
+            self._report_error("서버에 연결할 수 없습니다. 백엔드 서버가 실행 중인지 확인해주세요.")
             return None
         except Exception as e:
-            st.error(f"요청 중 오류가 발생했습니다: {str(e)}")
+            self._report_error(f"요청 중 오류가 발생했습니다: {str(e)}")
             return None
     
+    def _send(self, method: str, endpoint: str, url: str, headers: Dict[str, str],
+              data: Optional[Dict] = None) -> Tuple[requests.Response, bytes]:
+        """HTTP 요청 전송 (구간 및 엔드포인트별 메트릭 기록, 연결 오류는 그대로 발생)
+
+        본문은 스트리밍으로 받으며 압축을 풀고, 전송 크기와 압축 방식도 함께 기록.
+        (응답, 본문) 반환 - 본문은 이미 읽었으므로 response.content 대신 반환한 본문을 사용.
+        """
+        started = time.perf_counter()
+        status, size, wire_size, encoding = "error", 0, None, "identity"
+        with span("http.request", **{"http.method": method, "http.route": endpoint}) as request_span:
+            try:
+                if method == "GET":
+                    response = requests.get(url, headers=headers, stream=True, timeout=self.timeout)
+                elif method == "POST":
+                    response = requests.post(url, json=data, headers=headers, stream=True, timeout=self.timeout)
+                elif method == "PUT":
+                    response = requests.put(url, json=data, headers=headers, stream=True, timeout=self.timeout)
+                else:
+                    response = requests.delete(url, headers=headers, stream=True, timeout=self.timeout)
+                status = response.status_code
+                body, wire_size, encoding = read_body(response)
+                size = len(body)
+            finally:
+                metrics.record_request(method, endpoint, status, time.perf_counter() - started, size,
+                                       current_page(), wire_size, encoding)
+            if request_span is not None:
+                request_span.set_attribute("http.status_code", status)
+                request_span.set_attribute("http.response_content_length", wire_size)
+                request_span.set_attribute("http.response_content_encoding", encoding)
+                request_span.set_attribute("http.response_uncompressed_content_length", size)
+        return response, body
+
+    @staticmethod
+    def _saved_record(response: Optional[Dict]) -> Union[Dict, bool]:
+        """쓰기 응답 결과 - 성공하면 서버가 돌려준 레코드(응답에 없으면 True), 실패하면 False"""
+        if not response or not response.get("success"):
+            return False
+        return response.get("data") or True
+
     # 인증 관련 메서드
     def login(self, email: str, password: str) -> bool:
         """로그인"""
@@ -74,6 +183,7 @@ class PlandyAPIClient:
         
         if response and response.get("success"):
             self.token = response["data"]["token"]
+            self.user = response["data"].get("user")
             return True
         return False
     
@@ -89,6 +199,7 @@ class PlandyAPIClient:
         
         if response and response.get("success"):
             self.token = response["data"]["token"]
+            self.user = response["data"].get("user")
             return True
         return False
     
@@ -97,18 +208,25 @@ class PlandyAPIClient:
         response = self._make_request("GET", "/auth/me")
         return response["data"] if response and response.get("success") else None
     
+    def get_session_user(self) -> Optional[Dict]:
+        """로그인/회원가입 응답의 사용자 정보 (없으면 /auth/me 조회)"""
+        if self.user is None and self.token:
+            self.user = self.get_user_info()
+        return self.user
+    
     def logout(self) -> bool:
         """로그아웃"""
         response = self._make_request("POST", "/auth/logout")
         if response and response.get("success"):
             self.token = None
+            self.user = None
             return True
         return False
     
     # 태스크 관련 메서드
     def get_tasks(self, status: Optional[str] = None, priority: Optional[str] = None, 
-                  date: Optional[str] = None) -> List[Dict]:
-        """태스크 목록 조회"""
+                  date: Optional[str] = None, updated_since: Optional[str] = None) -> List[Dict]:
+        """태스크 목록 조회 (updated_since를 주면 그 시각 이후 수정된 태스크만)"""
         params = []
         if status:
             params.append(f"status={status}")
@@ -116,19 +234,23 @@ class PlandyAPIClient:
             params.append(f"priority={priority}")
         if date:
             params.append(f"date={date}")
+        if updated_since:
+            params.append(f"updated_since={quote(updated_since)}")
         
         endpoint = "/tasks"
         if params:
             endpoint += "?" + "&".join(params)
         
+        # 화면이 모든 필드를 쓰고 목록이 크므로 검증 없이 한 번만 디코딩
+        # (TaskListResponse로 검증하면 정의하지 않은 필드가 빠지고, 항목 하나가 어긋나도 목록 전체가 오류가 됨)
         response = self._make_request("GET", endpoint)
         return response["data"] if response and response.get("success") else []
     
     def create_task(self, title: str, description: str = "", priority: str = "medium",
                    deadline: Optional[str] = None, labels: List[str] = None,
                    story_points: Optional[int] = None, sprint_id: Optional[int] = None,
-                   assignee_id: Optional[int] = None, team_id: Optional[int] = None) -> bool:
-        """태스크 생성"""
+                   assignee_id: Optional[int] = None, team_id: Optional[int] = None) -> Union[Dict, bool]:
+        """태스크 생성 (성공 시 저장된 태스크, 실패 시 False)"""
         data = {
             "title": title,
             "description": description,
@@ -147,12 +269,12 @@ class PlandyAPIClient:
             data["team_id"] = team_id
 
         response = self._make_request("POST", "/tasks", data)
-        return response and response.get("success")
+        return self._saved_record(response)
     
-    def update_task(self, task_id: int, **kwargs) -> bool:
-        """태스크 수정"""
+    def update_task(self, task_id: int, **kwargs) -> Union[Dict, bool]:
+        """태스크 수정 (성공 시 저장된 태스크, 실패 시 False)"""
         response = self._make_request("PUT", f"/tasks/{task_id}", kwargs)
-        return response and response.get("success")
+        return self._saved_record(response)
     
     def delete_task(self, task_id: int) -> bool:
         """태스크 삭제"""
@@ -160,13 +282,16 @@ class PlandyAPIClient:
         return response and response.get("success")
     
     # 스케줄 관련 메서드
-    def get_schedule(self, start_date: Optional[str] = None, end_date: Optional[str] = None) -> List[Dict]:
-        """스케줄 목록 조회"""
+    def get_schedule(self, start_date: Optional[str] = None, end_date: Optional[str] = None,
+                     updated_since: Optional[str] = None) -> List[Dict]:
+        """스케줄 목록 조회 (updated_since를 주면 그 시각 이후 수정된 일정만)"""
         params = []
         if start_date:
             params.append(f"start_date={start_date}")
         if end_date:
             params.append(f"end_date={end_date}")
+        if updated_since:
+            params.append(f"updated_since={quote(updated_since)}")
         
         endpoint = "/schedule"
         if params:
@@ -183,8 +308,8 @@ class PlandyAPIClient:
     def create_schedule(self, title: str = "", start_time: str = "", end_time: str = "",
                        description: str = "", task_id: Optional[int] = None,
                        starts_at: Optional[str] = None, ends_at: Optional[str] = None,
-                       state: str = "scheduled", source: str = "user") -> bool:
-        """스케줄 생성"""
+                       state: str = "scheduled", source: str = "user") -> Union[Dict, bool]:
+        """스케줄 생성 (성공 시 저장된 일정, 실패 시 False)"""
         data = {
             "starts_at": starts_at or start_time,
             "ends_at": ends_at or end_time,
@@ -195,10 +320,10 @@ class PlandyAPIClient:
             data["task_id"] = task_id
 
         response = self._make_request("POST", "/schedule", data)
-        return response and response.get("success")
+        return self._saved_record(response)
     
-    def update_schedule(self, schedule_id: int, **kwargs) -> bool:
-        """스케줄 수정"""
+    def update_schedule(self, schedule_id: int, **kwargs) -> Union[Dict, bool]:
+        """스케줄 수정 (성공 시 저장된 일정, 실패 시 False)"""
         # 필드명 매핑 (프론트: start_time/end_time → 백엔드: starts_at/ends_at)
         if 'start_time' in kwargs:
             kwargs['starts_at'] = kwargs.pop('start_time')
@@ -208,7 +333,7 @@ class PlandyAPIClient:
         kwargs.pop('title', None)
         kwargs.pop('description', None)
         response = self._make_request("PUT", f"/schedule/{schedule_id}", kwargs)
-        return response and response.get("success")
+        return self._saved_record(response)
     
     def delete_schedule(self, schedule_id: int) -> bool:
         """스케줄 삭제"""
@@ -230,73 +355,93 @@ class PlandyAPIClient:
         response = self._make_request("POST", "/ai/chat", data)
         return response if response and response.get("success") else None
     
-    def send_ai_message_stream(self, message: str, context: Optional[Dict] = None, session_id: Optional[str] = None,
-                               user_id=None, team_id=None):
-        """AI 채팅 메시지 스트림 전송"""
-        import requests
-        import json
+    def open_ai_chat_stream(self, message: str, context: Optional[Dict] = None, session_id: Optional[str] = None,
+                            user_id=None, team_id=None, timeout=None) -> requests.Response:
+        """AI 채팅 SSE 스트림 연결 (응답 객체 반환, 호출자가 close 책임)
 
+        session_state를 참조하지 않으므로 백그라운드 스레드에서도 사용 가능.
+        timeout은 requests 형식 (connect, read) - read는 데이터 사이의 최대 대기 시간.
+        """
         data = {"message": message}
         if context:
             data["context"] = context
         if session_id:
             data["session_id"] = session_id
-
-        # user_id: 파라미터 우선, 없으면 session_state에서 조회
-        if user_id is not None:
-            data["user_id"] = user_id
-        else:
-            data["user_id"] = st.session_state.get('user_info', {}).get('id')
-
+        data["user_id"] = user_id
         if team_id is not None:
             data["team_id"] = team_id
-        
+
         url = f"{self.base_url}/ai/chat"
-        headers = self.get_headers()
-        
+        started = time.perf_counter()
+        status = "error"
         try:
-            response = requests.post(url, json=data, headers=headers, stream=True)
-            
-            if response.status_code == 200:
-                current_event = ''
-                ai_response_received = False
-
-                for line in response.iter_lines(decode_unicode=True):
-                    if not line:
-                        continue
-
-                    if line.startswith('id: '):
-                        pass
-                    elif line.startswith('event: '):
-                        current_event = line[7:]
-                    elif line.startswith('retry:'):
-                        pass
-                    elif line.startswith('data: ') or line.startswith('data:'):
-                        json_data = line[6:] if line.startswith('data: ') else line[5:]
-                        if json_data == '[DONE]':
-                            break
-
-                        try:
-                            parsed_data = json.loads(json_data)
-                        except json.JSONDecodeError:
-                            continue
-
-                        # ai_response 이벤트에서만 응답 yield (complete 이벤트의 중복 방지)
-                        if current_event == 'ai_response' and 'ai_response' in parsed_data:
-                            if not ai_response_received:
-                                ai_response_received = True
-                                yield {'ai_response': parsed_data['ai_response']}
-                        elif current_event == 'complete' and not ai_response_received:
-                            # ai_response 이벤트가 없었을 때만 complete에서 가져옴
-                            if parsed_data.get('ai_response'):
-                                yield {'ai_response': parsed_data['ai_response']}
-
-                        # session_id 전달
-                        if parsed_data.get('session_id'):
-                            yield {'session_id': parsed_data['session_id']}
-            else:
-                st.error(f"스트림 요청 실패: {response.status_code}")
-                return
+            headers = self.get_headers()
+            # 압축하면 서버/프록시가 이벤트를 모아서 보낼 수 있으므로 스트림은 압축하지 않음
+            headers["Accept-Encoding"] = "identity"
+            response = requests.post(url, json=data, headers=headers, stream=True, timeout=timeout)
+            status = response.status_code
+        finally:
+            # 스트림은 본문 크기를 알 수 없으므로 응답 헤더까지의 시간만 기록
+            metrics.record_request("POST", "/ai/chat", status, time.perf_counter() - started, 0, current_page())
+        return response
+
+    @staticmethod
+    def iter_ai_stream_events(response: requests.Response):
+        """SSE 응답을 파싱하여 {'ai_response': ...} / {'session_id': ...} 이벤트 yield"""
+        current_event = ''
+        ai_response_received = False
+
+        for line in response.iter_lines(decode_unicode=True):
+            if not line:
+                continue
+
+            if line.startswith('id: '):
+                pass
+            elif line.startswith('event: '):
+                current_event = line[7:]
+            elif line.startswith('retry:'):
+                pass
+            elif line.startswith('data: ') or line.startswith('data:'):
+                json_data = line[6:] if line.startswith('data: ') else line[5:]
+                if json_data == '[DONE]':
+                    break
+
+                try:
+                    parsed_data = json_codec.loads(json_data)
+                except json_codec.DecodeError:
+                    continue
+
+                # ai_response 이벤트에서만 응답 yield (complete 이벤트의 중복 방지)
+                if current_event == 'ai_response' and 'ai_response' in parsed_data:
+                    if not ai_response_received:
+                        ai_response_received = True
+                        yield {'ai_response': parsed_data['ai_response']}
+                elif current_event == 'complete' and not ai_response_received:
+                    # ai_response 이벤트가 없었을 때만 complete에서 가져옴
+                    if parsed_data.get('ai_response'):
+                        yield {'ai_response': parsed_data['ai_response']}
+
+                # session_id 전달
+                if parsed_data.get('session_id'):
+                    yield {'session_id': parsed_data['session_id']}
+
+    def send_ai_message_stream(self, message: str, context: Optional[Dict] = None, session_id: Optional[str] = None,
+                               user_id=None, team_id=None):
+        """AI 채팅 메시지 스트림 전송"""
+        # user_id: 파라미터 우선, 없으면 session_state에서 조회
+        if user_id is None:
+            user_id = st.session_state.get('user_info', {}).get('id')
+
+        try:
+            response = self.open_ai_chat_stream(message, context=context, session_id=session_id,
+                                                user_id=user_id, team_id=team_id)
+            try:
+                if response.status_code == 200:
+                    yield from self.iter_ai_stream_events(response)
+                else:
+                    st.error(f"스트림 요청 실패: {response.status_code}")
+            finally:
+                response.close()
                 
         except requests.exceptions.ConnectionError:
             st.error("서버에 연결할 수 없습니다. 백엔드 서버가 실행 중인지 확인해주세요.")
@@ -408,11 +553,85 @@ class PlandyAPIClient:
         response = self._make_request("GET", f"/sprints/{sprint_id}/dashboard")
         return response["data"] if response and response.get("success") else None
 
+    def get_sprint_dashboard_if_changed(self, sprint_id: int, etag: Optional[str] = None) -> Optional[Dict]:
+        """스프린트 대시보드 조건부 조회
+
+        변경 없으면 {"not_modified": True}, 변경 시 {"data": ..., "etag": ...}, 실패 시 None
+        """
+        response = self._make_request("GET", f"/sprints/{sprint_id}/dashboard", etag=etag)
+        if not response or not response.get("success"):
+            return None
+        if response.get("not_modified"):
+            return {"not_modified": True}
+        return {"data": response["data"], "etag": response.get("_etag")}
+
+    # 변경 피드
+    def get_changes(self, cursor: Optional[str] = None, kinds: Optional[List[str]] = None,
+                    limit: Optional[int] = None) -> Optional[Dict]:
+        """cursor 이후 변경 조회 ({'cursor', 'changes': [{'kind', 'id', 'op': upsert/delete, 'record'}], 'has_more'})
+
+        cursor가 없으면 현재 커서만 받는다. 커서가 너무 오래되었으면 백엔드가 410을 반환.
+        """
+        params = []
+        if cursor is not None:
+            params.append(f"cursor={quote(str(cursor))}")
+        if kinds:
+            params.append(f"kinds={','.join(kinds)}")
+        if limit:
+            params.append(f"limit={limit}")
+
+        endpoint = "/changes"
+        if params:
+            endpoint += "?" + "&".join(params)
+
+        response = self._make_request("GET", endpoint)
+        return response["data"] if response and response.get("success") else None
+
+    def open_team_events(self, team_id: int, timeout=None) -> requests.Response:
+        """팀 변경 알림 SSE 스트림 연결 (응답 객체 반환, 호출자가 close 책임)
+
+        연결 이후의 변경만 {'seq', 'kind', 'id', 'op'}로 알리며 내용은 get_changes로 받는다.
+        session_state를 참조하지 않으므로 백그라운드 스레드에서도 사용 가능.
+        """
+        endpoint = f"/teams/{team_id}/events"
+        started = time.perf_counter()
+        status = "error"
+        try:
+            headers = self.get_headers()
+            headers["Accept"] = "text/event-stream"
+            # 압축하면 서버/프록시가 이벤트를 모아서 보낼 수 있으므로 스트림은 압축하지 않음
+            headers["Accept-Encoding"] = "identity"
+            response = requests.get(f"{self.base_url}{endpoint}", headers=headers, stream=True, timeout=timeout)
+            status = response.status_code
+        finally:
+            # 스트림은 본문 크기를 알 수 없으므로 응답 헤더까지의 시간만 기록
+            metrics.record_request("GET", endpoint, status, time.perf_counter() - started, 0, current_page())
+        return response
+
+    @staticmethod
+    def iter_team_events(response: requests.Response):
+        """팀 이벤트 SSE 응답을 파싱하여 change 이벤트의 data(dict) yield (하트비트 주석은 None yield)"""
+        current_event = ''
+        # 기본 청크(512 bytes)는 채워질 때까지 기다리므로 짧은 알림이 쌓여 늦게 도착함 - 받은 만큼 바로 처리
+        for line in response.iter_lines(chunk_size=1, decode_unicode=True):
+            if line.startswith(':'):
+                # 하트비트 - 호출자가 연결 상태를 확인할 수 있도록 전달
+                yield None
+            elif line.startswith('event:'):
+                current_event = line[6:].strip()
+            elif line.startswith('data:') and current_event == 'change':
+                try:
+                    yield json_codec.loads(line[5:].strip())
+                except json_codec.DecodeError:
+                    continue
+            elif not line:
+                current_event = ''
+
     # 시스템 관련 메서드
-    def health_check(self) -> bool:
+    def health_check(self, timeout: Optional[float] = None) -> bool:
         """서버 상태 확인"""
         try:
-            response = requests.get(f"{self.base_url}/health")
+            response = requests.get(f"{self.base_url}/health", timeout=timeout)
             return response.status_code == 200
         except:
             return False
@@ -1,29 +1,45 @@
 import streamlit as st
 from components.api_client import PlandyAPIClient
+from components.chat_history import reset_chat_history
+from components.team_events import close_subscriptions
+from components.replica_store import get_replica_store
+from utils.static_assets import image_src
 from typing import Optional
+from utils.instrumentation import traced
 
 def check_auth_status() -> bool:
-    """인증 상태 확인"""
+    """인증 상태 확인 (세션에 저장된 검증된 토큰 기준, 백엔드 호출 없음)
+
+    토큰이 만료되면 API 요청이 401을 받는 시점에 세션이 정리된다.
+    """
     if 'user_token' not in st.session_state or st.session_state.user_token is None:
         return False
     return True
 
+def start_session(api_client: PlandyAPIClient) -> Optional[dict]:
+    """로그인/회원가입에 성공한 클라이언트로 세션 시작
+
+    응답에 사용자 정보가 있으면 추가 요청 없이 토큰과 프로필을 함께 저장.
+    이전 사용자의 세션 캐시는 비운다.
+    """
+    user_info = api_client.get_session_user()
+    if not user_info:
+        return None
+
+    st.session_state.user_token = api_client.token
+    st.session_state.user_info = user_info
+    st.session_state.teams_cache = None
+    st.session_state.dashboard_snapshots = {}
+    return user_info
+
+@traced()
 def show_login_page():
     """서비스 소개 페이지 표시"""
-    # Plandy 로고 표시 (base64 인코딩 사용)
-    try:
-        import base64
-        import os
-        
-        logo_path = "assets/plandy-logo.png"
-        if os.path.exists(logo_path):
-            with open(logo_path, "rb") as img_file:
-                logo_base64 = base64.b64encode(img_file.read()).decode()
-            
-            st.markdown(f'<div style="text-align: center; margin-bottom: 3rem;"><img src="data:image/png;base64,{logo_base64}" width="300" style="margin: 0 auto;"></div>', unsafe_allow_html=True)
-        else:
-            st.markdown('<h1 style="text-align: center; color: var(--text-primary); margin-bottom: 3rem;">Flandy</h1>', unsafe_allow_html=True)
-    except Exception as e:
+    # Plandy 로고 표시 (정적 파일 URL 또는 캐시된 data URI)
+    logo_src = image_src("assets/plandy-logo.png")
+    if logo_src:
+        st.markdown(f'<div style="text-align: center; margin-bottom: 3rem;"><img src="{logo_src}" width="300" style="margin: 0 auto;"></div>', unsafe_allow_html=True)
+    else:
         st.markdown('<h1 style="text-align: center; color: var(--text-primary); margin-bottom: 3rem;">Flandy</h1>', unsafe_allow_html=True)
     
     # 서비스 소개
@@ -51,14 +67,29 @@ def logout():
         api_client.set_token(st.session_state.user_token)
         api_client.logout()
     
+    # 진행 중인 AI 스트림 중지
+    worker = st.session_state.pop('ai_stream_worker', None)
+    if worker:
+        worker.cancel()
+
+    # 팀 변경 알림 구독 종료 및 레플리카 메모리 캐시 해제
+    user_id = (st.session_state.get('user_info') or {}).get('id')
+    if user_id is not None:
+        close_subscriptions(user_id)
+        get_replica_store().evict(user_id)
+
     # 세션 상태 초기화
     st.session_state.user_token = None
     st.session_state.user_info = None
-    st.session_state.chat_history = []
+    reset_chat_history()
     st.session_state.session_id = None
+    st.session_state.chat_restored_for = None
     st.session_state.pending_prompt = None
     st.session_state.optimization_proposal = None
     st.session_state.run_optimization = False
+    st.session_state.ai_context_builder = None
+    st.session_state.teams_cache = None
+    st.session_state.dashboard_snapshots = {}
     st.rerun()
 
 def get_current_user() -> Optional[dict]:
@@ -0,0 +1,51 @@
+"""
+백엔드 상태 배너
+헬스 체크 결과를 프로세스 단위로 캐시하고 만료 시 백그라운드에서 갱신
+(리런마다 요청하지 않고, 화면 렌더링을 기다리게 하지 않음)
+"""
+
+import threading
+import time
+from typing import Optional
+
+import streamlit as st
+from components.api_client import PlandyAPIClient
+
+# 헬스 체크 결과 유지 시간 (초)
+BACKEND_STATUS_TTL = 30
+# 헬스 체크 요청 타임아웃 (초)
+BACKEND_PROBE_TIMEOUT = 2
+
+_status = {'ok': None, 'checked_at': 0.0, 'probing': False}
+_status_lock = threading.Lock()
+
+
+def _probe():
+    ok = PlandyAPIClient(raise_errors=True).health_check(timeout=BACKEND_PROBE_TIMEOUT)
+    with _status_lock:
+        _status.update(ok=ok, checked_at=time.time(), probing=False)
+
+
+def get_backend_status() -> Optional[bool]:
+    """마지막 헬스 체크 결과 (None: 아직 확인 중). 만료되었으면 백그라운드 갱신 시작"""
+    with _status_lock:
+        stale = time.time() - _status['checked_at'] >= BACKEND_STATUS_TTL
+        if stale and not _status['probing']:
+            _status['probing'] = True
+            threading.Thread(target=_probe, daemon=True).start()
+        return _status['ok']
+
+
+def refresh_backend_status():
+    """다음 조회 시 헬스 체크를 다시 하도록 만료 처리"""
+    with _status_lock:
+        _status['checked_at'] = 0.0
+
+
+def show_backend_banner():
+    """백엔드에 연결할 수 없을 때 본문 상단에 안내 배너 표시"""
+    if get_backend_status() is False:
+        st.warning(
+            "백엔드 서버에 연결할 수 없습니다. 백엔드 서버가 실행 중인지 확인해주세요. "
+            "(cd ../plandy-backend && php artisan serve --host=127.0.0.1 --port=8000)"
+        )
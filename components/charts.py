@@ -3,12 +3,81 @@
 다양한 차트 생성 함수들을 담당
 """
 
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from functools import wraps
+
+import numpy as np
 import plotly.graph_objects as go
 import plotly.express as px
 import pandas as pd
 import streamlit as st
-from datetime import datetime, timedelta
+from datetime import datetime
 from config.constants import THEME_DARK, THEME_LIGHT, CATEGORY_COLORS
+from utils.instrumentation import current_span, traced
+from utils.metrics import metrics
+
+MINUTES_PER_DAY = 24 * 60
+
+# figure 캐시 최대 개수 (LRU, 프로세스 공용)
+FIGURE_CACHE_SIZE = 64
+
+# 포인트 수가 이 값을 넘으면 WebGL(Scattergl)로 렌더링
+WEBGL_POINT_THRESHOLD = 500
+# 라인 차트 최대 포인트 수 (초과 시 LTTB 다운샘플링)
+MAX_LINE_POINTS = 1000
+# 워크로드 차트에 개별 표시하는 최대 멤버 수 (나머지는 "기타"로 합산)
+WORKLOAD_TOP_N = 20
+# 워크로드 차트 막대 한 줄 높이 / 최대 높이 (px)
+WORKLOAD_ROW_HEIGHT = 40
+WORKLOAD_MAX_HEIGHT = 900
+
+_figure_cache = OrderedDict()
+_figure_cache_lock = threading.Lock()
+
+
+def lttb_indices(values, threshold: int) -> np.ndarray:
+    """Largest-Triangle-Three-Buckets 다운샘플링 - 유지할 인덱스 반환
+
+    x는 균등 간격(인덱스)으로 가정. 첫/마지막 포인트는 항상 유지.
+    """
+    y = np.asarray(values, dtype=float)
+    n = len(y)
+    if threshold >= n or threshold < 3:
+        return np.arange(n)
+
+    x = np.arange(n, dtype=float)
+    # 첫/마지막 포인트를 제외한 구간을 threshold - 2개 버킷으로 분할
+    edges = np.linspace(1, n - 1, threshold - 1).astype(int)
+    selected = np.empty(threshold, dtype=int)
+    selected[0], selected[-1] = 0, n - 1
+
+    prev = 0
+    for i in range(threshold - 2):
+        start, end = edges[i], edges[i + 1]
+        # 다음 버킷 평균 (마지막 버킷은 끝 포인트)
+        if i + 2 < len(edges):
+            next_start, next_end = edges[i + 1], edges[i + 2]
+            avg_x = x[next_start:next_end].mean()
+            avg_y = y[next_start:next_end].mean()
+        else:
+            avg_x, avg_y = x[-1], y[-1]
+
+        area = np.abs(
+            (x[prev] - avg_x) * (y[start:end] - y[prev])
+            - (x[prev] - x[start:end]) * (avg_y - y[prev])
+        )
+        prev = start + int(area.argmax())
+        selected[i + 1] = prev
+
+    return selected
+
+
+def _scatter_trace(point_count: int):
+    """포인트 수에 따라 SVG/WebGL 스캐터 선택"""
+    return go.Scattergl if point_count > WEBGL_POINT_THRESHOLD else go.Scatter
 
 
 def get_chart_colors():
@@ -24,57 +93,116 @@ def get_chart_colors():
     }
 
 
+def _figure_cache_key(name, args, kwargs):
+    """빌더 이름 + 테마 + 입력 내용의 해시"""
+    payload = json.dumps(
+        [name, st.session_state.get('theme', 'dark'), args, kwargs],
+        sort_keys=True, default=str, ensure_ascii=False,
+    )
+    return hashlib.sha1(payload.encode('utf-8')).hexdigest()
+
+
+def memoize_figure(builder):
+    """입력 데이터와 테마가 같으면 캐시된 figure JSON에서 복원 (LRU)
+
+    복원 시 Plotly 속성 검증(_validate)을 건너뛰므로 update_layout 검증 비용이 들지 않는다.
+    """
+    @wraps(builder)
+    def wrapper(*args, **kwargs):
+        key = _figure_cache_key(builder.__name__, args, kwargs)
+        with _figure_cache_lock:
+            cached = _figure_cache.get(key)
+            if cached is not None:
+                _figure_cache.move_to_end(key)
+        metrics.record_cache('figure', 'hit' if cached is not None else 'miss')
+        # 계측 중이면 상위 구간(traced)에 캐시 적중 여부 기록
+        chart_span = current_span()
+        if chart_span is not None:
+            chart_span.set_attribute("cache", "hit" if cached is not None else "miss")
+        if cached is not None:
+            return go.Figure(json.loads(cached), _validate=False)
+
+        fig = builder(*args, **kwargs)
+        fig_json = fig.to_json()
+        with _figure_cache_lock:
+            _figure_cache[key] = fig_json
+            _figure_cache.move_to_end(key)
+            while len(_figure_cache) > FIGURE_CACHE_SIZE:
+                _figure_cache.popitem(last=False)
+        return fig
+
+    return wrapper
+
+
+def clear_figure_cache():
+    """figure 캐시 비우기"""
+    with _figure_cache_lock:
+        _figure_cache.clear()
+
+
+def _format_minutes(minutes):
+    """분 배열을 'HH:MM' 문자열 배열로 변환"""
+    hours = np.char.zfill((minutes // 60).astype(str), 2)
+    mins = np.char.zfill((minutes % 60).astype(str), 2)
+    return np.char.add(np.char.add(hours, ':'), mins)
+
+
+@traced()
 def create_schedule_chart(df):
-    """일정 차트 생성 - 수평 바 차트로 시간 블록 표시"""
+    """일정 차트 생성 - 분 단위 24시간 타임라인 (카테고리별 trace 1개)"""
     color_map = CATEGORY_COLORS
-
-    # 각 시간대별 카테고리와 태스크 정보 저장
-    hour_data = {}
-    for hour in range(24):
-        hour_data[hour] = {
-            'category': '기타',
-            'task': '',
-            'color': color_map['기타']
-        }
-
-    # 실제 일정 데이터를 시간대에 매핑
-    for _, row in df.iterrows():
-        start_time = datetime.strptime(row['time'], '%H:%M')
-        end_time = start_time + timedelta(minutes=row['duration'])
-
-        start_hour = start_time.hour
-        end_hour = end_time.hour
-
-        for hour in range(start_hour, min(end_hour + 1, 24)):
-            if hour in hour_data:
-                hour_data[hour] = {
-                    'category': row['category'],
-                    'task': row['task'],
-                    'color': color_map.get(row['category'], color_map['기타'])
-                }
-
-    # 수평 바 차트 생성
+    n = len(df)
+
+    # 시작/종료 시각을 분 단위 배열로 계산
+    if n:
+        parts = df['time'].astype(str).str.split(':', n=1, expand=True)
+        starts = (parts[0].astype(int) * 60 + parts[1].astype(int)).to_numpy()
+        durations = df['duration'].fillna(0).astype(int).to_numpy()
+        starts = np.clip(starts, 0, MINUTES_PER_DAY)
+        ends = np.clip(starts + np.maximum(durations, 0), 0, MINUTES_PER_DAY)
+        lengths = ends - starts
+    else:
+        starts = lengths = np.zeros(0, dtype=int)
+
+    # 분 단위 점유 배열 (-1: 빈 시간). 실제로 겹치는 분만 뒤쪽 일정이 차지
+    owner = np.full(MINUTES_PER_DAY, -1)
+    total = int(lengths.sum())
+    if total:
+        block_idx = np.repeat(np.arange(n), lengths)
+        offsets = np.arange(total) - np.repeat(np.cumsum(lengths) - lengths, lengths)
+        np.maximum.at(owner, np.repeat(starts, lengths) + offsets, block_idx)
+
+    # 같은 블록이 이어지는 구간으로 압축
+    change = np.flatnonzero(np.diff(owner)) + 1
+    seg_starts = np.concatenate(([0], change))
+    seg_ends = np.concatenate((change, [MINUTES_PER_DAY]))
+    seg_owner = owner[seg_starts]
+
+    # 인덱스 -1(빈 시간)은 마지막에 추가한 '기타'/'없음'을 가리킴
+    categories = np.append(df['category'].astype(str).to_numpy() if n else [], '기타')
+    tasks = np.append(df['task'].fillna('').astype(str).to_numpy() if n else [], '없음')
+    seg_categories = categories[seg_owner]
+    seg_tasks = tasks[seg_owner]
+    seg_tasks[seg_tasks == ''] = '없음'
+    seg_start_str = _format_minutes(seg_starts)
+    seg_end_str = _format_minutes(seg_ends)
+
+    # 수평 바 차트 생성 - 카테고리별로 구간을 묶어 trace 하나씩 추가
     fig = go.Figure()
 
-    # 카테고리별로 그룹화하여 바 추가
-    categories_seen = {}
-    for hour in range(24):
-        cat = hour_data[hour]['category']
-        color = hour_data[hour]['color']
-        task = hour_data[hour]['task'] if hour_data[hour]['task'] else '없음'
-        show_legend = cat not in categories_seen
-        categories_seen[cat] = True
-
+    for cat in pd.unique(seg_categories):
+        mask = seg_categories == cat
         fig.add_trace(go.Bar(
-            y=['일정'],
-            x=[1],
+            y=['일정'] * int(mask.sum()),
+            x=seg_ends[mask] - seg_starts[mask],
+            base=seg_starts[mask],
             orientation='h',
-            name=cat if show_legend else None,
-            showlegend=show_legend,
-            marker=dict(color=color),
-            hovertemplate=f'<b>{hour:02d}:00</b><br>'
+            name=cat,
+            marker=dict(color=color_map.get(cat, color_map['기타'])),
+            customdata=np.column_stack((seg_start_str[mask], seg_end_str[mask], seg_tasks[mask])),
+            hovertemplate='<b>%{customdata[0]}~%{customdata[1]}</b><br>'
                          f'카테고리: {cat}<br>'
-                         f'일정: {task}<extra></extra>',
+                         '일정: %{customdata[2]}<extra></extra>',
             legendgroup=cat,
         ))
 
@@ -86,7 +214,7 @@ def create_schedule_chart(df):
     colors = get_chart_colors()
 
     fig.update_layout(
-        barmode='stack',
+        barmode='overlay',
         showlegend=True,
         width=600,
         height=120,
@@ -95,6 +223,7 @@ def create_schedule_chart(df):
         plot_bgcolor=colors['plot_bgcolor'],
         font=dict(color=colors['font_color']),
         xaxis=dict(
+            range=[0, MINUTES_PER_DAY],
             showticklabels=False,
             showgrid=False,
             zeroline=False,
@@ -121,6 +250,7 @@ def create_schedule_chart(df):
     return fig
 
 
+@traced()
 def create_category_bar(df):
     """카테고리별 시간 분석 막대 차트 생성"""
     colors = get_chart_colors()
@@ -157,6 +287,8 @@ def create_category_bar(df):
     return fig_bar
 
 
+@traced()
+@memoize_figure
 def create_burndown_chart(burndown_data, sprint_name=""):
     """번다운 차트 생성 - 남은 스토리 포인트와 이상적 라인 표시"""
     if not burndown_data:
@@ -168,10 +300,18 @@ def create_burndown_chart(burndown_data, sprint_name=""):
     remaining = [item.get('remaining', 0) for item in burndown_data]
     ideal = [item.get('ideal', 0) for item in burndown_data]
 
+    # 긴 스프린트는 남은 포인트 곡선 모양을 유지하며 다운샘플링
+    if len(remaining) > MAX_LINE_POINTS:
+        keep = lttb_indices(remaining, MAX_LINE_POINTS)
+        dates = [dates[i] for i in keep]
+        remaining = [remaining[i] for i in keep]
+        ideal = [ideal[i] for i in keep]
+
+    scatter = _scatter_trace(len(remaining))
     fig = go.Figure()
 
     # 이상적 라인 (점선)
-    fig.add_trace(go.Scatter(
+    fig.add_trace(scatter(
         x=dates,
         y=ideal,
         mode='lines',
@@ -181,7 +321,7 @@ def create_burndown_chart(burndown_data, sprint_name=""):
     ))
 
     # 실제 남은 포인트 라인
-    fig.add_trace(go.Scatter(
+    fig.add_trace(scatter(
         x=dates,
         y=remaining,
         mode='lines+markers',
@@ -225,6 +365,8 @@ def create_burndown_chart(burndown_data, sprint_name=""):
     return fig
 
 
+@traced()
+@memoize_figure
 def create_task_status_chart(status_counts):
     """태스크 상태별 분포 수평 바 차트 생성"""
     from config.constants import STATUS_COLORS
@@ -286,6 +428,8 @@ def create_task_status_chart(status_counts):
     return fig
 
 
+@traced()
+@memoize_figure
 def create_member_workload_chart(member_workload):
     """멤버별 워크로드 수평 바 차트 생성"""
     if not member_workload:
@@ -296,6 +440,14 @@ def create_member_workload_chart(member_workload):
     names = [m.get('name', '알 수 없음') for m in member_workload]
     task_counts = [m.get('total', m.get('task_count', 0)) for m in member_workload]
 
+    # 멤버가 많으면 태스크 수 상위 N명만 표시하고 나머지는 합산
+    if len(names) > WORKLOAD_TOP_N:
+        counts = np.asarray(task_counts)
+        order = np.argsort(-counts, kind='stable')
+        top, rest = order[:WORKLOAD_TOP_N], order[WORKLOAD_TOP_N:]
+        names = [names[i] for i in top] + [f'기타 ({len(rest)}명)']
+        task_counts = [task_counts[i] for i in top] + [int(counts[rest].sum())]
+
     fig = go.Figure(data=[
         go.Bar(
             y=names,
@@ -323,7 +475,7 @@ def create_member_workload_chart(member_workload):
             tickfont=dict(color=colors['muted_color']),
             autorange='reversed',
         ),
-        height=max(200, len(names) * 40 + 100),
+        height=min(WORKLOAD_MAX_HEIGHT, max(200, len(names) * WORKLOAD_ROW_HEIGHT + 100)),
         margin=dict(l=100, r=20, t=40, b=40),
         paper_bgcolor=colors['paper_bgcolor'],
         plot_bgcolor=colors['plot_bgcolor'],
@@ -334,8 +486,10 @@ def create_member_workload_chart(member_workload):
     return fig
 
 
-def create_velocity_chart(sprints_data):
-    """스프린트별 벨로시티 바 차트 생성 - 완료된 스토리 포인트"""
+@traced()
+@memoize_figure
+def create_velocity_chart(sprints_data, rolling_average=None):
+    """스프린트별 벨로시티 바 차트 생성 - 완료된 스토리 포인트 (+ 이동 평균 선)"""
     if not sprints_data:
         return go.Figure()
 
@@ -356,6 +510,16 @@ def create_velocity_chart(sprints_data):
         )
     ])
 
+    if rolling_average is not None:
+        fig.add_trace(go.Scatter(
+            x=names,
+            y=rolling_average,
+            mode='lines+markers',
+            line=dict(color=colors['muted_color'], width=2, dash='dash'),
+            connectgaps=False,
+            hovertemplate='%{x}: 이동 평균 %{y:.1f}pt<extra></extra>',
+        ))
+
     fig.update_layout(
         title=dict(
             text='스프린트 벨로시티',
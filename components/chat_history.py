@@ -0,0 +1,186 @@
+"""
+채팅 히스토리 저장소
+세션 메모리에 보관하는 메시지 수를 제한하고, 최근 메시지만 창(window) 단위로 렌더링
+메시지는 사용자별 채팅 기록 저장소(components.transcript_store)에도 기록되어 새로고침 후 복원됨
+"""
+
+import sqlite3
+import uuid
+from datetime import datetime
+from typing import List, Dict, Optional
+
+import streamlit as st
+from components.transcript_store import get_transcript_store
+
+# 세션 메모리에 보관하는 최대 메시지 수 (초과분은 압축)
+CHAT_HISTORY_MAX = 100
+# 한 번에 렌더링하는 최근 메시지 수
+CHAT_WINDOW_SIZE = 20
+# "이전 메시지 더 보기" 한 번에 늘어나는 메시지 수
+CHAT_PAGE_SIZE = 20
+
+
+def init_chat_history():
+    """채팅 히스토리 세션 상태 초기화"""
+    if 'chat_history' not in st.session_state or st.session_state.chat_history is None:
+        st.session_state.chat_history = []
+    if 'chat_archived_count' not in st.session_state:
+        st.session_state.chat_archived_count = 0
+    if 'chat_window' not in st.session_state:
+        st.session_state.chat_window = CHAT_WINDOW_SIZE
+
+
+def _current_user_id() -> Optional[int]:
+    return (st.session_state.get('user_info') or {}).get('id')
+
+
+def restore_chat_history():
+    """로그인한 사용자의 최근 대화를 채팅 기록에서 복원 (백엔드 호출 없음)
+
+    세션(브라우저 새로고침 포함)마다 사용자별로 한 번만 수행. 복원할 대화가 없어도 session_id는 항상 정해진다.
+    """
+    user_id = _current_user_id()
+    if 'chat_restored_for' in st.session_state and st.session_state.chat_restored_for == user_id:
+        if not st.session_state.get('session_id'):
+            st.session_state.session_id = str(uuid.uuid4())
+        return
+    st.session_state.chat_restored_for = user_id
+
+    reset_chat_history()
+    session_id = None
+    if user_id is not None:
+        try:
+            store = get_transcript_store(user_id)
+            session_id = store.latest_session_id()
+            if session_id:
+                st.session_state.chat_history = store.load(session_id, CHAT_HISTORY_MAX)
+                st.session_state.chat_archived_count = (
+                    store.count(session_id) - len(st.session_state.chat_history)
+                )
+        except (sqlite3.Error, OSError):
+            session_id = None
+    st.session_state.session_id = session_id or str(uuid.uuid4())
+
+
+def set_chat_session_id(session_id: str):
+    """백엔드가 발급한 session_id로 교체 (채팅 기록도 함께 이동)"""
+    old_session_id = st.session_state.get('session_id')
+    if session_id == old_session_id:
+        return
+    user_id = _current_user_id()
+    if user_id is not None:
+        try:
+            get_transcript_store(user_id).rename_session(old_session_id, session_id)
+        except (sqlite3.Error, OSError):
+            pass
+    st.session_state.session_id = session_id
+
+
+def append_chat_message(role: str, content: str):
+    """메시지 추가 후 최대 개수를 넘으면 오래된 메시지를 압축"""
+    init_chat_history()
+    message = {
+        'role': role,
+        'content': content,
+        'timestamp': datetime.now().isoformat()
+    }
+    st.session_state.chat_history.append(message)
+    _compact()
+
+    session_id = st.session_state.get('session_id')
+    user_id = _current_user_id()
+    if session_id and user_id is not None:
+        try:
+            get_transcript_store(user_id).append(session_id, role, content, message['timestamp'])
+        except (sqlite3.Error, OSError):
+            # 기록 실패는 채팅 자체에 영향을 주지 않음
+            pass
+
+
+def _compact():
+    """오래된 메시지를 세션 메모리에서 제거하고 개수만 남김
+
+    백엔드는 session_id 기준으로 대화 전체를 보관하므로 모델 컨텍스트는 유지되고,
+    화면에 다시 필요하면 채팅 기록에서 읽어온다.
+    """
+    history = st.session_state.chat_history
+    overflow = len(history) - CHAT_HISTORY_MAX
+    if overflow > 0:
+        del history[:overflow]
+        st.session_state.chat_archived_count += overflow
+
+
+def get_visible_messages() -> List[Dict]:
+    """현재 창 크기만큼의 최근 메시지 반환
+
+    창이 세션 메모리보다 크면 압축된 부분은 채팅 기록에서 읽고 세션에는 보관하지 않는다.
+    """
+    init_chat_history()
+    history = st.session_state.chat_history
+    window = st.session_state.chat_window
+    extra = min(window - len(history), st.session_state.chat_archived_count)
+    if extra <= 0:
+        return history[-window:]
+
+    user_id = _current_user_id()
+    if user_id is None:
+        return history[-window:]
+    try:
+        archived = get_transcript_store(user_id).load(
+            st.session_state.get('session_id'), extra, skip_latest=len(history)
+        )
+    except (sqlite3.Error, OSError):
+        archived = []
+    return archived + history
+
+
+def has_earlier_messages() -> bool:
+    """창 밖에 아직 렌더링하지 않은 메시지가 있는지 여부"""
+    init_chat_history()
+    total = len(st.session_state.chat_history) + st.session_state.chat_archived_count
+    return total > st.session_state.chat_window
+
+
+def load_earlier_messages():
+    """창 크기를 한 페이지만큼 늘림"""
+    init_chat_history()
+    st.session_state.chat_window += CHAT_PAGE_SIZE
+
+
+def reset_chat_history():
+    """채팅 히스토리 초기화"""
+    st.session_state.chat_history = []
+    st.session_state.chat_archived_count = 0
+    st.session_state.chat_window = CHAT_WINDOW_SIZE
+
+
+def start_new_chat_session():
+    """대화 초기화 - 새 session_id로 시작하고 채팅 기록에도 현재 대화로 저장 (새로고침 시 이전 대화 복원 방지)"""
+    reset_chat_history()
+    session_id = str(uuid.uuid4())
+    st.session_state.session_id = session_id
+    user_id = _current_user_id()
+    if user_id is not None:
+        try:
+            get_transcript_store(user_id).set_current_session(session_id)
+        except (sqlite3.Error, OSError):
+            pass
+
+
+def render_chat_history():
+    """최근 메시지 창 렌더링 (이전 메시지 더 보기 포함)"""
+    init_chat_history()
+
+    messages = get_visible_messages()
+    if has_earlier_messages():
+        hidden = len(st.session_state.chat_history) + st.session_state.chat_archived_count - st.session_state.chat_window
+        if st.button(f"이전 메시지 더 보기 ({hidden}개)", key="load_earlier_chat", use_container_width=True):
+            load_earlier_messages()
+            st.rerun()
+    elif len(messages) < len(st.session_state.chat_history) + st.session_state.chat_archived_count:
+        # 채팅 기록이 정리(rotate)되어 읽을 수 없는 메시지
+        st.caption("더 이전 대화는 서버 세션에 보관되어 있습니다.")
+
+    for message in messages:
+        with st.chat_message(message['role']):
+            st.markdown(message['content'])
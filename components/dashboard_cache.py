@@ -0,0 +1,71 @@
+"""
+스프린트 대시보드 스냅샷 캐시
+대시보드 응답을 세션에 짧게 보관하고, 만료 후에는 ETag 조건부 요청으로 변경분만 다시 받음
+"""
+
+import time
+from typing import Optional, Dict
+
+import streamlit as st
+from components.api_client import PlandyAPIClient
+from utils.metrics import metrics
+
+# 스냅샷을 그대로 사용하는 시간 (초) - 이 동안은 백엔드 호출 없음
+DASHBOARD_SNAPSHOT_TTL = 15
+# 팀 변경 알림이 연결되어 있을 때의 유지 시간 (초) - 변경은 알림으로 만료 처리되므로 길게
+DASHBOARD_LIVE_SNAPSHOT_TTL = 300
+# 세션에 보관하는 최대 스프린트 스냅샷 수
+DASHBOARD_SNAPSHOT_MAX = 10
+
+
+def _snapshots() -> Dict[int, Dict]:
+    if 'dashboard_snapshots' not in st.session_state:
+        st.session_state.dashboard_snapshots = {}
+    return st.session_state.dashboard_snapshots
+
+
+def get_dashboard_snapshot(api_client: PlandyAPIClient, sprint_id: int,
+                           ttl: float = DASHBOARD_SNAPSHOT_TTL) -> Optional[Dict]:
+    """스프린트 대시보드 데이터 반환 (스냅샷 우선, ttl초가 지나면 조건부 갱신)"""
+    snapshots = _snapshots()
+    snapshot = snapshots.get(sprint_id)
+    now = time.time()
+
+    if snapshot and now - snapshot['fetched_at'] < ttl:
+        metrics.record_cache('dashboard_snapshot', 'hit')
+        return snapshot['data']
+
+    result = api_client.get_sprint_dashboard_if_changed(sprint_id, etag=snapshot['etag'] if snapshot else None)
+    if result is None:
+        # 갱신 실패 시 이전 스냅샷이라도 표시
+        return snapshot['data'] if snapshot else None
+
+    if result.get('not_modified'):
+        if not snapshot:
+            return None
+        metrics.record_cache('dashboard_snapshot', 'revalidated')
+        snapshot['fetched_at'] = now
+        return snapshot['data']
+
+    metrics.record_cache('dashboard_snapshot', 'miss')
+    snapshots.pop(sprint_id, None)
+    snapshots[sprint_id] = {
+        'data': result.get('data'),
+        'etag': result.get('etag'),
+        'fetched_at': now,
+    }
+    while len(snapshots) > DASHBOARD_SNAPSHOT_MAX:
+        snapshots.pop(next(iter(snapshots)))
+    return snapshots[sprint_id]['data']
+
+
+def invalidate_dashboard_snapshot(sprint_id: Optional[int] = None):
+    """스냅샷 만료 처리 (sprint_id가 없으면 전체)
+
+    ETag는 남겨 두므로 다음 조회도 변경이 없으면 본문 없이 끝난다.
+    """
+    snapshots = _snapshots()
+    targets = [sprint_id] if sprint_id is not None else list(snapshots)
+    for target in targets:
+        if target in snapshots:
+            snapshots[target]['fetched_at'] = 0.0
@@ -0,0 +1,510 @@
+"""
+오프라인 우선 동기화
+태스크/일정/스프린트 목록은 로컬 레플리카(components.replica_store)에서 바로 읽고
+(첫 동기화는 백그라운드에서 하며 끝날 때까지는 기존처럼 API를 직접 조회),
+레플리카는 백그라운드에서 변경 피드(GET /changes, 커서 이후 upsert/삭제)로 변경분만 받아 갱신
+변경 피드가 없는 백엔드에서는 updated_at 워터마크(updated_since)로 대신하고 주기적으로 전체 목록을 받음
+팀 변경 알림(components.team_events)이 연결되어 있으면 알림을 받을 때 바로 받고 주기 동기화는 드물게
+백엔드에 연결할 수 없을 때의 변경은 outbox에 쌓았다가 연결되면 재전송 (서버 쪽 수정과 겹치면 충돌로 표시)
+"""
+
+import threading
+import time
+from datetime import datetime
+from typing import Optional, List, Dict, Union
+
+import streamlit as st
+from components.api_client import PlandyAPIClient, PlandyAPIError
+from components.replica_store import get_replica_store
+from utils.metrics import metrics
+
+# 레플리카를 그대로 쓰는 시간 (초) - 지나면 다음 조회 때 백그라운드에서 변경분 동기화
+REPLICA_SYNC_INTERVAL = 15
+# 팀 변경 알림이 연결되어 있을 때의 동기화 간격 (초) - 알림 범위 밖(다른 팀) 변경을 위한 안전망
+REPLICA_LIVE_SYNC_INTERVAL = 120
+# (변경 피드가 없을 때) 전체 목록을 다시 받아 서버에서 삭제된 항목을 정리하는 간격 (초)
+REPLICA_FULL_SYNC_INTERVAL = 300
+# 동기화/쓰기 요청 제한 시간 (연결, 읽기 초) - 응답 없는 백엔드 때문에 동기화가 멈춘 채로 남지 않도록
+REPLICA_REQUEST_TIMEOUT = (5, 15)
+# 레플리카로 관리하는 데이터 종류
+REPLICA_KINDS = ("tasks", "schedule", "sprints")
+# 변경 피드 한 번에 받는 최대 변경 수
+CHANGE_FEED_PAGE_SIZE = 500
+# 종류별 (생성, 수정, 삭제) API 클라이언트 메서드 이름
+_WRITE_METHODS = {
+    "tasks": ("create_task", "update_task", "delete_task"),
+    "schedule": ("create_schedule", "update_schedule", "delete_schedule"),
+}
+
+# 사용자별 동기화 상태 (프로세스 단위 - 백그라운드 스레드에서 갱신)
+_status: Dict[int, Dict] = {}
+_status_lock = threading.Lock()
+# 백엔드가 변경 피드를 지원하는지 (None: 아직 모름, 404를 받으면 False)
+_feed_supported: Optional[bool] = None
+
+
+def _is_unreachable(error: PlandyAPIError) -> bool:
+    """연결 실패/서버 오류처럼 나중에 다시 시도하면 되는 오류인지"""
+    return error.status_code is None or error.status_code >= 500
+
+
+def _end_session():
+    """토큰이 만료(401)되었으면 UI 요청과 같이 세션을 비우고 다시 실행 (로그인 화면으로)"""
+    st.session_state.user_token = None
+    st.session_state.user_info = None
+    st.rerun()
+
+
+def _record_error(client: PlandyAPIClient, user_id: int, error: PlandyAPIError):
+    """백그라운드 요청 실패 기록 (401이면 거부된 토큰을 남겨 그 토큰을 쓰는 세션이 다음 조회 때 로그아웃)"""
+    _set_status(user_id, online=not _is_unreachable(error), error=str(error))
+    if error.status_code == 401:
+        _set_status(user_id, expired_token=client.token)
+
+
+def _sync_client(api_client: PlandyAPIClient) -> PlandyAPIClient:
+    """같은 주소/토큰으로 예외 모드 클라이언트 생성 (오류를 st.error 대신 예외로 받음, 제한 시간 있음)"""
+    client = PlandyAPIClient(api_client.base_url, raise_errors=True, timeout=REPLICA_REQUEST_TIMEOUT)
+    client.set_token(api_client.token)
+    return client
+
+
+def _current_user_id() -> Optional[int]:
+    user = st.session_state.get('user_info') or {}
+    return user.get('id')
+
+
+def get_sync_status(user_id: int) -> Dict:
+    """마지막 동기화 결과 (online: True/False/None(아직 모름), error, syncing, live: 변경 알림 연결 여부,
+    expired_token: 401을 받은 토큰)"""
+    with _status_lock:
+        return dict(_status.get(user_id) or {'online': None, 'error': None, 'syncing': False})
+
+
+def _set_status(user_id: int, **fields):
+    with _status_lock:
+        _status.setdefault(user_id, {'online': None, 'error': None, 'syncing': False}).update(fields)
+
+
+# 받기
+def _fetch(client: PlandyAPIClient, kind: str, updated_since: Optional[str] = None) -> List[Dict]:
+    if kind == "tasks":
+        return client.get_tasks(updated_since=updated_since)
+    if kind == "schedule":
+        return client.get_schedule(updated_since=updated_since)
+    # 스프린트는 팀별 목록뿐이라 항상 전체
+    return [sprint for team in client.get_teams() for sprint in client.get_sprints(team['id'])]
+
+
+def _pull(client: PlandyAPIClient, user_id: int, kind: str, full: bool = False):
+    """워터마크 이후 변경분 반영 (처음이거나 전체 동기화 주기가 지났으면 전체 목록으로 교체)"""
+    store = get_replica_store()
+    state = store.sync_state(user_id, kind)
+    full = (full or kind == "sprints" or state is None
+            or time.time() - state['full_synced_at'] >= REPLICA_FULL_SYNC_INTERVAL)
+    records = _fetch(client, kind, None if full else state['watermark'])
+    store.apply(user_id, kind, records, replace=full)
+    metrics.record_cache(f"replica_{kind}", "full_sync" if full else "delta_sync")
+
+
+def _pull_feed(client: PlandyAPIClient, user_id: int):
+    """변경 피드로 커서 이후 변경분 반영 (받은 변경 수에 비례하는 비용)
+
+    커서가 없거나 만료(410)되었으면 현재 커서를 먼저 받고 전체 목록을 받은 뒤 그 커서부터 이어 받는다.
+    (전체 목록을 받는 사이의 변경은 피드로 다시 오고, 반영은 멱등)
+    """
+    store = get_replica_store()
+    cursor = store.feed_cursor(user_id)
+    if cursor is None:
+        start = client.get_changes()
+        if start is None:
+            return
+        cursor = start['cursor']
+        missing = REPLICA_KINDS
+    else:
+        missing = [kind for kind in REPLICA_KINDS if store.sync_state(user_id, kind) is None]
+    for kind in missing:
+        _pull(client, user_id, kind, full=True)
+
+    while True:
+        try:
+            page = client.get_changes(cursor, list(REPLICA_KINDS), CHANGE_FEED_PAGE_SIZE)
+        except PlandyAPIError as e:
+            if e.status_code != 410:
+                raise
+            metrics.record_cache("change_feed", "expired")
+            store.forget(user_id)
+            return _pull_feed(client, user_id)
+        if page is None:
+            return
+        store.apply_changes(user_id, page['changes'], page['cursor'])
+        metrics.record_cache("change_feed", "delta_sync")
+        cursor = page['cursor']
+        if not page.get('has_more'):
+            return
+
+
+def _pull_all(client: PlandyAPIClient, user_id: int):
+    """모든 종류 받기 (변경 피드 우선, 백엔드에 없으면 updated_since)"""
+    global _feed_supported
+    if _feed_supported is not False:
+        try:
+            _pull_feed(client, user_id)
+            _feed_supported = True
+            return
+        except PlandyAPIError as e:
+            if e.status_code != 404:
+                raise
+            _feed_supported = False
+    for kind in REPLICA_KINDS:
+        _pull(client, user_id, kind)
+
+
+# 보내기
+def _send(client: PlandyAPIClient, kind: str, op: str, record_id: Optional[int],
+          payload: Dict) -> Union[Dict, bool]:
+    """변경 전송 (성공하면 서버가 돌려준 레코드 또는 True, 실패하면 False)"""
+    create, update, delete = (getattr(client, name) for name in _WRITE_METHODS[kind])
+    if op == "create":
+        return create(**payload)
+    if op == "update":
+        return update(record_id, **payload)
+    return bool(delete(record_id))
+
+
+def _replay(client: PlandyAPIClient, user_id: int) -> int:
+    """outbox의 대기 항목을 순서대로 전송. 전송한 수 반환 (연결 실패 시 예외로 중단)
+
+    대기 중 서버 쪽 레코드가 바뀌었거나(updated_at이 기준과 다름) 삭제되었으면
+    덮어쓰지 않고 충돌로 표시해 사용자가 고르게 한다.
+    """
+    store = get_replica_store()
+    sent = 0
+    for item in store.outbox(user_id, status='pending'):
+        kind, op, record_id = item['kind'], item['op'], item['record_id']
+        if op != "create" and item['base_updated_at'] is not None:
+            current = store.get(user_id, kind, record_id)
+            if current is None:
+                if op == "delete":
+                    store.remove(item['id'])
+                else:
+                    store.mark_conflict(item['id'], "서버에서 삭제된 항목입니다.")
+                continue
+            if current.get('updated_at') != item['base_updated_at']:
+                store.mark_conflict(item['id'], "오프라인 동안 서버에서 먼저 수정되었습니다.")
+                continue
+
+        try:
+            ok = _send(client, kind, op, record_id, item['payload'])
+        except PlandyAPIError as e:
+            if _is_unreachable(e) or e.status_code == 401:
+                raise
+            if op == "delete" and e.status_code == 404:
+                store.remove(item['id'])
+                store.apply(user_id, kind, deletes=[record_id])
+                continue
+            store.mark_conflict(item['id'], str(e))
+            continue
+        if not ok:
+            store.mark_conflict(item['id'], "서버가 변경을 거부했습니다.")
+            continue
+        store.remove(item['id'])
+        if op == "delete":
+            store.apply(user_id, kind, deletes=[record_id])
+        sent += 1
+    return sent
+
+
+def sync_user(client: PlandyAPIClient, user_id: int):
+    """받기 → outbox 재전송 → (보낸 것이 있으면) 다시 받기. 결과는 get_sync_status로 확인"""
+    try:
+        _pull_all(client, user_id)
+        if _replay(client, user_id):
+            _pull_all(client, user_id)
+    except PlandyAPIError as e:
+        _record_error(client, user_id, e)
+        return
+    finally:
+        # 예상하지 못한 예외로 끝나도 이후 백그라운드 동기화가 막히지 않도록
+        _set_status(user_id, syncing=False)
+    _set_status(user_id, online=True, error=None)
+
+
+def _start_background_sync(client: PlandyAPIClient, user_id: int):
+    """사용자별로 하나의 동기화 스레드만 실행"""
+    with _status_lock:
+        status = _status.setdefault(user_id, {'online': None, 'error': None, 'syncing': False})
+        if status['syncing']:
+            return
+        status['syncing'] = True
+    threading.Thread(target=sync_user, args=(client, user_id), daemon=True).start()
+
+
+def _ensure_synced(api_client: PlandyAPIClient, user_id: int, kind: str) -> bool:
+    """레플리카를 쓸 수 있는지 반환하고, 없거나 오래되었으면 백그라운드 동기화 시작 (화면은 기다리지 않음)
+
+    첫 동기화(전체 목록 + 팀별 스프린트)는 오래 걸리므로 화면을 막지 않는다.
+    False면 첫 동기화가 끝날 때까지 화면이 기존처럼 API를 직접 조회한다.
+    """
+    status = get_sync_status(user_id)
+    if status.get('expired_token') and status['expired_token'] == api_client.token:
+        # 백그라운드 동기화가 이 세션의 토큰으로 401을 받음
+        _end_session()
+    state = get_replica_store().sync_state(user_id, kind)
+    interval = REPLICA_LIVE_SYNC_INTERVAL if status.get('live') else REPLICA_SYNC_INTERVAL
+    if state is None or time.time() - state['synced_at'] >= interval:
+        _start_background_sync(_sync_client(api_client), user_id)
+    else:
+        metrics.record_cache(f"replica_{kind}", "hit")
+    return state is not None
+
+
+def _use_replica(api_client: PlandyAPIClient, user_id: int, kind: str) -> bool:
+    """레플리카에서 읽을지 여부 (첫 동기화 전이라도 연결 실패를 확인했으면 빈 레플리카와 대기 중인 변경을 보여줌)"""
+    return _ensure_synced(api_client, user_id, kind) or get_sync_status(user_id)['online'] is False
+
+
+def _bootstrapped(user_id: int) -> bool:
+    """모든 종류의 첫 동기화(전체 목록)가 끝났는지"""
+    store = get_replica_store()
+    return all(store.sync_state(user_id, kind) is not None for kind in REPLICA_KINDS)
+
+
+def pull_changes(client: PlandyAPIClient, user_id: int) -> bool:
+    """변경 알림을 받았을 때 변경분만 받아 반영 (백그라운드 스레드용, 성공 여부 반환)
+
+    첫 동기화 전이면 받지 않는다 (전체 목록은 동기화 스레드가 한 번만 받음).
+    """
+    if not _bootstrapped(user_id):
+        return True
+    try:
+        _pull_all(client, user_id)
+    except PlandyAPIError as e:
+        _record_error(client, user_id, e)
+        return False
+    _set_status(user_id, online=True, error=None)
+    return True
+
+
+def set_live(user_id: int, live: bool):
+    """변경 알림 연결 상태 기록 (연결되어 있으면 주기 동기화 간격을 늘림)"""
+    _set_status(user_id, live=live)
+
+
+def request_sync():
+    """다음 조회 때 변경분을 다시 받도록 만료 처리 (새로고침 버튼 등)"""
+    user_id = _current_user_id()
+    if user_id is None:
+        return
+    store = get_replica_store()
+    for kind in REPLICA_KINDS:
+        store.expire(user_id, kind)
+
+
+def request_full_sync(*kinds: str):
+    """해당 종류들을 다음 조회 때 전체 목록으로 다시 받도록 표시 (팀 참여/탈퇴로 볼 수 있는 범위가 바뀐 경우)
+
+    변경 피드는 커서 이후의 변경만 주므로, 새로 보이게 된 기존 항목이나 더 이상 볼 수 없는 항목은
+    전체 목록으로 교체해야 반영된다.
+    """
+    user_id = _current_user_id()
+    if user_id is None:
+        return
+    store = get_replica_store()
+    for kind in kinds:
+        store.forget(user_id, kind)
+
+
+def sync_now(api_client: PlandyAPIClient):
+    """변경분을 바로 받아 반영 (방금 한 변경을 다음 화면에 보여야 할 때, 실패는 무시하되 401이면 로그아웃)
+
+    첫 동기화 전이면 화면이 API를 직접 조회하므로 받지 않는다 (전체 목록을 화면 스레드에서 받지 않도록).
+    """
+    user_id = _current_user_id()
+    if user_id is None or not _bootstrapped(user_id):
+        return
+    try:
+        _pull_all(_sync_client(api_client), user_id)
+    except PlandyAPIError as e:
+        if e.status_code == 401:
+            _end_session()
+
+
+# 읽기
+def _with_pending(user_id: int, kind: str, records: List[Dict]) -> List[Dict]:
+    """서버 기준 레코드에 아직 보내지 않은 로컬 변경을 덧씌움"""
+    pending = [item for item in get_replica_store().outbox(user_id) if item['kind'] == kind]
+    if not pending:
+        return records
+
+    merged = {record['id']: record for record in records}
+    for item in pending:
+        if item['status'] == 'conflict':
+            # 충돌 항목은 사용자가 고를 때까지 서버 상태를 보여줌
+            continue
+        if item['op'] == "create":
+            merged[item['record_id']] = {'id': item['record_id'], 'status': 'pending', 'updated_at': None,
+                                         **item['payload']}
+        elif item['op'] == "update" and item['record_id'] in merged:
+            merged[item['record_id']] = {**merged[item['record_id']], **item['payload']}
+        elif item['op'] == "delete":
+            merged.pop(item['record_id'], None)
+    return list(merged.values())
+
+
+def get_replica_tasks(api_client: PlandyAPIClient, status: Optional[str] = None, priority: Optional[str] = None,
+                      date: Optional[str] = None) -> List[Dict]:
+    """태스크 목록 (레플리카 기준, get_tasks와 같은 필터)"""
+    user_id = _current_user_id()
+    if user_id is None:
+        return api_client.get_tasks(status=status, priority=priority, date=date)
+
+    if _use_replica(api_client, user_id, "tasks"):
+        tasks = get_replica_store().load(user_id, "tasks")
+    else:
+        tasks = api_client.get_tasks(status=status, priority=priority, date=date)
+    tasks = _with_pending(user_id, "tasks", tasks)
+    if status:
+        tasks = [t for t in tasks if t.get('status') == status]
+    if priority:
+        tasks = [t for t in tasks if t.get('priority') == priority]
+    if date:
+        tasks = [t for t in tasks if (t.get('deadline') or '')[:10] == date]
+    return tasks
+
+
+def get_replica_schedule(api_client: PlandyAPIClient, start_date: Optional[str] = None,
+                         end_date: Optional[str] = None) -> List[Dict]:
+    """일정 목록 (레플리카 기준, 시작일이 start_date~end_date인 블록을 시작 시각 순으로)"""
+    user_id = _current_user_id()
+    if user_id is None:
+        return api_client.get_schedule(start_date=start_date, end_date=end_date)
+
+    if _use_replica(api_client, user_id, "schedule"):
+        blocks = get_replica_store().load(user_id, "schedule")
+    else:
+        blocks = api_client.get_schedule(start_date=start_date, end_date=end_date)
+    blocks = _with_pending(user_id, "schedule", blocks)
+    if start_date:
+        blocks = [b for b in blocks if (b.get('starts_at') or '')[:10] >= start_date]
+    if end_date:
+        blocks = [b for b in blocks if (b.get('starts_at') or '')[:10] <= end_date]
+    return sorted(blocks, key=lambda b: b.get('starts_at') or '')
+
+
+def get_replica_sprints(api_client: PlandyAPIClient, team_id: int) -> List[Dict]:
+    """팀의 스프린트 목록 (레플리카 기준)"""
+    user_id = _current_user_id()
+    if user_id is None:
+        return api_client.get_sprints(team_id)
+
+    if not _use_replica(api_client, user_id, "sprints"):
+        return api_client.get_sprints(team_id)
+    return [s for s in get_replica_store().load(user_id, "sprints") if s.get('team_id') == team_id]
+
+
+# 쓰기
+def _queue(user_id: int, kind: str, op: str, record_id: Optional[int], payload: Dict):
+    """오프라인 변경을 outbox에 추가 (오프라인에서 만든 항목의 수정/삭제는 생성 요청에 합침)"""
+    store = get_replica_store()
+    if record_id is not None and record_id < 0:
+        create = next((item for item in store.outbox(user_id, status='pending')
+                       if item['op'] == "create" and item['record_id'] == record_id), None)
+        if create is not None:
+            if op == "delete":
+                store.remove(create['id'])
+            else:
+                store.update_payload(create['id'], {**create['payload'], **payload})
+            return
+
+    if op == "create":
+        # 임시 id(음수)는 저장소가 outbox id로 정함
+        record_id, base_updated_at = None, None
+    else:
+        current = store.get(user_id, kind, record_id)
+        base_updated_at = current.get('updated_at') if current else None
+    store.enqueue(user_id, kind, op, record_id, payload, base_updated_at)
+
+
+def write_record(api_client: PlandyAPIClient, kind: str, op: str, record_id: Optional[int] = None,
+                 **payload) -> bool:
+    """태스크/일정 생성·수정·삭제 (op: create / update / delete)
+
+    연결할 수 없으면 outbox에 넣고 성공으로 처리한다. 서버가 거부하면 st.error 후 False, 401이면 로그아웃.
+    """
+    user_id = _current_user_id()
+    if user_id is None:
+        return bool(_send(api_client, kind, op, record_id, payload))
+
+    store = get_replica_store()
+    # 앞선 변경이 아직 대기 중이면 순서를 지키기 위해 뒤에 쌓음
+    if get_sync_status(user_id)['online'] is False or store.outbox(user_id, status='pending'):
+        _queue(user_id, kind, op, record_id, payload)
+        _start_background_sync(_sync_client(api_client), user_id)
+        return True
+
+    client = _sync_client(api_client)
+    try:
+        result = _send(client, kind, op, record_id, payload)
+        if not result:
+            st.error("변경 사항을 저장하지 못했습니다.")
+            return False
+    except PlandyAPIError as e:
+        if e.status_code == 401:
+            _end_session()
+        if not _is_unreachable(e):
+            st.error(str(e))
+            return False
+        _set_status(user_id, online=False, error=str(e))
+        _queue(user_id, kind, op, record_id, payload)
+        return True
+
+    # 서버가 돌려준 레코드를 바로 반영 (같은 변경이 변경 피드로 다시 와도 멱등)
+    if op == "delete":
+        store.put(user_id, kind, deletes=[record_id])
+    elif isinstance(result, dict):
+        store.put(user_id, kind, [result])
+    else:
+        # 응답에 레코드가 없는 백엔드 - 백그라운드에서 변경분을 받음
+        store.expire(user_id, kind)
+        _start_background_sync(client, user_id)
+    return True
+
+
+# 화면
+def show_sync_status():
+    """오프라인/전송 대기/충돌 안내 (태스크·일정 페이지 상단)"""
+    user_id = _current_user_id()
+    if user_id is None:
+        return
+
+    store = get_replica_store()
+    status = get_sync_status(user_id)
+    outbox = store.outbox(user_id)
+    pending = [item for item in outbox if item['status'] == 'pending']
+    conflicts = [item for item in outbox if item['status'] == 'conflict']
+
+    if status['online'] is False:
+        state = store.sync_state(user_id, "tasks")
+        synced = datetime.fromtimestamp(state['synced_at']).strftime('%H:%M') if state and state['synced_at'] else "-"
+        st.warning(f"오프라인 상태입니다. 마지막 동기화({synced}) 기준 데이터를 표시합니다.")
+    if pending:
+        st.info(f"전송 대기 중인 변경 {len(pending)}건 - 연결되면 자동으로 전송됩니다.")
+    if not conflicts:
+        return
+
+    with st.expander(f"⚠️ 충돌한 변경 {len(conflicts)}건", expanded=True):
+        for item in conflicts:
+            label = {"tasks": "태스크", "schedule": "일정"}[item['kind']]
+            action = {"create": "생성", "update": "수정", "delete": "삭제"}[item['op']]
+            st.markdown(f"**{label} #{item['record_id']} {action}** - {item['error']}")
+            col1, col2 = st.columns(2)
+            with col1:
+                if st.button("내 변경 적용", key=f"conflict_keep_{item['id']}", use_container_width=True):
+                    store.requeue(item['id'])
+                    request_sync()
+                    st.rerun()
+            with col2:
+                if st.button("내 변경 버리기", key=f"conflict_drop_{item['id']}", use_container_width=True):
+                    store.remove(item['id'])
+                    st.rerun()
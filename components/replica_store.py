@@ -0,0 +1,311 @@
+"""
+태스크/일정 로컬 레플리카 저장소
+사용자별 태스크와 일정 블록을 SQLite에 보관하고(updated_at 워터마크 포함),
+오프라인 중 변경은 outbox에 쌓아 두었다가 연결되면 순서대로 재전송
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Optional, List, Dict, Iterable
+
+from config.constants import LOCAL_CACHE_DIR
+from utils import json_codec
+
+REPLICA_DB_NAME = "replica.sqlite3"
+# 메모리에 보관하는 (사용자, 종류)별 레코드 목록 최대 수 - 넘으면 가장 오래 안 쓴 것부터 버림 (다음 조회 때 SQLite에서 다시 읽음)
+REPLICA_MEMORY_MAX_ENTRIES = 64
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS records (
+    user_id INTEGER NOT NULL,
+    kind TEXT NOT NULL,
+    id INTEGER NOT NULL,
+    updated_at TEXT,
+    data TEXT NOT NULL,
+    PRIMARY KEY (user_id, kind, id)
+);
+CREATE TABLE IF NOT EXISTS sync_state (
+    user_id INTEGER NOT NULL,
+    kind TEXT NOT NULL,
+    watermark TEXT,
+    synced_at REAL,
+    full_synced_at REAL,
+    PRIMARY KEY (user_id, kind)
+);
+CREATE TABLE IF NOT EXISTS outbox (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    user_id INTEGER NOT NULL,
+    kind TEXT NOT NULL,
+    op TEXT NOT NULL,
+    record_id INTEGER,
+    payload TEXT NOT NULL,
+    base_updated_at TEXT,
+    status TEXT NOT NULL DEFAULT 'pending',
+    error TEXT,
+    created_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_outbox_user ON outbox (user_id, id);
+CREATE TABLE IF NOT EXISTS feed_state (
+    user_id INTEGER PRIMARY KEY,
+    cursor TEXT
+);
+"""
+
+
+class ReplicaStore:
+    """사용자별 레코드 레플리카와 outbox (SQLite)"""
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = path or os.path.join(LOCAL_CACHE_DIR, REPLICA_DB_NAME)
+        self._lock = threading.Lock()
+        # (user_id, kind) → (세대, 레코드 목록) - 리런마다 SQLite/JSON을 다시 읽지 않도록 (최근 사용 순)
+        self._loaded: "OrderedDict[tuple, tuple]" = OrderedDict()
+        self._generation: Dict[tuple, int] = {}
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with self._connect() as conn:
+            # 백그라운드 동기화가 쓰는 동안에도 페이지가 읽을 수 있도록
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(_SCHEMA)
+
+    @contextmanager
+    def _connect(self):
+        """커밋 후 닫히는 연결 (스레드마다 새 연결 사용)"""
+        conn = sqlite3.connect(self.path, timeout=5)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def _touch(self, user_id: int, kind: str):
+        key = (user_id, kind)
+        self._generation[key] = self._generation.get(key, 0) + 1
+
+    def generation(self, user_id: int, kind: str) -> int:
+        """레코드가 바뀔 때마다 올라가는 세대 (변경 여부 확인용)"""
+        with self._lock:
+            return self._generation.get((user_id, kind), 0)
+
+    def evict(self, user_id: int):
+        """사용자의 메모리 캐시 해제 (로그아웃 시, SQLite의 레플리카는 유지)"""
+        with self._lock:
+            for key in [key for key in self._loaded if key[0] == user_id]:
+                del self._loaded[key]
+            for key in [key for key in self._generation if key[0] == user_id]:
+                del self._generation[key]
+
+    # 레코드
+    def load(self, user_id: int, kind: str) -> List[Dict]:
+        """서버 기준 레코드 전체 (id 순, 반환 목록은 수정하지 말 것)"""
+        key = (user_id, kind)
+        with self._lock:
+            generation = self._generation.get(key, 0)
+            cached = self._loaded.get(key)
+            if cached and cached[0] == generation:
+                self._loaded.move_to_end(key)
+                return cached[1]
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT data FROM records WHERE user_id = ? AND kind = ? ORDER BY id", (user_id, kind)
+            ).fetchall()
+        records = [json_codec.loads(data) for (data,) in rows]
+        with self._lock:
+            if self._generation.get(key, 0) == generation:
+                self._loaded[key] = (generation, records)
+                self._loaded.move_to_end(key)
+                while len(self._loaded) > REPLICA_MEMORY_MAX_ENTRIES:
+                    self._loaded.popitem(last=False)
+        return records
+
+    def get(self, user_id: int, kind: str, record_id: int) -> Optional[Dict]:
+        """레코드 하나 (없으면 None)"""
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT data FROM records WHERE user_id = ? AND kind = ? AND id = ?", (user_id, kind, record_id)
+            ).fetchone()
+        return json_codec.loads(row[0]) if row else None
+
+    def apply(self, user_id: int, kind: str, upserts: Iterable[Dict] = (), deletes: Iterable[int] = (),
+              replace: bool = False):
+        """서버에서 받은 변경 반영 및 워터마크 갱신
+
+        replace=True면 upserts가 전체 목록이므로 거기에 없는 레코드는 삭제한다.
+        """
+        rows = [
+            (user_id, kind, record['id'], record.get('updated_at'), json.dumps(record, ensure_ascii=False))
+            for record in upserts if record.get('id') is not None
+        ]
+        newest = max((row[3] for row in rows if row[3]), default=None)
+        now = time.time()
+        with self._lock, self._connect() as conn:
+            if replace:
+                conn.execute("DELETE FROM records WHERE user_id = ? AND kind = ?", (user_id, kind))
+            conn.executemany(
+                "INSERT OR REPLACE INTO records (user_id, kind, id, updated_at, data) VALUES (?, ?, ?, ?, ?)", rows
+            )
+            conn.executemany(
+                "DELETE FROM records WHERE user_id = ? AND kind = ? AND id = ?",
+                [(user_id, kind, record_id) for record_id in deletes],
+            )
+            conn.execute(
+                "INSERT INTO sync_state (user_id, kind, watermark, synced_at, full_synced_at) VALUES (?, ?, ?, ?, ?) "
+                "ON CONFLICT (user_id, kind) DO UPDATE SET "
+                "watermark = CASE WHEN excluded.watermark > IFNULL(watermark, '') OR ? THEN excluded.watermark "
+                "ELSE watermark END, "
+                "synced_at = excluded.synced_at, "
+                "full_synced_at = IFNULL(excluded.full_synced_at, full_synced_at)",
+                (user_id, kind, newest, now, now if replace else None, replace),
+            )
+        # 커밋 후에 세대를 올려야 다른 스레드가 커밋 전 내용을 새 세대로 캐시하지 않음
+        with self._lock:
+            self._touch(user_id, kind)
+
+    def put(self, user_id: int, kind: str, upserts: Iterable[Dict] = (), deletes: Iterable[int] = ()):
+        """방금 보낸 변경의 서버 응답 반영 (워터마크/동기화 시각은 그대로 - 그 사이의 다른 변경을 건너뛰지 않도록)"""
+        rows = [
+            (user_id, kind, record['id'], record.get('updated_at'), json.dumps(record, ensure_ascii=False))
+            for record in upserts if record.get('id') is not None
+        ]
+        with self._lock, self._connect() as conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO records (user_id, kind, id, updated_at, data) VALUES (?, ?, ?, ?, ?)", rows
+            )
+            conn.executemany(
+                "DELETE FROM records WHERE user_id = ? AND kind = ? AND id = ?",
+                [(user_id, kind, record_id) for record_id in deletes],
+            )
+        with self._lock:
+            self._touch(user_id, kind)
+
+    def apply_changes(self, user_id: int, changes: List[Dict], cursor: Optional[str]):
+        """변경 피드 한 페이지 반영 (upsert/삭제와 새 커서를 한 트랜잭션으로 저장)"""
+        now = time.time()
+        kinds = set()
+        with self._lock, self._connect() as conn:
+            for change in changes:
+                kind, record = change['kind'], change.get('record')
+                kinds.add(kind)
+                if change['op'] == 'delete' or record is None:
+                    conn.execute("DELETE FROM records WHERE user_id = ? AND kind = ? AND id = ?",
+                                 (user_id, kind, change['id']))
+                else:
+                    conn.execute(
+                        "INSERT OR REPLACE INTO records (user_id, kind, id, updated_at, data) VALUES (?, ?, ?, ?, ?)",
+                        (user_id, kind, change['id'], record.get('updated_at'),
+                         json.dumps(record, ensure_ascii=False)),
+                    )
+            conn.execute("INSERT OR REPLACE INTO feed_state (user_id, cursor) VALUES (?, ?)",
+                         (user_id, None if cursor is None else str(cursor)))
+            # 피드를 끝까지 받았으므로 모든 종류가 최신
+            conn.execute("UPDATE sync_state SET synced_at = ? WHERE user_id = ?", (now, user_id))
+        with self._lock:
+            for kind in kinds:
+                self._touch(user_id, kind)
+
+    def feed_cursor(self, user_id: int) -> Optional[str]:
+        """변경 피드 커서 (없으면 None - 전체 동기화 필요)"""
+        with self._connect() as conn:
+            row = conn.execute("SELECT cursor FROM feed_state WHERE user_id = ?", (user_id,)).fetchone()
+        return row[0] if row else None
+
+    def forget(self, user_id: int, kind: Optional[str] = None):
+        """동기화 기록 삭제 - 다음 동기화 때 해당 종류를 전체 목록으로 교체 (kind가 없으면 피드 커서까지 전부)"""
+        with self._lock, self._connect() as conn:
+            if kind is None:
+                conn.execute("DELETE FROM sync_state WHERE user_id = ?", (user_id,))
+                conn.execute("DELETE FROM feed_state WHERE user_id = ?", (user_id,))
+            else:
+                conn.execute("DELETE FROM sync_state WHERE user_id = ? AND kind = ?", (user_id, kind))
+
+    def expire(self, user_id: int, kind: str):
+        """다음 조회 때 다시 동기화하도록 마지막 동기화 시각 초기화 (워터마크는 유지)"""
+        with self._lock, self._connect() as conn:
+            conn.execute("UPDATE sync_state SET synced_at = 0 WHERE user_id = ? AND kind = ?", (user_id, kind))
+
+    def sync_state(self, user_id: int, kind: str) -> Optional[Dict]:
+        """워터마크와 마지막 동기화 시각 (한 번도 동기화하지 않았으면 None)"""
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT watermark, synced_at, full_synced_at FROM sync_state WHERE user_id = ? AND kind = ?",
+                (user_id, kind),
+            ).fetchone()
+        if row is None:
+            return None
+        return {'watermark': row[0], 'synced_at': row[1] or 0.0, 'full_synced_at': row[2] or 0.0}
+
+    # outbox
+    def enqueue(self, user_id: int, kind: str, op: str, record_id: Optional[int], payload: Dict,
+                base_updated_at: Optional[str] = None) -> int:
+        """오프라인 변경 추가 (op: create / update / delete). outbox id 반환
+
+        record_id 없이 생성을 추가하면 서버 id를 받기 전까지 쓰는 임시 id로 -(outbox id)를 기록한다.
+        """
+        with self._lock, self._connect() as conn:
+            cursor = conn.execute(
+                "INSERT INTO outbox (user_id, kind, op, record_id, payload, base_updated_at, created_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (user_id, kind, op, record_id, json.dumps(payload, ensure_ascii=False), base_updated_at, time.time()),
+            )
+            if record_id is None and op == "create":
+                # outbox id는 겹치지 않으므로 같은 순간에 만든 항목끼리도 임시 id가 다름
+                conn.execute("UPDATE outbox SET record_id = ? WHERE id = ?", (-cursor.lastrowid, cursor.lastrowid))
+            return cursor.lastrowid
+
+    def outbox(self, user_id: int, status: Optional[str] = None) -> List[Dict]:
+        """outbox 항목 (오래된 순)"""
+        query = ("SELECT id, kind, op, record_id, payload, base_updated_at, status, error, created_at "
+                 "FROM outbox WHERE user_id = ?")
+        params = [user_id]
+        if status:
+            query += " AND status = ?"
+            params.append(status)
+        with self._connect() as conn:
+            rows = conn.execute(query + " ORDER BY id", params).fetchall()
+        return [
+            {'id': op_id, 'kind': kind, 'op': op, 'record_id': record_id, 'payload': json_codec.loads(payload),
+             'base_updated_at': base, 'status': op_status, 'error': error, 'created_at': created_at}
+            for op_id, kind, op, record_id, payload, base, op_status, error, created_at in rows
+        ]
+
+    def update_payload(self, op_id: int, payload: Dict):
+        """대기 중인 변경의 내용 교체 (오프라인에서 만든 항목을 다시 수정한 경우)"""
+        with self._lock, self._connect() as conn:
+            conn.execute("UPDATE outbox SET payload = ? WHERE id = ?",
+                         (json.dumps(payload, ensure_ascii=False), op_id))
+
+    def mark_conflict(self, op_id: int, error: str):
+        """재전송하지 않고 사용자 확인을 기다리는 상태로 표시"""
+        with self._lock, self._connect() as conn:
+            conn.execute("UPDATE outbox SET status = 'conflict', error = ? WHERE id = ?", (error, op_id))
+
+    def requeue(self, op_id: int):
+        """충돌 항목을 서버 상태와 관계없이 다시 전송하도록 대기열로 복귀"""
+        with self._lock, self._connect() as conn:
+            conn.execute(
+                "UPDATE outbox SET status = 'pending', error = NULL, base_updated_at = NULL WHERE id = ?", (op_id,)
+            )
+
+    def remove(self, op_id: int):
+        """전송 완료 또는 버린 항목 삭제"""
+        with self._lock, self._connect() as conn:
+            conn.execute("DELETE FROM outbox WHERE id = ?", (op_id,))
+
+
+_store: Optional[ReplicaStore] = None
+_store_lock = threading.Lock()
+
+
+def get_replica_store() -> ReplicaStore:
+    """프로세스 공용 레플리카 저장소 반환"""
+    global _store
+    with _store_lock:
+        if _store is None:
+            _store = ReplicaStore()
+        return _store
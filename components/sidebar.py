@@ -1,29 +1,21 @@
 import streamlit as st
-import base64
-import os
-from components.auth import logout, get_current_user
-
-
-def get_image_base64(image_path):
-    """이미지를 base64로 인코딩"""
-    try:
-        if os.path.exists(image_path):
-            with open(image_path, "rb") as img_file:
-                return base64.b64encode(img_file.read()).decode()
-        return ""
-    except Exception:
-        return ""
+from components.auth import logout, get_current_user, start_session
+from components.backend_status import get_backend_status
+from components.team_cache import get_cached_teams
+from utils.static_assets import image_src
+from utils.instrumentation import traced
 
 
+@traced()
 def show_sidebar():
     """사이드바 표시 및 페이지 선택"""
 
     # 로고
-    logo_b64 = get_image_base64("assets/plandy-logo.png")
-    if logo_b64:
+    logo_src = image_src("assets/plandy-logo.png")
+    if logo_src:
         st.sidebar.markdown(
             f'<div style="text-align:center;margin-bottom:1rem;">'
-            f'<img src="data:image/png;base64,{logo_b64}" width="120"></div>',
+            f'<img src="{logo_src}" width="120"></div>',
             unsafe_allow_html=True,
         )
 
@@ -61,7 +53,7 @@ def _show_logged_in_sidebar(user):
         api_client.set_token(st.session_state.user_token)
 
     try:
-        teams = api_client.get_teams()
+        teams = get_cached_teams(api_client)
     except Exception:
         teams = []
 
@@ -113,15 +105,13 @@ def _show_logged_in_sidebar(user):
 
     selected_page = st.session_state.selected_page
 
-    # 서버 상태
-    try:
-        import requests
-        resp = requests.get("http://127.0.0.1:8000/api/health", timeout=2)
-        if resp.status_code == 200:
-            st.sidebar.success("🟢 서버 연결됨")
-        else:
-            st.sidebar.error("🔴 서버 오류")
-    except Exception:
+    # 서버 상태 (캐시된 헬스 체크 결과, 만료 시 백그라운드 갱신)
+    backend_ok = get_backend_status()
+    if backend_ok is None:
+        st.sidebar.info("⚪ 서버 상태 확인 중")
+    elif backend_ok:
+        st.sidebar.success("🟢 서버 연결됨")
+    else:
         st.sidebar.error("🔴 서버 연결 실패")
 
     return selected_page
@@ -141,10 +131,8 @@ def _show_login_sidebar():
             from components.api_client import PlandyAPIClient
             api_client = PlandyAPIClient()
             if api_client.login(email, password):
-                st.session_state.user_token = api_client.token
-                user_info = api_client.get_user_info()
+                user_info = start_session(api_client)
                 if user_info:
-                    st.session_state.user_info = user_info
                     st.sidebar.success(f"환영합니다, {user_info.get('name', '사용자')}님!")
                     st.rerun()
             else:
@@ -156,10 +144,7 @@ def _show_login_sidebar():
         from components.api_client import PlandyAPIClient
         api_client = PlandyAPIClient()
         if api_client.login("demo@flandy.kr", "demo1234"):
-            st.session_state.user_token = api_client.token
-            user_info = api_client.get_user_info()
-            if user_info:
-                st.session_state.user_info = user_info
+            if start_session(api_client):
                 st.sidebar.success("데모 계정으로 로그인되었습니다!")
                 st.rerun()
         else:
@@ -185,10 +170,7 @@ def _show_login_sidebar():
             from components.api_client import PlandyAPIClient
             api_client = PlandyAPIClient()
             if api_client.register(email_reg, password_reg, name, password_confirm):
-                st.session_state.user_token = api_client.token
-                user_info = api_client.get_user_info()
-                if user_info:
-                    st.session_state.user_info = user_info
+                if start_session(api_client):
                     st.sidebar.success("회원가입이 완료되었습니다!")
                     st.rerun()
             else:
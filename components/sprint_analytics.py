@@ -0,0 +1,124 @@
+"""
+스프린트 분석 엔진
+완료된 스프린트 요약을 동시에 조회해 영구 캐시하고,
+벨로시티/이동 평균/몬테카를로 완료 예측을 NumPy로 계산
+"""
+
+import math
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, List, Dict
+
+import numpy as np
+from components.api_client import PlandyAPIClient, PlandyAPIError
+from utils.metrics import metrics
+
+# 스프린트 요약 동시 조회 수
+SUMMARY_FETCH_WORKERS = 4
+# 이동 평균 구간 (스프린트 수)
+VELOCITY_ROLLING_WINDOW = 3
+# 몬테카를로 시뮬레이션 횟수
+FORECAST_SIMULATIONS = 10000
+# 예측에서 고려하는 최대 스프린트 수
+FORECAST_MAX_SPRINTS = 52
+# 보고하는 완료 확률 (%)
+FORECAST_PERCENTILES = (50, 85, 95)
+
+# 완료된 스프린트는 변하지 않으므로 프로세스 수명 동안 캐시
+# (조회 권한은 get_sprints 목록에 포함된 스프린트로 한정됨)
+_completed_summaries: Dict[int, Dict] = {}
+_completed_lock = threading.Lock()
+
+
+def _summarize(sprint: Dict, dashboard: Dict) -> Dict:
+    info = dashboard.get('sprint') or sprint
+    return {
+        'id': sprint.get('id'),
+        'name': info.get('name', sprint.get('name', '이름 없음')),
+        'start_date': info.get('start_date', ''),
+        'end_date': info.get('end_date', ''),
+        'total_points': dashboard.get('total_points', 0) or 0,
+        'completed_points': dashboard.get('completed_points', 0) or 0,
+    }
+
+
+def _fetch_summary(token: Optional[str], sprint: Dict) -> Optional[Dict]:
+    api_client = PlandyAPIClient(raise_errors=True)
+    api_client.set_token(token)
+    try:
+        dashboard = api_client.get_sprint_dashboard(sprint.get('id'))
+    except PlandyAPIError:
+        return None
+    return _summarize(sprint, dashboard) if dashboard else None
+
+
+def load_completed_sprint_summaries(token: Optional[str], sprints: List[Dict]) -> List[Dict]:
+    """완료된 스프린트 요약 목록 (캐시에 없는 것만 동시 조회, 목록 순서 유지)"""
+    completed = [s for s in sprints if s.get('status') == 'completed' and s.get('id') is not None]
+
+    with _completed_lock:
+        missing = [s for s in completed if s['id'] not in _completed_summaries]
+    for _ in range(len(completed) - len(missing)):
+        metrics.record_cache('sprint_summary', 'hit')
+    for _ in missing:
+        metrics.record_cache('sprint_summary', 'miss')
+
+    if missing:
+        with ThreadPoolExecutor(max_workers=SUMMARY_FETCH_WORKERS) as executor:
+            results = list(executor.map(lambda s: _fetch_summary(token, s), missing))
+        with _completed_lock:
+            for summary in results:
+                if summary:
+                    _completed_summaries[summary['id']] = summary
+
+    with _completed_lock:
+        return [_completed_summaries[s['id']] for s in completed if s['id'] in _completed_summaries]
+
+
+def compute_velocity(summaries: List[Dict], window: int = VELOCITY_ROLLING_WINDOW) -> Dict:
+    """스프린트별 벨로시티, 이동 평균, 전체 평균/표준편차"""
+    points = np.array([s.get('completed_points', 0) for s in summaries], dtype=float)
+    rolling = np.full(points.shape, np.nan)
+    if len(points) >= window:
+        rolling[window - 1:] = np.convolve(points, np.ones(window) / window, mode='valid')
+
+    return {
+        'points': points,
+        'rolling': rolling,
+        'mean': float(points.mean()) if len(points) else 0.0,
+        'std': float(points.std()) if len(points) else 0.0,
+        'recent_mean': float(points[-window:].mean()) if len(points) else 0.0,
+    }
+
+
+def forecast_completion(velocities, remaining_points: float,
+                        simulations: int = FORECAST_SIMULATIONS,
+                        seed: Optional[int] = None) -> Optional[Dict[int, int]]:
+    """과거 벨로시티를 복원 추출해 남은 포인트 완료까지 필요한 스프린트 수 예측
+
+    반환: {확률(%): 스프린트 수}. 예측 불가(이력 없음/벨로시티 0)면 None
+    FORECAST_MAX_SPRINTS 안에 끝나지 않으면 스프린트 수는 FORECAST_MAX_SPRINTS + 1 (그 이상이라는 뜻)
+    """
+    velocities = np.asarray(velocities, dtype=float)
+    if remaining_points <= 0:
+        return {p: 0 for p in FORECAST_PERCENTILES}
+    positive = velocities[velocities > 0]
+    if not len(positive):
+        return None
+
+    # 벨로시티 0인 스프린트가 뽑히면 최소 벨로시티 기준 기간으로는 끝나지 않을 수 있으므로 최대 기간까지 시뮬레이션
+    if len(positive) < len(velocities):
+        horizon = FORECAST_MAX_SPRINTS
+    else:
+        horizon = min(FORECAST_MAX_SPRINTS, math.ceil(remaining_points / positive.min()))
+    rng = np.random.default_rng(seed)
+    samples = rng.choice(velocities, size=(simulations, horizon))
+    burned = np.cumsum(samples, axis=1)
+
+    done = burned >= remaining_points
+    # 최대 기간 안에 끝나지 않은 시뮬레이션은 FORECAST_MAX_SPRINTS + 1 (최대 기간보다 짧은 horizon에서는 모두 끝남)
+    sprints_needed = np.where(done.any(axis=1), done.argmax(axis=1) + 1, FORECAST_MAX_SPRINTS + 1)
+    return {
+        p: int(np.ceil(np.percentile(sprints_needed, p)))
+        for p in FORECAST_PERCENTILES
+    }
@@ -0,0 +1,42 @@
+"""
+팀 목록 세션 캐시
+사이드바와 팀 관리 페이지가 같은 목록을 공유하고,
+팀 생성/참여/탈퇴/삭제 등 변경 후에만 다시 조회
+"""
+
+import time
+from typing import List, Dict
+
+import streamlit as st
+from components.api_client import PlandyAPIClient
+from components.offline_sync import request_full_sync
+from utils.metrics import metrics
+
+# 팀 목록을 그대로 사용하는 시간 (초) - 다른 멤버가 바꾼 내용(역할 변경 등) 반영 주기
+TEAMS_CACHE_TTL = 300
+# 빈 목록(팀 없음 또는 조회 실패)을 사용하는 시간 (초)
+TEAMS_EMPTY_TTL = 10
+
+
+def get_cached_teams(api_client: PlandyAPIClient) -> List[Dict]:
+    """팀 목록 반환 (세션 캐시 우선)"""
+    cache = st.session_state.get('teams_cache')
+    if cache:
+        ttl = TEAMS_CACHE_TTL if cache['data'] else TEAMS_EMPTY_TTL
+        if time.time() - cache['fetched_at'] < ttl:
+            metrics.record_cache('teams', 'hit')
+            return cache['data']
+
+    metrics.record_cache('teams', 'miss')
+    teams = api_client.get_teams()
+    st.session_state.teams_cache = {'data': teams, 'fetched_at': time.time()}
+    return teams
+
+
+def invalidate_teams():
+    """팀 목록 캐시 삭제 (다음 조회 시 백엔드에서 다시 받음)
+
+    볼 수 있는 팀이 바뀌었을 수 있으므로 팀 범위인 태스크/스프린트 레플리카도 전체를 다시 받게 한다.
+    """
+    st.session_state.teams_cache = None
+    request_full_sync("tasks", "sprints")
@@ -0,0 +1,302 @@
+"""
+팀 변경 알림 구독
+(사용자, 팀)마다 SSE 스트림(GET /teams/{id}/events) 하나를 백그라운드 스레드로 유지하고,
+알림이 오면 잠시 모았다가 변경 피드로 레플리카를 한 번만 갱신한 뒤 종류별 버전을 올림
+화면은 버전만 확인하는 작은 st.fragment(run_every)를 두고 실제 변경이 반영됐을 때만 앱 전체를 다시 실행 (백엔드 폴링 없음)
+(영향받는 목록/차트만 다시 그리지는 않음 - show_live_watcher 참고)
+"""
+
+import socket
+import threading
+import time
+from typing import Optional, Dict, Iterable, Callable
+
+import requests
+import streamlit as st
+from components.api_client import PlandyAPIClient
+from components.offline_sync import REPLICA_KINDS, REPLICA_REQUEST_TIMEOUT, pull_changes, set_live
+from components.replica_store import get_replica_store
+
+# 스트림 연결 대기 시간 (초)
+TEAM_EVENTS_CONNECT_TIMEOUT = 10
+# 데이터(하트비트 포함) 없이 기다리는 최대 시간 (초) - 서버 하트비트(15초)보다 길게
+TEAM_EVENTS_READ_TIMEOUT = 45
+# 재연결 대기 시간 (초) - 실패할 때마다 두 배, 최대값까지
+TEAM_EVENTS_RETRY_MIN = 1
+TEAM_EVENTS_RETRY_MAX = 30
+# 알림을 모으는 시간 (초) - 연속된 변경을 변경 피드 요청 한 번으로 반영
+TEAM_EVENTS_DEBOUNCE = 0.3
+# 이 시간 동안 어떤 화면도 확인하지 않은 구독은 닫음 (초)
+TEAM_EVENTS_IDLE_CLOSE = 120
+# 프래그먼트가 버전을 확인하는 간격 (초) - 메모리만 확인하므로 백엔드 호출 없음
+LIVE_REFRESH_INTERVAL = 2
+
+# (user_id, team_id) → 구독 (프로세스 단위 - 같은 사용자의 세션들이 공유)
+_subscriptions: Dict[tuple, "TeamEventSubscription"] = {}
+_subscriptions_lock = threading.Lock()
+# 백엔드가 팀 변경 알림을 지원하는지 (None: 아직 모름, 404를 받으면 False)
+_events_supported: Optional[bool] = None
+
+
+class TeamEventSubscription:
+    """팀 변경 알림 스트림 하나 (읽기 스레드 + 반영 스레드)"""
+
+    def __init__(self, base_url: str, token: Optional[str], user_id: int, team_id: int):
+        self.base_url = base_url
+        self.token = token
+        self.user_id = user_id
+        self.team_id = team_id
+
+        self.connected = False
+        # 서버가 토큰을 거부(401)했는지 - 같은 토큰으로는 다시 구독하지 않음
+        self.rejected = False
+        # 종류별 반영 버전 - 레플리카 내용이 실제로 바뀐 종류만, 반영된 뒤에 올라감
+        self.versions: Dict[str, int] = {kind: 0 for kind in REPLICA_KINDS}
+        self.last_used = time.monotonic()
+
+        self._lock = threading.Lock()
+        self._pending: set = set()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        # 읽기 중인 스트림 (close()가 소켓을 끊을 수 있도록)
+        self._response_lock = threading.Lock()
+        self._response: Optional[requests.Response] = None
+
+    @property
+    def alive(self) -> bool:
+        return not self._stop.is_set()
+
+    def start(self):
+        """읽기/반영 스레드 시작"""
+        threading.Thread(target=self._run, daemon=True).start()
+        threading.Thread(target=self._apply_loop, daemon=True).start()
+
+    def touch(self):
+        """화면에서 사용 중임을 표시 (오래 쓰지 않으면 닫힘)"""
+        self.last_used = time.monotonic()
+
+    def close(self):
+        """스레드 종료 - 읽기 중인 스트림의 소켓을 끊어 읽기 스레드가 바로 끝나게 함 (이전 토큰의 연결을 남기지 않음)
+
+        다른 스레드에서 읽기 중인 응답을 닫으면 읽기 잠금을 기다리며 멈출 수 있으므로,
+        소켓만 shutdown하고 응답은 읽기 스레드가 닫는다.
+        """
+        self._stop.set()
+        self._wake.set()
+        with self._response_lock:
+            if self._response is not None:
+                _shutdown_stream(self._response)
+
+    def version(self, kinds: Iterable[str]) -> tuple:
+        """종류별 반영 버전 (화면이 마지막으로 본 값과 비교)"""
+        with self._lock:
+            return tuple(self.versions.get(kind, 0) for kind in kinds)
+
+    def _idle(self) -> bool:
+        return time.monotonic() - self.last_used >= TEAM_EVENTS_IDLE_CLOSE
+
+    def _schedule(self, kinds: Iterable[str]):
+        with self._lock:
+            self._pending.update(kinds)
+        self._wake.set()
+
+    def _set_connected(self, connected: bool):
+        self.connected = connected
+        _update_live(self.user_id)
+
+    def _run(self):
+        global _events_supported
+        client = PlandyAPIClient(self.base_url, raise_errors=True)
+        client.set_token(self.token)
+        delay = TEAM_EVENTS_RETRY_MIN
+        try:
+            while not self._stop.is_set() and not self._idle():
+                try:
+                    response = client.open_team_events(
+                        self.team_id, timeout=(TEAM_EVENTS_CONNECT_TIMEOUT, TEAM_EVENTS_READ_TIMEOUT),
+                    )
+                except requests.RequestException:
+                    response = None
+
+                if response is not None and response.status_code == 200:
+                    with self._response_lock:
+                        self._response = response
+                    if self._stop.is_set():
+                        # 연결하는 사이에 닫힘
+                        self._release(response)
+                        break
+                    _events_supported = True
+                    self._set_connected(True)
+                    delay = TEAM_EVENTS_RETRY_MIN
+                    # 연결 전(또는 끊긴 동안)의 변경은 알림으로 오지 않으므로 한 번 받아 둠
+                    self._schedule(REPLICA_KINDS)
+                    try:
+                        for event in client.iter_team_events(response):
+                            if self._stop.is_set() or self._idle():
+                                break
+                            if event and event.get('kind') in self.versions:
+                                self._schedule([event['kind']])
+                    except Exception:
+                        # 읽기 시간 초과/연결 끊김 - 재연결
+                        pass
+                    finally:
+                        self._release(response)
+                        self._set_connected(False)
+                elif response is not None:
+                    response.close()
+                    if response.status_code == 404:
+                        # 알림을 지원하지 않는 백엔드 - 주기 동기화만 사용
+                        _events_supported = False
+                        return
+                    if response.status_code == 401:
+                        # 토큰 만료 - 다른 토큰을 가진 세션이 구독할 때 새로 연결
+                        self.rejected = True
+                        return
+                    # 그 밖의 오류(팀 탈퇴, 서버 오류 등)는 구독을 남겨 둔 채 간격을 늘려 재시도
+                    # (닫으면 화면마다 새로 구독해 재연결이 몰림)
+
+                self._stop.wait(delay)
+                delay = min(delay * 2, TEAM_EVENTS_RETRY_MAX)
+        finally:
+            self.close()
+            if self.rejected:
+                # 거부된 토큰으로 화면마다 다시 연결하지 않도록 등록은 남겨 둠
+                _update_live(self.user_id)
+            else:
+                _forget(self)
+
+    def _release(self, response: requests.Response):
+        # 응답을 닫기 전에 등록을 지워 close()가 닫힌(재사용될 수 있는) 파일 디스크립터를 끊지 않도록
+        with self._response_lock:
+            self._response = None
+        response.close()
+
+    def _apply_loop(self):
+        client = PlandyAPIClient(self.base_url, raise_errors=True, timeout=REPLICA_REQUEST_TIMEOUT)
+        client.set_token(self.token)
+        while True:
+            self._wake.wait()
+            # 짧게 기다려 연속된 알림을 한 번에 반영
+            if self._stop.wait(TEAM_EVENTS_DEBOUNCE):
+                return
+            with self._lock:
+                kinds, self._pending = self._pending, set()
+                self._wake.clear()
+            if not kinds:
+                continue
+            store = get_replica_store()
+            before = {kind: store.generation(self.user_id, kind) for kind in self.versions}
+            if pull_changes(client, self.user_id):
+                with self._lock:
+                    for kind in self.versions:
+                        if store.generation(self.user_id, kind) != before[kind]:
+                            self.versions[kind] += 1
+            else:
+                # 실패하면 다음 알림/재연결 때 다시 시도
+                with self._lock:
+                    self._pending.update(kinds)
+                if self._stop.wait(TEAM_EVENTS_RETRY_MIN):
+                    return
+
+
+def _shutdown_stream(response: requests.Response):
+    """응답의 소켓을 양방향 shutdown (읽기 중인 다른 스레드는 즉시 스트림 끝을 받음)"""
+    try:
+        with socket.fromfd(response.raw.fileno(), socket.AF_INET, socket.SOCK_STREAM) as sock:
+            sock.shutdown(socket.SHUT_RDWR)
+    except (OSError, ValueError, AttributeError):
+        # 이미 닫힌 응답
+        pass
+
+
+def _update_live(user_id: int):
+    with _subscriptions_lock:
+        live = any(sub.connected for (uid, _), sub in _subscriptions.items() if uid == user_id)
+    set_live(user_id, live)
+
+
+def _forget(subscription: TeamEventSubscription):
+    with _subscriptions_lock:
+        key = (subscription.user_id, subscription.team_id)
+        if _subscriptions.get(key) is subscription:
+            del _subscriptions[key]
+    _update_live(subscription.user_id)
+
+
+def subscribe(api_client: PlandyAPIClient, team_id: Optional[int]) -> Optional[TeamEventSubscription]:
+    """현재 사용자의 팀 변경 알림 구독 반환 (없으면 시작, 로그인/팀이 없거나 백엔드가 지원하지 않으면 None)
+
+    같은 사용자의 탭/기기는 토큰이 달라도 구독 하나를 공유한다 (처음 구독한 토큰으로 연결).
+    토큰마다 바꿔 연결하면 탭마다 서로의 스트림을 끊고 전체를 다시 받게 되므로,
+    연결한 토큰이 거부(401)되었을 때만 다른 세션의 토큰으로 새로 연결한다.
+    """
+    user = st.session_state.get('user_info') or {}
+    user_id = user.get('id')
+    if not team_id or user_id is None or not api_client.token or _events_supported is False:
+        return None
+
+    key = (user_id, team_id)
+    with _subscriptions_lock:
+        subscription = _subscriptions.get(key)
+        if subscription is not None and not subscription.alive:
+            if subscription.rejected and subscription.token == api_client.token:
+                # 이 세션의 토큰도 거부된 토큰 - 다시 로그인할 때까지 구독하지 않음
+                return None
+            subscription = None
+        if subscription is None:
+            subscription = TeamEventSubscription(api_client.base_url, api_client.token, user_id, team_id)
+            _subscriptions[key] = subscription
+            subscription.start()
+        subscription.touch()
+    return subscription
+
+
+def consume_changes(subscription: TeamEventSubscription, kinds: Iterable[str], key: str) -> bool:
+    """이 화면(key)이 마지막으로 본 뒤 kinds에 반영된 변경이 있는지 (처음 보면 False)"""
+    kinds = tuple(kinds)
+    version = subscription.version(kinds)
+    seen = st.session_state.setdefault('live_versions', {})
+    state_key = (key, subscription.user_id, subscription.team_id, kinds)
+    previous = seen.get(state_key)
+    seen[state_key] = version
+    return previous is not None and previous != version
+
+
+def close_subscriptions(user_id: int):
+    """사용자의 모든 구독 종료 (로그아웃 시 이전 토큰으로 스트림을 유지하지 않도록)"""
+    with _subscriptions_lock:
+        closing = [sub for (uid, _), sub in _subscriptions.items() if uid == user_id]
+        for sub in closing:
+            del _subscriptions[(sub.user_id, sub.team_id)]
+    for sub in closing:
+        sub.close()
+    set_live(user_id, False)
+
+
+def show_live_watcher(api_client: PlandyAPIClient, team_id: Optional[int], kinds: Iterable[str], key: str,
+                      on_change: Optional[Callable[[], None]] = None):
+    """화면 상단의 작은 프래그먼트 - kinds에 변경이 반영되면 on_change 호출 후 앱 전체를 다시 실행
+
+    영향받는 목록/차트만 다시 실행하지 않는 이유: 프래그먼트 안의 st.rerun()은 앱 전체를 다시 실행하고
+    (scope="fragment"는 자기 자신만 가능), 한 프래그먼트가 다른 프래그먼트를 다시 실행할 방법이 없다.
+    목록/차트 자체를 run_every 프래그먼트로 두면 바뀐 것이 없어도 매 주기 다시 그려 보내므로,
+    버전만 확인하는 프래그먼트를 두고 실제 변경이 있을 때만 전체 리런한다 (변경이 없으면 아무것도 보내지 않음).
+    """
+    subscription = subscribe(api_client, team_id)
+    if subscription is None:
+        return
+    st.fragment(_watch_changes, run_every=LIVE_REFRESH_INTERVAL)(api_client, team_id, tuple(kinds), key, on_change)
+
+
+def _watch_changes(api_client: PlandyAPIClient, team_id: int, kinds: tuple, key: str,
+                   on_change: Optional[Callable[[], None]]):
+    subscription = subscribe(api_client, team_id)
+    if subscription is None:
+        return
+    if consume_changes(subscription, kinds, key):
+        if on_change is not None:
+            on_change()
+        # 앱 전체 리런 (영향받는 부분만 다시 실행할 수 없음 - show_live_watcher 참고)
+        st.rerun(scope="app")
+    if not subscription.connected:
+        st.caption("실시간 업데이트 재연결 중...")
@@ -0,0 +1,146 @@
+"""
+채팅 기록 저장소
+백엔드 session_id 기준으로 채팅 메시지를 앱 서버의 캐시 디렉터리(LOCAL_CACHE_DIR)에
+사용자별 SQLite 파일로 추가 전용 기록하여 새로고침 후에도 백엔드/LLM 호출 없이 대화를 복원
+(사용자마다 파일이 따로 있어 다른 사용자의 대화와 섞이거나 함께 정리되지 않음)
+"""
+
+import os
+import sqlite3
+import threading
+from contextlib import contextmanager
+from typing import Optional, List, Dict
+
+from config.constants import LOCAL_CACHE_DIR
+
+# 사용자별 채팅 기록 파일을 두는 디렉터리 (LOCAL_CACHE_DIR 아래)
+TRANSCRIPT_DIR_NAME = "transcripts"
+# 사용자별 파일 크기가 이 값을 넘으면 오래된 메시지부터 정리
+TRANSCRIPT_MAX_BYTES = 20 * 1024 * 1024
+# 정리할 때 삭제하는 오래된 메시지 비율
+TRANSCRIPT_ROTATE_FRACTION = 0.25
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS messages (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    session_id TEXT NOT NULL,
+    role TEXT NOT NULL,
+    content TEXT NOT NULL,
+    timestamp TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_messages_session ON messages (session_id, id);
+CREATE TABLE IF NOT EXISTS current_session (
+    id INTEGER PRIMARY KEY CHECK (id = 0),
+    session_id TEXT NOT NULL
+);
+"""
+
+
+class TranscriptStore:
+    """사용자 한 명의 session_id별 채팅 기록 저장소 (SQLite 파일 하나)"""
+
+    def __init__(self, path: str, max_bytes: int = TRANSCRIPT_MAX_BYTES):
+        self.path = path
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with self._connect() as conn:
+            conn.executescript(_SCHEMA)
+
+    @contextmanager
+    def _connect(self):
+        """커밋 후 닫히는 연결 (스레드마다 새 연결 사용)"""
+        conn = sqlite3.connect(self.path, timeout=5)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def append(self, session_id: str, role: str, content: str, timestamp: Optional[str] = None):
+        """메시지 추가"""
+        with self._lock, self._connect() as conn:
+            conn.execute(
+                "INSERT INTO messages (session_id, role, content, timestamp) VALUES (?, ?, ?, ?)",
+                (session_id, role, content, timestamp),
+            )
+            conn.execute("INSERT OR REPLACE INTO current_session (id, session_id) VALUES (0, ?)", (session_id,))
+        self._rotate_if_needed()
+
+    def set_current_session(self, session_id: str):
+        """현재 대화를 지정 (대화 초기화 후 새로고침해도 이전 대화를 복원하지 않도록)"""
+        with self._lock, self._connect() as conn:
+            conn.execute("INSERT OR REPLACE INTO current_session (id, session_id) VALUES (0, ?)", (session_id,))
+
+    def rename_session(self, old_session_id: str, new_session_id: str):
+        """클라이언트 임시 session_id를 백엔드가 발급한 session_id로 교체"""
+        if not old_session_id or old_session_id == new_session_id:
+            return
+        with self._lock, self._connect() as conn:
+            conn.execute("UPDATE messages SET session_id = ? WHERE session_id = ?",
+                         (new_session_id, old_session_id))
+            conn.execute("UPDATE current_session SET session_id = ? WHERE session_id = ?",
+                         (new_session_id, old_session_id))
+
+    def latest_session_id(self) -> Optional[str]:
+        """현재 대화 session_id (지정된 것이 없으면 가장 최근 메시지의 대화)"""
+        with self._connect() as conn:
+            row = conn.execute("SELECT session_id FROM current_session WHERE id = 0").fetchone()
+            if row:
+                return row[0]
+            row = conn.execute("SELECT session_id FROM messages ORDER BY id DESC LIMIT 1").fetchone()
+        return row[0] if row else None
+
+    def count(self, session_id: str) -> int:
+        """대화의 메시지 수"""
+        with self._connect() as conn:
+            row = conn.execute("SELECT COUNT(*) FROM messages WHERE session_id = ?", (session_id,)).fetchone()
+        return row[0]
+
+    def load(self, session_id: str, limit: int, skip_latest: int = 0) -> List[Dict]:
+        """최근 skip_latest개를 건너뛴 뒤 limit개 메시지를 시간순으로 반환"""
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT role, content, timestamp FROM messages "
+                "WHERE session_id = ? ORDER BY id DESC LIMIT ? OFFSET ?",
+                (session_id, limit, skip_latest),
+            ).fetchall()
+        return [
+            {'role': role, 'content': content, 'timestamp': timestamp}
+            for role, content, timestamp in reversed(rows)
+        ]
+
+    def _rotate_if_needed(self):
+        """파일 크기 제한 초과 시 오래된 메시지 삭제 후 VACUUM"""
+        try:
+            size = os.path.getsize(self.path)
+        except OSError:
+            return
+        if size <= self.max_bytes:
+            return
+        with self._lock, self._connect() as conn:
+            total = conn.execute("SELECT COUNT(*) FROM messages").fetchone()[0]
+            drop = max(1, int(total * TRANSCRIPT_ROTATE_FRACTION))
+            conn.execute(
+                "DELETE FROM messages WHERE id IN (SELECT id FROM messages ORDER BY id LIMIT ?)",
+                (drop,),
+            )
+        with self._lock, self._connect() as conn:
+            conn.execute("VACUUM")
+
+
+# user_id → 저장소 (같은 사용자의 세션들이 공유)
+_stores: Dict[int, TranscriptStore] = {}
+_stores_lock = threading.Lock()
+
+
+def get_transcript_store(user_id: int) -> TranscriptStore:
+    """사용자의 채팅 기록 저장소 반환"""
+    with _stores_lock:
+        store = _stores.get(user_id)
+        if store is None:
+            path = os.path.join(LOCAL_CACHE_DIR, TRANSCRIPT_DIR_NAME, f"{int(user_id)}.sqlite3")
+            store = _stores[user_id] = TranscriptStore(path)
+        return store
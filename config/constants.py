@@ -3,6 +3,8 @@
 앱에서 사용하는 상수들을 정의
 """
 
+import os
+
 # 다크 테마 팔레트
 THEME_DARK = {
     "bg_primary": "#0F172A",
@@ -76,3 +78,9 @@ LOGO_WIDTH = 180
 
 # 자동 새로고침 간격 (초)
 AUTO_REFRESH_INTERVAL = 5
+
+# 백엔드 API 주소 (벤치마크 등에서 FLANDY_API_URL로 교체 가능)
+API_BASE_URL = os.environ.get("FLANDY_API_URL", "http://127.0.0.1:8000/api")
+
+# 로컬 캐시 디렉토리 (채팅 기록 등 로컬에 보관하는 데이터)
+LOCAL_CACHE_DIR = os.environ.get("FLANDY_CACHE_DIR", ".flandy_cache")
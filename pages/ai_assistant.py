@@ -2,41 +2,21 @@ import streamlit as st
 import time
 from datetime import datetime, date
 from components.api_client import PlandyAPIClient
-
-
+from utils.styling import apply_page_css
+from components.ai_stream import AIStreamWorker, AI_STREAM_POLL_INTERVAL
+from components.ai_context import get_ai_context_builder
+from components.offline_sync import request_sync
+from components.chat_history import (
+    init_chat_history, restore_chat_history, append_chat_message, render_chat_history,
+    start_new_chat_session, set_chat_session_id
+)
+from utils.instrumentation import traced
+
+
+@traced()
 def show_ai_assistant():
     # 채팅 UI 전용 스타일
-    st.markdown("""
-    <style>
-    /* 메인 콘텐츠 영역 최대 너비 해제 */
-    .main .block-container {
-        max-width: 100%;
-        padding-left: 2rem;
-        padding-right: 2rem;
-    }
-    /* 채팅 메시지 전체 너비 사용 */
-    .stChatMessage {
-        max-width: 100% !important;
-        width: 100% !important;
-    }
-    .stChatMessage > div {
-        max-width: 100% !important;
-    }
-    /* 채팅 메시지 내 텍스트 영역 */
-    .stChatMessage [data-testid="stMarkdownContainer"] {
-        max-width: 100% !important;
-    }
-    .stChatMessage [data-testid="stMarkdownContainer"] p {
-        max-width: 100% !important;
-        word-break: keep-all;
-        overflow-wrap: break-word;
-    }
-    /* 입력 영역 전체 너비 */
-    .stChatInput, .stForm {
-        max-width: 100% !important;
-    }
-    </style>
-    """, unsafe_allow_html=True)
+    apply_page_css('ai_assistant')
 
     st.header("AI 어시스턴트")
 
@@ -44,11 +24,9 @@ def show_ai_assistant():
     if 'user_token' in st.session_state:
         api_client.set_token(st.session_state.user_token)
 
-    if 'chat_history' not in st.session_state:
-        st.session_state.chat_history = []
-    if 'session_id' not in st.session_state:
-        import uuid
-        st.session_state.session_id = str(uuid.uuid4())
+    init_chat_history()
+    # 새로고침 후 첫 진입이면 채팅 기록에서 최근 대화 복원
+    restore_chat_history()
     if 'pending_prompt' not in st.session_state:
         st.session_state.pending_prompt = None
     if 'optimization_proposal' not in st.session_state:
@@ -56,10 +34,14 @@ def show_ai_assistant():
     if 'run_optimization' not in st.session_state:
         st.session_state.run_optimization = False
 
-    # 채팅 메시지 영역
-    for message in st.session_state.chat_history:
-        with st.chat_message(message['role']):
-            st.markdown(message['content'])
+    # 전송 경로에서 기다리지 않도록 컨텍스트를 미리 백그라운드로 준비
+    get_ai_context_builder().prefetch()
+
+    # 채팅 메시지 영역 (최근 메시지 창만 렌더링)
+    render_chat_history()
+
+    # rerun으로 중단된 스트림 이어서 표시
+    _resume_stream()
 
     # pending prompt 처리
     pending = st.session_state.pending_prompt
@@ -104,9 +86,8 @@ def show_ai_assistant():
             st.rerun()
     with col4:
         if st.button("대화 초기화", use_container_width=True):
-            st.session_state.chat_history = []
-            import uuid
-            st.session_state.session_id = str(uuid.uuid4())
+            _cancel_stream()
+            start_new_chat_session()
             st.session_state.pending_prompt = None
             st.session_state.optimization_proposal = None
             st.rerun()
@@ -122,15 +103,12 @@ def _extract_time(iso_string: str) -> str:
         return iso_string
 
 
+@traced()
 def _run_optimization_flow(api_client):
     """일정 최적화 전용 플로우: 일정 조회 → 최적화 API 호출 → 비교표 렌더링"""
     # 사용자 메시지 표시
     user_msg = "일정 최적화를 요청합니다."
-    st.session_state.chat_history.append({
-        'role': 'user',
-        'content': user_msg,
-        'timestamp': datetime.now().isoformat()
-    })
+    append_chat_message('user', user_msg)
     with st.chat_message("user"):
         st.markdown(user_msg)
 
@@ -146,10 +124,7 @@ def _run_optimization_flow(api_client):
         if not schedules:
             msg = "오늘 등록된 일정이 없어 최적화할 내용이 없습니다."
             status.markdown(msg)
-            st.session_state.chat_history.append({
-                'role': 'assistant', 'content': msg,
-                'timestamp': datetime.now().isoformat()
-            })
+            append_chat_message('assistant', msg)
             return
 
         status.markdown(f"일정 {len(schedules)}개를 발견했습니다. AI가 최적 배치를 분석 중입니다... :hourglass_flowing_sand:")
@@ -159,10 +134,7 @@ def _run_optimization_flow(api_client):
         if not result:
             msg = "일정 최적화 요청에 실패했습니다. 잠시 후 다시 시도해주세요."
             status.markdown(msg)
-            st.session_state.chat_history.append({
-                'role': 'assistant', 'content': msg,
-                'timestamp': datetime.now().isoformat()
-            })
+            append_chat_message('assistant', msg)
             return
 
         changes = result.get('changes', [])
@@ -171,10 +143,7 @@ def _run_optimization_flow(api_client):
         if not changes:
             msg = f"**분석 결과:** {reasoning}\n\n현재 일정이 이미 최적 상태입니다. 변경 사항이 없습니다."
             status.markdown(msg)
-            st.session_state.chat_history.append({
-                'role': 'assistant', 'content': msg,
-                'timestamp': datetime.now().isoformat()
-            })
+            append_chat_message('assistant', msg)
             return
 
         # 비교표 구성
@@ -190,10 +159,7 @@ def _run_optimization_flow(api_client):
         comparison += "\n이 변경사항을 적용할까요?"
         status.markdown(comparison)
 
-        st.session_state.chat_history.append({
-            'role': 'assistant', 'content': comparison,
-            'timestamp': datetime.now().isoformat()
-        })
+        append_chat_message('assistant', comparison)
 
         # 제안 데이터를 session state에 저장
         st.session_state.optimization_proposal = {
@@ -213,10 +179,7 @@ def _show_optimization_proposal(api_client):
         if st.button("아니오, 취소합니다", use_container_width=True):
             st.session_state.optimization_proposal = None
             cancel_msg = "일정 최적화를 취소했습니다."
-            st.session_state.chat_history.append({
-                'role': 'assistant', 'content': cancel_msg,
-                'timestamp': datetime.now().isoformat()
-            })
+            append_chat_message('assistant', cancel_msg)
             st.rerun()
 
 
@@ -247,82 +210,100 @@ def _apply_optimization(api_client):
                 fail_count += 1
 
     st.session_state.optimization_proposal = None
+    if success_count:
+        get_ai_context_builder().invalidate(tasks=False, schedule=True)
+        request_sync()
 
     if fail_count == 0:
         msg = f"일정 최적화가 완료되었습니다. {success_count}개의 일정이 변경되었습니다."
     else:
         msg = f"일정 최적화 결과: {success_count}개 성공, {fail_count}개 실패"
 
-    st.session_state.chat_history.append({
-        'role': 'assistant', 'content': msg,
-        'timestamp': datetime.now().isoformat()
-    })
+    append_chat_message('assistant', msg)
 
 
 def _stream_response(api_client, message):
     """메시지를 history에 추가하고 스트리밍 응답을 표시"""
-    st.session_state.chat_history.append({
-        'role': 'user',
-        'content': message,
-        'timestamp': datetime.now().isoformat()
-    })
+    append_chat_message('user', message)
     with st.chat_message("user"):
         st.markdown(message)
 
-    # 컨텍스트 수집
+    # 컨텍스트 수집 (미리 준비된 요약 사용, 네트워크 호출 없음)
     team_id = st.session_state.get('selected_team_id')
     user_info = st.session_state.get('user_info', {})
     user_id = user_info.get('id')
 
-    context = {}
-    try:
-        today = date.today().isoformat()
-        tasks = api_client.get_tasks()
-        today_schedule = api_client.get_schedule_by_date(today)
-        context = {
-            'total_tasks': len(tasks) if tasks else 0,
-            'tasks': [
-                {'title': t.get('title', ''), 'status': t.get('status', ''), 'priority': t.get('priority', '')}
-                for t in (tasks or [])[:10]
-            ],
-            'today_schedule_count': len(today_schedule) if today_schedule else 0,
-            'team_id': team_id,
-        }
-    except Exception:
-        pass
+    builder = get_ai_context_builder()
+    context = builder.snapshot(team_id)
+    builder.prefetch()
+
+    # AI 응답 (스트림은 워커 스레드에서 소비)
+    worker = AIStreamWorker(
+        st.session_state.get('user_token'), message, context=context,
+        session_id=st.session_state.session_id, user_id=user_id, team_id=team_id,
+    )
+    worker.start()
+    st.session_state.ai_stream_worker = worker
+    _render_stream(worker)
+
+
+def _resume_stream():
+    """이전 실행에서 중단된(rerun) 스트림이 있으면 이어서 표시"""
+    worker = st.session_state.get('ai_stream_worker')
+    if worker:
+        _render_stream(worker)
+
+
+def _cancel_stream():
+    """진행 중인 스트림 중지"""
+    worker = st.session_state.pop('ai_stream_worker', None)
+    if worker:
+        worker.cancel()
+
 
-    # AI 응답
+@traced()
+def _render_stream(worker):
+    """워커 큐를 placeholder로 전달하며 응답 완료/중지/제한 시간 초과까지 대기"""
     with st.chat_message("assistant"):
         response_placeholder = st.empty()
-        response_placeholder.markdown("생각하는 중... ▌")
-        ai_response_content = ""
-
-        try:
-            for chunk in api_client.send_ai_message_stream(
-                message, context=context, session_id=st.session_state.session_id,
-                user_id=user_id, team_id=team_id
-            ):
-                if chunk and 'ai_response' in chunk:
-                    ai_response_content = chunk['ai_response']
-                if chunk and chunk.get('session_id'):
-                    st.session_state.session_id = chunk['session_id']
-
-            if ai_response_content:
-                displayed = ""
-                for char in ai_response_content:
-                    displayed += char
-                    response_placeholder.markdown(displayed + " ▌")
-                    time.sleep(0.01)
-                response_placeholder.markdown(ai_response_content)
+        # 내용이 그대로인 주기에도 보내는 빈 요소 (본문을 다시 보내지 않고 st 호출만 발생)
+        tick_placeholder = st.empty()
+        if st.button("생성 중지", key="stop_generating"):
+            worker.cancel()
+
+        shown = None
+        while not worker.drain() and not worker.cancelled:
+            if worker.expired():
+                worker.error = "응답 시간이 초과되었습니다."
+                worker.cancel()
+                break
+            # Streamlit은 st 호출 때만 리런 요청을 확인하므로 매 주기 한 번은 호출해야
+            # "생성 중지" 클릭 시 바로 중단됨 (응답이 멈춘 동안에도)
+            text = (worker.content + " ▌") if worker.content else f"생각하는 중... ({int(worker.elapsed())}초) ▌"
+            if text != shown:
+                response_placeholder.markdown(text)
+                shown = text
             else:
-                ai_response_content = "응답을 생성하지 못했습니다."
-                response_placeholder.markdown(ai_response_content)
-        except Exception as e:
-            ai_response_content = f"오류가 발생했습니다: {str(e)}"
-            response_placeholder.markdown(ai_response_content)
-
-    st.session_state.chat_history.append({
-        'role': 'assistant',
-        'content': ai_response_content,
-        'timestamp': datetime.now().isoformat()
-    })
+                tick_placeholder.empty()
+            time.sleep(AI_STREAM_POLL_INTERVAL)
+        worker.drain()
+
+        st.session_state.pop('ai_stream_worker', None)
+        if worker.session_id:
+            set_chat_session_id(worker.session_id)
+
+        ai_response_content = worker.content
+        if worker.cancelled and not worker.error:
+            ai_response_content = (ai_response_content + "\n\n" if ai_response_content else "") + "_(응답 생성이 중지되었습니다)_"
+        elif not ai_response_content:
+            ai_response_content = f"오류가 발생했습니다: {worker.error}" if worker.error else "응답을 생성하지 못했습니다."
+
+        append_chat_message('assistant', ai_response_content)
+
+        if worker.content and not worker.cancelled:
+            displayed = ""
+            for char in ai_response_content:
+                displayed += char
+                response_placeholder.markdown(displayed + " ▌")
+                time.sleep(0.01)
+        response_placeholder.markdown(ai_response_content)
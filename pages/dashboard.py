@@ -3,11 +3,19 @@ import pandas as pd
 from datetime import datetime, date, timedelta
 from components.api_client import PlandyAPIClient
 from components.auth import get_current_user
-from components.charts import create_burndown_chart, create_task_status_chart, create_member_workload_chart
-import plotly.express as px
-import plotly.graph_objects as go
-
-
+from components.dashboard_cache import (
+    get_dashboard_snapshot, invalidate_dashboard_snapshot, DASHBOARD_SNAPSHOT_TTL, DASHBOARD_LIVE_SNAPSHOT_TTL
+)
+from components.offline_sync import get_replica_sprints, sync_now
+from components.team_events import subscribe, show_live_watcher
+from components.charts import create_burndown_chart, create_task_status_chart, create_member_workload_chart, create_velocity_chart
+from components.sprint_analytics import (
+    load_completed_sprint_summaries, compute_velocity, forecast_completion, FORECAST_MAX_SPRINTS
+)
+from utils.instrumentation import traced
+
+
+@traced()
 def show_dashboard():
     """스프린트 대시보드 페이지 표시"""
     st.header("스프린트 대시보드")
@@ -25,9 +33,13 @@ def show_dashboard():
         st.markdown('<div class="flandy-card" style="border-radius: 12px; padding: 2rem; text-align: center; margin: 2rem 0;"><h3 style="margin-bottom: 1rem;">팀을 선택해주세요</h3><p>사이드바에서 팀을 선택하거나, \'팀 관리\' 메뉴에서 팀을 생성/참여하세요.</p></div>', unsafe_allow_html=True)
         return
 
+    # 팀 변경 알림으로 태스크/스프린트가 바뀌면 스냅샷을 만료시키고 다시 표시
+    # (차트는 변경이 있을 때만 다시 그림 - 주기적으로 실행되는 것은 버전 확인뿐)
+    show_live_watcher(api_client, team_id, ("tasks", "sprints"), "dashboard", on_change=invalidate_dashboard_snapshot)
+
     # 스프린트 목록 로드
     try:
-        sprints = api_client.get_sprints(team_id)
+        sprints = get_replica_sprints(api_client, team_id)
     except Exception as e:
         st.error(f"스프린트 목록을 불러오는 중 오류가 발생했습니다: {e}")
         return
@@ -71,6 +83,8 @@ def show_dashboard():
                 if st.button("활성화", key="activate_sprint", use_container_width=True):
                     try:
                         if api_client.activate_sprint(selected_sprint_id):
+                            invalidate_dashboard_snapshot(selected_sprint_id)
+                            sync_now(api_client)
                             st.success("스프린트가 활성화되었습니다!")
                             st.rerun()
                         else:
@@ -82,6 +96,8 @@ def show_dashboard():
                 if st.button("완료", key="complete_sprint", use_container_width=True):
                     try:
                         if api_client.complete_sprint(selected_sprint_id):
+                            invalidate_dashboard_snapshot(selected_sprint_id)
+                            sync_now(api_client)
                             st.success("스프린트가 완료되었습니다!")
                             st.rerun()
                         else:
@@ -91,9 +107,27 @@ def show_dashboard():
 
     st.markdown("---")
 
-    # 스프린트 대시보드 데이터 로드
+    _show_sprint_sections(api_client, team_id, sprints, selected_sprint)
+
+    st.markdown("---")
+
+    # 스프린트 생성 폼
+    with st.expander("새 스프린트 생성", expanded=False):
+        _show_create_sprint_form(api_client, team_id)
+
+
+@traced()
+def _show_sprint_sections(api_client, team_id, sprints, selected_sprint):
+    """스프린트 진행률/메트릭/차트/워크로드/벨로시티"""
+    selected_sprint_id = selected_sprint.get('id')
+    sprint_status = selected_sprint.get('status', 'planning')
+
+    subscription = subscribe(api_client, team_id)
+    # 스프린트 대시보드 데이터 로드 (스냅샷 캐시, 만료 시 변경분만 조건부 조회)
+    # 변경 알림이 연결되어 있으면 변경 시 만료되므로 주기적인 조건부 조회를 거의 하지 않음
+    ttl = DASHBOARD_LIVE_SNAPSHOT_TTL if subscription is not None and subscription.connected else DASHBOARD_SNAPSHOT_TTL
     try:
-        dashboard_data = api_client.get_sprint_dashboard(selected_sprint_id)
+        dashboard_data = get_dashboard_snapshot(api_client, selected_sprint_id, ttl=ttl)
     except Exception as e:
         st.error(f"대시보드 데이터를 불러오는 중 오류가 발생했습니다: {e}")
         return
@@ -184,9 +218,47 @@ def show_dashboard():
 
     st.markdown("---")
 
-    # 스프린트 생성 폼
-    with st.expander("새 스프린트 생성", expanded=False):
-        _show_create_sprint_form(api_client, team_id)
+    # 벨로시티 & 완료 예측
+    _show_velocity_section(api_client, sprints, sprint_status, total_points - completed_points)
+
+
+@traced()
+def _show_velocity_section(api_client, sprints, sprint_status, remaining_points):
+    """완료된 스프린트 벨로시티 차트와 남은 포인트 완료 예측"""
+    st.subheader("벨로시티 & 완료 예측")
+
+    summaries = load_completed_sprint_summaries(api_client.token, sprints)
+    if not summaries:
+        st.info("완료된 스프린트가 없어 벨로시티를 계산할 수 없습니다.")
+        return
+
+    velocity = compute_velocity(summaries)
+    rolling = [None if pd.isna(v) else round(float(v), 1) for v in velocity['rolling']]
+    fig = create_velocity_chart(summaries, rolling_average=rolling)
+    st.plotly_chart(fig, use_container_width=True)
+
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.metric("평균 벨로시티", f"{velocity['mean']:.1f}pt")
+    with col2:
+        st.metric("최근 평균", f"{velocity['recent_mean']:.1f}pt")
+    with col3:
+        st.metric("표준편차", f"{velocity['std']:.1f}pt")
+
+    if sprint_status == 'completed' or remaining_points <= 0:
+        return
+
+    forecast = forecast_completion(velocity['points'], remaining_points)
+    if forecast is None:
+        st.info("완료된 포인트 이력이 없어 완료 시점을 예측할 수 없습니다.")
+        return
+
+    lines = [
+        f"{p}% 확률로 {n}개 스프린트 이내" if n <= FORECAST_MAX_SPRINTS
+        else f"{p}% 확률로 {FORECAST_MAX_SPRINTS}개 스프린트 초과"
+        for p, n in forecast.items()
+    ]
+    st.caption(f"남은 {remaining_points}pt 완료 예측 (몬테카를로): " + " · ".join(lines))
 
 
 def _show_create_sprint_form(api_client, team_id):
@@ -216,6 +288,7 @@ def _show_create_sprint_form(api_client, team_id):
                 try:
                     result = api_client.create_sprint(team_id, data)
                     if result:
+                        sync_now(api_client)
                         st.success(f"스프린트 '{sprint_name}'이(가) 생성되었습니다!")
                         st.rerun()
                     else:
@@ -1,18 +1,24 @@
 import streamlit as st
-import pandas as pd
 from datetime import datetime, date, timedelta
 from components.api_client import PlandyAPIClient
-import plotly.express as px
-import plotly.graph_objects as go
+from components.offline_sync import get_replica_tasks, get_replica_schedule, write_record, show_sync_status
+from components.team_events import show_live_watcher
+from utils.helpers import group_schedules_by_day, group_schedules_by_hour
+from utils.instrumentation import traced
 
+@traced()
 def show_schedule():
     """스케줄 관리 페이지 표시"""
     st.header("📅 스케줄 관리")
+    show_sync_status()
     
     # API 클라이언트 초기화
     api_client = PlandyAPIClient()
     if 'user_token' in st.session_state:
         api_client.set_token(st.session_state.user_token)
+
+    # 팀 변경 알림으로 일정/태스크가 바뀌면 다시 표시
+    show_live_watcher(api_client, st.session_state.get('selected_team_id'), ("schedule", "tasks"), "schedule")
     
     # 뷰 선택
     view_type = st.radio(
@@ -56,9 +62,10 @@ def show_schedule():
         if view_type == "주간 뷰":
             start_date = week_start.isoformat()
             end_date = week_end.isoformat()
-            schedules = api_client.get_schedule(start_date=start_date, end_date=end_date)
+            schedules = get_replica_schedule(api_client, start_date=start_date, end_date=end_date)
         else:
-            schedules = api_client.get_schedule_by_date(selected_date.isoformat())
+            schedules = get_replica_schedule(api_client, start_date=selected_date.isoformat(),
+                                             end_date=selected_date.isoformat())
     
     # 뷰에 따른 표시
     if view_type == "주간 뷰":
@@ -69,25 +76,13 @@ def show_schedule():
         show_list_view(schedules, api_client)
     
 
+@traced()
 def show_week_view(schedules, week_start, api_client):
     """주간 뷰 표시"""
     st.subheader("📅 주간 스케줄")
     
     # 주간 데이터를 일별로 그룹화
-    week_schedules = {}
-    for i in range(7):
-        day = week_start + timedelta(days=i)
-        week_schedules[day] = []
-    
-    for schedule in schedules:
-        try:
-            starts_at = schedule.get('starts_at', '') or schedule.get('start_time', '')
-            start_time = datetime.fromisoformat(starts_at.replace('Z', '+00:00'))
-            schedule_date = start_time.date()
-            if schedule_date in week_schedules:
-                week_schedules[schedule_date].append(schedule)
-        except:
-            continue
+    week_schedules = group_schedules_by_day(schedules, week_start)
     
     # 주간 캘린더 표시
     days = ['월', '화', '수', '목', '금', '토', '일']
@@ -104,35 +99,24 @@ def show_week_view(schedules, week_start, api_client):
             for schedule in day_schedules:
                 show_schedule_card(schedule, api_client, compact=True)
 
+@traced()
 def show_day_view(schedules, selected_date, api_client):
     """일간 뷰 표시"""
     st.subheader(f"📅 {selected_date.strftime('%Y년 %m월 %d일')} 일정")
     
     if schedules:
-        # 시간순 정렬
-        schedules.sort(key=lambda x: x.get('starts_at', '') or x.get('start_time', ''))
-
-        # 시간대별 그룹화
-        time_slots = {}
-        for schedule in schedules:
-            try:
-                starts_at = schedule.get('starts_at', '') or schedule.get('start_time', '')
-                start_time = datetime.fromisoformat(starts_at.replace('Z', '+00:00'))
-                hour = start_time.hour
-                if hour not in time_slots:
-                    time_slots[hour] = []
-                time_slots[hour].append(schedule)
-            except:
-                continue
+        # 시간순 정렬 후 시간대별 그룹화
+        time_slots = group_schedules_by_hour(schedules)
         
         # 시간대별 표시
-        for hour in sorted(time_slots.keys()):
+        for hour in time_slots:
             st.markdown(f"### 🕐 {hour:02d}:00")
             for schedule in time_slots[hour]:
                 show_schedule_card(schedule, api_client)
     else:
         st.info("이 날짜에는 등록된 일정이 없습니다.")
 
+@traced()
 def show_list_view(schedules, api_client):
     """목록 뷰 표시"""
     st.subheader("📋 일정 목록")
@@ -233,7 +217,7 @@ def show_schedule_card(schedule, api_client, compact=False):
             with col2:
                 if state != 'completed':
                     if st.button("✅", key=f"complete_schedule_{schedule_id}", help="완료"):
-                        if api_client.update_schedule(schedule_id, state='completed'):
+                        if write_record(api_client, "schedule", "update", schedule_id, state='completed'):
                             st.success("일정이 완료되었습니다!")
                             st.rerun()
                         else:
@@ -241,7 +225,7 @@ def show_schedule_card(schedule, api_client, compact=False):
 
             with col3:
                 if st.button("🗑️", key=f"delete_schedule_{schedule_id}", help="삭제"):
-                    if api_client.delete_schedule(schedule_id):
+                    if write_record(api_client, "schedule", "delete", schedule_id):
                         st.success("일정이 삭제되었습니다!")
                         st.rerun()
                     else:
@@ -260,7 +244,7 @@ def show_schedule_form(api_client, default_date=None):
     if is_edit:
         st.subheader("✏️ 일정 수정")
         # 기존 일정 데이터 로드
-        schedules = api_client.get_schedule()
+        schedules = get_replica_schedule(api_client)
         schedule_data = next((s for s in schedules if s.get('id') == schedule_id), {})
     else:
         st.subheader("➕ 새 일정 추가")
@@ -268,7 +252,7 @@ def show_schedule_form(api_client, default_date=None):
     
     with st.form("schedule_form"):
         # 태스크 연결 (선택사항)
-        tasks = api_client.get_tasks()
+        tasks = get_replica_tasks(api_client)
         task_options = ["연결 안함"] + [f"{task.get('title', '제목 없음')} (ID: {task.get('id')})" for task in tasks]
 
         current_task_id = schedule_data.get('task_id')
@@ -339,8 +323,8 @@ def show_schedule_form(api_client, default_date=None):
             
             if is_edit:
                 # 수정
-                if api_client.update_schedule(
-                    schedule_id,
+                if write_record(
+                    api_client, "schedule", "update", schedule_id,
                     starts_at=start_datetime.isoformat(),
                     ends_at=end_datetime.isoformat(),
                     state=state,
@@ -355,7 +339,8 @@ def show_schedule_form(api_client, default_date=None):
                     st.error("일정 수정에 실패했습니다.")
             else:
                 # 생성
-                if api_client.create_schedule(
+                if write_record(
+                    api_client, "schedule", "create",
                     starts_at=start_datetime.isoformat(),
                     ends_at=end_datetime.isoformat(),
                     task_id=task_id,
@@ -1,12 +1,18 @@
 import streamlit as st
-import pandas as pd
 from datetime import datetime, date, timedelta
 from components.api_client import PlandyAPIClient
 from components.auth import get_current_user
+from components.dashboard_cache import invalidate_dashboard_snapshot
+from components.offline_sync import get_replica_tasks, get_replica_sprints, write_record, show_sync_status
+from components.team_events import show_live_watcher
+from utils.helpers import filter_tasks, sort_tasks, get_task_statistics
+from utils.instrumentation import traced
 
+@traced()
 def show_tasks():
     """태스크 관리 페이지 표시"""
     st.header("태스크 관리")
+    show_sync_status()
 
     # API 클라이언트 초기화
     api_client = PlandyAPIClient()
@@ -17,12 +23,15 @@ def show_tasks():
     team_id = st.session_state.get('selected_team_id')
     team_name = st.session_state.get('selected_team_name', '')
 
+    # 팀 변경 알림으로 태스크/스프린트가 바뀌면 다시 표시
+    show_live_watcher(api_client, team_id, ("tasks", "sprints"), "tasks")
+
     # 스프린트 목록 및 멤버 목록 로드
     sprints = []
     members = []
     if team_id:
         try:
-            sprints = api_client.get_sprints(team_id)
+            sprints = get_replica_sprints(api_client, team_id)
         except Exception:
             sprints = []
         try:
@@ -116,29 +125,24 @@ def show_tasks():
 
     # 태스크 데이터 로딩
     with st.spinner("태스크를 불러오는 중..."):
-        tasks = api_client.get_tasks(**filters)
-
-    # 스프린트 필터 적용 (클라이언트 사이드)
-    if sprint_filter != "전체" and sprint_filter in sprint_id_map:
-        selected_sprint_id = sprint_id_map[sprint_filter]
-        tasks = [t for t in tasks if t.get('sprint_id') == selected_sprint_id]
-
-    # 담당자 필터 적용 (클라이언트 사이드)
-    if assignee_filter != "전체" and assignee_filter in assignee_id_map:
-        selected_assignee_id = assignee_id_map[assignee_filter]
-        tasks = [t for t in tasks if t.get('assignee_id') == selected_assignee_id]
-
-    # 검색 필터 적용
-    if search_term:
-        tasks = [task for task in tasks if search_term.lower() in task.get('title', '').lower()]
+        tasks = get_replica_tasks(api_client, **filters)
+
+    # 스프린트/담당자/검색 필터 적용 (클라이언트 사이드)
+    tasks = filter_tasks(
+        tasks,
+        sprint_id=sprint_id_map.get(sprint_filter),
+        assignee_id=assignee_id_map.get(assignee_filter),
+        search_term=search_term,
+    )
 
     # 통계 정보
     col1, col2, col3, col4 = st.columns(4)
 
-    total_tasks = len(tasks)
-    pending_count = len([t for t in tasks if t.get('status') == 'pending'])
-    in_progress_count = len([t for t in tasks if t.get('status') == 'in_progress'])
-    completed_count = len([t for t in tasks if t.get('status') == 'completed'])
+    stats = get_task_statistics(tasks)
+    total_tasks = stats['total']
+    pending_count = stats['pending']
+    in_progress_count = stats['in_progress']
+    completed_count = stats['completed']
 
     with col1:
         st.metric("전체", total_tasks)
@@ -172,16 +176,7 @@ def show_tasks():
             )
 
         # 정렬 적용
-        if sort_by == "마감일":
-            tasks.sort(key=lambda x: x.get('deadline', ''), reverse=False)
-        elif sort_by == "우선순위":
-            priority_order = {'urgent': 4, 'high': 3, 'medium': 2, 'low': 1}
-            tasks.sort(key=lambda x: priority_order.get(x.get('priority', 'medium'), 2), reverse=True)
-        elif sort_by == "상태":
-            status_order = {'in_progress': 3, 'pending': 2, 'completed': 1, 'cancelled': 0}
-            tasks.sort(key=lambda x: status_order.get(x.get('status', 'pending'), 2), reverse=True)
-        else:  # 생성일
-            tasks.sort(key=lambda x: x.get('created_at', ''), reverse=True)
+        tasks = sort_tasks(tasks, sort_by)
 
         # 태스크 카드들 표시
         for task in tasks:
@@ -307,21 +302,24 @@ def show_task_card(task, api_client, members=None):
                     st.rerun()
             elif action == "start":
                 if st.button(label, key=f"start_{task_id}", use_container_width=True):
-                    if api_client.update_task(task_id, status='in_progress'):
+                    if write_record(api_client, "tasks", "update", task_id, status='in_progress'):
+                        invalidate_dashboard_snapshot()
                         st.success("태스크를 시작했습니다!")
                         st.rerun()
                     else:
                         st.error("태스크 시작 처리에 실패했습니다.")
             elif action == "complete":
                 if st.button(label, key=f"complete_{task_id}", use_container_width=True):
-                    if api_client.update_task(task_id, status='completed'):
+                    if write_record(api_client, "tasks", "update", task_id, status='completed'):
+                        invalidate_dashboard_snapshot()
                         st.success("태스크가 완료되었습니다!")
                         st.rerun()
                     else:
                         st.error("태스크 완료 처리에 실패했습니다.")
             elif action == "delete":
                 if st.button(label, key=f"delete_{task_id}", use_container_width=True):
-                    if api_client.delete_task(task_id):
+                    if write_record(api_client, "tasks", "delete", task_id):
+                        invalidate_dashboard_snapshot()
                         st.success("태스크가 삭제되었습니다!")
                         st.rerun()
                     else:
@@ -340,7 +338,7 @@ def show_task_form(api_client, sprints=None, members=None):
     if is_edit:
         st.subheader("태스크 수정")
         # 기존 태스크 데이터 로드
-        tasks = api_client.get_tasks()
+        tasks = get_replica_tasks(api_client)
         task_data = next((t for t in tasks if t.get('id') == task_id), {})
     else:
         st.subheader("새 태스크 추가")
@@ -494,7 +492,8 @@ def show_task_form(api_client, sprints=None, members=None):
                 if team_id:
                     update_data['team_id'] = team_id
 
-                if api_client.update_task(task_id, **update_data):
+                if write_record(api_client, "tasks", "update", task_id, **update_data):
+                    invalidate_dashboard_snapshot()
                     st.success("태스크가 수정되었습니다!")
                     st.session_state.show_task_form = False
                     if 'edit_task_id' in st.session_state:
@@ -504,7 +503,8 @@ def show_task_form(api_client, sprints=None, members=None):
                     st.error("태스크 수정에 실패했습니다.")
             else:
                 # 생성
-                if api_client.create_task(
+                if write_record(
+                    api_client, "tasks", "create",
                     title=title,
                     description=description,
                     priority=priority,
@@ -515,6 +515,7 @@ def show_task_form(api_client, sprints=None, members=None):
                     assignee_id=assignee_id,
                     team_id=team_id,
                 ):
+                    invalidate_dashboard_snapshot()
                     st.success("태스크가 추가되었습니다!")
                     st.session_state.show_task_form = False
                     st.rerun()
@@ -1,8 +1,11 @@
 import streamlit as st
 from components.api_client import PlandyAPIClient
 from components.auth import get_current_user
+from components.team_cache import get_cached_teams, invalidate_teams
+from utils.instrumentation import traced
 
 
+@traced()
 def show_team():
     """팀 관리 페이지 표시"""
     st.header("팀 관리")
@@ -28,10 +31,11 @@ def show_team():
         _show_join_team_form(api_client)
 
 
+@traced()
 def _show_my_teams(api_client):
     """내 팀 목록 표시"""
     try:
-        teams = api_client.get_teams()
+        teams = get_cached_teams(api_client)
     except Exception as e:
         st.error(f"팀 목록을 불러오는 중 오류가 발생했습니다: {e}")
         return
@@ -87,6 +91,7 @@ def _show_my_teams(api_client):
                                 if st.button("변경", key=f"change_role_{team_id}_{member_id}"):
                                     try:
                                         if api_client.update_member_role(team_id, member_id, new_role):
+                                            invalidate_teams()
                                             st.success(f"{member_name}의 역할이 변경되었습니다.")
                                             st.rerun()
                                         else:
@@ -102,6 +107,7 @@ def _show_my_teams(api_client):
                             if st.button("제거", key=f"remove_{team_id}_{member_id}"):
                                 try:
                                     if api_client.remove_member(team_id, member_id):
+                                        invalidate_teams()
                                         st.success(f"{member_name}이(가) 팀에서 제거되었습니다.")
                                         st.rerun()
                                     else:
@@ -120,6 +126,7 @@ def _show_my_teams(api_client):
                     if st.button("팀 탈퇴", key=f"leave_{team_id}", use_container_width=True):
                         try:
                             if api_client.leave_team(team_id):
+                                invalidate_teams()
                                 st.success("팀에서 탈퇴했습니다.")
                                 # 선택된 팀이 탈퇴한 팀이면 초기화
                                 if st.session_state.get('selected_team_id') == team_id:
@@ -137,6 +144,7 @@ def _show_my_teams(api_client):
                     if st.button("팀 삭제", key=f"delete_team_{team_id}", use_container_width=True, type="primary"):
                         try:
                             if api_client.delete_team(team_id):
+                                invalidate_teams()
                                 st.success("팀이 삭제되었습니다.")
                                 if st.session_state.get('selected_team_id') == team_id:
                                     st.session_state.selected_team_id = None
@@ -165,6 +173,7 @@ def _show_create_team_form(api_client):
                 try:
                     result = api_client.create_team(team_name, team_desc)
                     if result:
+                        invalidate_teams()
                         st.success(f"'{team_name}' 팀이 생성되었습니다!")
                         # 새로 만든 팀을 선택
                         st.session_state.selected_team_id = result.get('id')
@@ -192,6 +201,7 @@ def _show_join_team_form(api_client):
                 try:
                     result = api_client.join_team(invite_code)
                     if result:
+                        invalidate_teams()
                         st.success("팀에 성공적으로 참여했습니다!")
                         st.session_state.selected_team_id = result.get('id')
                         st.session_state.selected_team_name = result.get('name', '')
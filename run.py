@@ -3,43 +3,48 @@
 Plandy Streamlit 프론트엔드 실행 스크립트
 """
 
+import importlib.util
 import subprocess
 import sys
 import os
+import threading
+import urllib.error
+import urllib.request
+
+# 실행에 필요한 패키지 (import 하지 않고 설치 여부만 확인)
+REQUIRED_PACKAGES = ["streamlit", "requests", "pandas", "plotly", "numpy"]
+# 백엔드 헬스 체크 주소와 타임아웃 (초)
+BACKEND_HEALTH_URL = os.environ.get("FLANDY_API_URL", "http://127.0.0.1:8000/api") + "/health"
+BACKEND_PROBE_TIMEOUT = 5
 
 def check_requirements():
     """필요한 패키지가 설치되어 있는지 확인"""
-    try:
-        import streamlit
-        import requests
-        import pandas
-        import plotly
+    missing = [name for name in REQUIRED_PACKAGES if importlib.util.find_spec(name) is None]
+    if not missing:
         print("✅ 모든 필요한 패키지가 설치되어 있습니다.")
         return True
-    except ImportError as e:
-        print(f"❌ 필요한 패키지가 설치되지 않았습니다: {e}")
-        print("다음 명령어로 패키지를 설치해주세요:")
-        print("pip install -r requirements.txt")
-        return False
+    print(f"❌ 필요한 패키지가 설치되지 않았습니다: {', '.join(missing)}")
+    print("다음 명령어로 패키지를 설치해주세요:")
+    print("pip install -r requirements.txt")
+    return False
 
 def check_backend_connection():
     """백엔드 서버 연결 확인"""
     try:
-        import requests
-        response = requests.get("http://127.0.0.1:8000/api/health", timeout=5)
-        if response.status_code == 200:
-            print("✅ 백엔드 서버가 정상적으로 실행 중입니다.")
+        with urllib.request.urlopen(BACKEND_HEALTH_URL, timeout=BACKEND_PROBE_TIMEOUT):
+            print("\n✅ 백엔드 서버가 정상적으로 실행 중입니다.")
             return True
-        else:
-            print(f"❌ 백엔드 서버 응답 오류: {response.status_code}")
-            return False
-    except requests.exceptions.ConnectionError:
-        print("❌ 백엔드 서버에 연결할 수 없습니다.")
+    except urllib.error.HTTPError as e:
+        print(f"\n❌ 백엔드 서버 응답 오류: {e.code}")
+        return False
+    except (urllib.error.URLError, OSError):
+        print("\n❌ 백엔드 서버에 연결할 수 없습니다.")
         print("백엔드 서버가 실행 중인지 확인해주세요:")
         print("cd ../plandy-backend && php artisan serve --host=127.0.0.1 --port=8000")
+        print("⚠️  프론트엔드는 계속 실행되며, 앱 상단에 백엔드 상태가 표시됩니다.")
         return False
     except Exception as e:
-        print(f"❌ 백엔드 서버 확인 중 오류: {e}")
+        print(f"\n❌ 백엔드 서버 확인 중 오류: {e}")
         return False
 
 def main():
@@ -51,30 +56,36 @@ def main():
     if not check_requirements():
         sys.exit(1)
     
-    # 백엔드 연결 확인
-    print("\n🔍 백엔드 서버 연결 확인 중...")
-    if not check_backend_connection():
-        print("\n⚠️  백엔드 서버가 실행되지 않았지만 프론트엔드는 시작합니다.")
-        print("   로그인 후 백엔드 서버를 시작해주세요.")
-    
-    print("\n🌐 Streamlit 서버 시작 중...")
+    print("\n🌐 Streamlit 서버 시작 중... (백엔드 연결은 동시에 확인)")
     print("=" * 50)
     
     # Streamlit 실행
+    process = None
     try:
         # 프로젝트 루트 디렉토리로 이동
         project_root = os.path.dirname(os.path.abspath(__file__))
         os.chdir(project_root)
+
+        # 정적 파일 폴더 (로고 등은 앱에서 처음 사용할 때 복사됨)
+        os.makedirs(os.path.join("src", "static"), exist_ok=True)
         
         # Streamlit 실행
-        subprocess.run([
+        process = subprocess.Popen([
             sys.executable, "-m", "streamlit", "run", 
             "src/app.py",
             "--server.port", "8501",
             "--server.address", "127.0.0.1",
-            "--browser.gatherUsageStats", "false"
+            "--browser.gatherUsageStats", "false",
+            "--server.enableStaticServing", "true"
         ])
+
+        # 백엔드 연결 확인 (서버 시작을 기다리게 하지 않음)
+        threading.Thread(target=check_backend_connection, daemon=True).start()
+
+        process.wait()
     except KeyboardInterrupt:
+        if process is not None:
+            process.wait()
         print("\n\n👋 Plandy 프론트엔드를 종료합니다.")
     except Exception as e:
         print(f"\n❌ Streamlit 실행 중 오류가 발생했습니다: {e}")
@@ -23,20 +23,43 @@ if project_root not in sys.path:
 # 현재 작업 디렉토리를 프로젝트 루트로 변경
 os.chdir(project_root)
 
+import importlib
+
 try:
     from components.sidebar import show_sidebar
-    from pages.dashboard import show_dashboard
-    from pages.tasks import show_tasks
-    from pages.schedule import show_schedule
-    from pages.team import show_team
-    from pages.ai_assistant import show_ai_assistant
     from components.auth import check_auth_status
+    from components.backend_status import show_backend_banner
+    from utils.instrumentation import rerun_trace, show_trace_overlay, span
+    from utils.metrics import dump_metrics_if_due, start_metrics_server
 except ImportError as e:
     st.error(f"모듈 import 오류: {e}")
     st.error(f"현재 작업 디렉토리: {os.getcwd()}")
     st.error(f"Python 경로: {sys.path[:3]}")
     st.stop()
 
+# 페이지 이름 → (모듈, 함수). pandas/plotly를 쓰는 페이지는 처음 열 때 import
+PAGES = {
+    "스프린트 대시보드": ("pages.dashboard", "show_dashboard"),
+    "태스크 관리": ("pages.tasks", "show_tasks"),
+    "스케줄 관리": ("pages.schedule", "show_schedule"),
+    "팀 관리": ("pages.team", "show_team"),
+    "AI 어시스턴트": ("pages.ai_assistant", "show_ai_assistant"),
+}
+
+
+def load_page(page_name):
+    """선택된 페이지의 show 함수 로드 (모듈은 첫 사용 시 import 후 sys.modules에 캐시)"""
+    module_name, func_name = PAGES[page_name]
+    try:
+        with span("page.import", module=module_name):
+            module = importlib.import_module(module_name)
+    except ImportError as e:
+        st.error(f"모듈 import 오류: {e}")
+        st.error(f"현재 작업 디렉토리: {os.getcwd()}")
+        st.error(f"Python 경로: {sys.path[:3]}")
+        st.stop()
+    return getattr(module, func_name)
+
 # 페이지 설정
 st.set_page_config(
     page_title="Flandy - 팀 스프린트 도우미",
@@ -52,6 +75,9 @@ apply_custom_css()
 def main():
     # 사이드바에서 페이지 선택
     selected_page = show_sidebar()
+
+    # 백엔드 연결 실패 시 안내 배너
+    show_backend_banner()
     
     # 인증 상태 확인
     if not check_auth_status():
@@ -61,18 +87,16 @@ def main():
         return
     
     # 선택된 페이지에 따라 콘텐츠 표시
-    if selected_page == "스프린트 대시보드":
-        show_dashboard()
-    elif selected_page == "태스크 관리":
-        show_tasks()
-    elif selected_page == "스케줄 관리":
-        show_schedule()
-    elif selected_page == "팀 관리":
-        show_team()
-    elif selected_page == "AI 어시스턴트":
-        show_ai_assistant()
-    elif selected_page is None:
-        pass
+    if selected_page in PAGES:
+        load_page(selected_page)()
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    # API 메트릭: FLANDY_METRICS_PORT가 있으면 /metrics 제공, 주기적으로 파일 덤프
+    # (st.rerun()이 스크립트를 중간에 끝내므로 페이지 실행 전에 호출)
+    start_metrics_server()
+    dump_metrics_if_due()
+
+    # 리런 계측 (FLANDY_TRACE=1 또는 ?trace=1 일 때만 기록)
+    with rerun_trace():
+        main()
+        show_trace_overlay()
\ No newline at end of file
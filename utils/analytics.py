@@ -0,0 +1,129 @@
+"""
+일정 분석 유틸리티
+주/월 단위 일정 블록을 타입이 지정된 DataFrame으로 변환하고
+일별 카테고리 합계, 워라밸 점수, 완료 개수를 한 번의 groupby로 계산
+"""
+
+from datetime import datetime, date
+from typing import Iterable, Dict, Optional, Union
+
+import numpy as np
+import pandas as pd
+from config.constants import CATEGORY_COLORS
+
+# 카테고리/상태 (categorical dtype)
+SCHEDULE_CATEGORIES = list(CATEGORY_COLORS)
+SCHEDULE_STATES = ['scheduled', 'in_progress', 'completed', 'cancelled']
+CATEGORY_DTYPE = pd.CategoricalDtype(SCHEDULE_CATEGORIES)
+STATE_DTYPE = pd.CategoricalDtype(SCHEDULE_STATES)
+
+# 워라밸 점수 기준 비율 (업무 60%, 휴식 40%)
+IDEAL_WORK_RATIO = 0.6
+IDEAL_REST_RATIO = 0.4
+
+# 시간대가 포함된 시각은 이 시간대의 현지 시각으로 변환
+LOCAL_TIMEZONE = "Asia/Seoul"
+
+
+def balance_score(work_minutes, rest_minutes, total_minutes):
+    """워라밸 점수 계산 (스칼라/배열 모두 지원, 총 시간 0이면 0점)"""
+    work = np.asarray(work_minutes, dtype=float)
+    rest = np.asarray(rest_minutes, dtype=float)
+    total = np.asarray(total_minutes, dtype=float)
+    safe_total = np.where(total > 0, total, 1.0)
+
+    work_score = np.maximum(0, 100 - np.abs(work / safe_total - IDEAL_WORK_RATIO) * 200)
+    rest_score = np.maximum(0, 100 - np.abs(rest / safe_total - IDEAL_REST_RATIO) * 200)
+    score = np.where(total > 0, (work_score + rest_score) / 2, 0).astype(int)
+    return score if score.ndim else int(score)
+
+
+def _to_local_datetime(values: pd.Series) -> pd.Series:
+    """ISO 8601 문자열을 현지 시각 datetime64로 변환"""
+    try:
+        parsed = pd.to_datetime(values, format='ISO8601')
+    except (ValueError, TypeError):
+        # 서로 다른 UTC 오프셋이 섞인 경우
+        parsed = pd.to_datetime(values, format='ISO8601', utc=True)
+    if parsed.dt.tz is not None:
+        parsed = parsed.dt.tz_convert(LOCAL_TIMEZONE).dt.tz_localize(None)
+    return parsed
+
+
+def build_schedule_frame(blocks: Union[pd.DataFrame, Iterable[Dict]],
+                         default_date: Optional[date] = None) -> pd.DataFrame:
+    """일정 블록 → 타입 지정 DataFrame
+
+    백엔드 형식(starts_at/ends_at)과 샘플 형식(time 'HH:MM' + duration 분)을 모두 지원.
+    결과 컬럼: date, start, end (datetime64), duration (int 분), category, state (categorical), task
+    """
+    raw = blocks if isinstance(blocks, pd.DataFrame) else pd.DataFrame.from_records(list(blocks))
+    if raw.empty:
+        return pd.DataFrame({
+            'date': pd.Series(dtype='datetime64[ns]'),
+            'start': pd.Series(dtype='datetime64[ns]'),
+            'end': pd.Series(dtype='datetime64[ns]'),
+            'duration': pd.Series(dtype='int64'),
+            'category': pd.Series(dtype=CATEGORY_DTYPE),
+            'state': pd.Series(dtype=STATE_DTYPE),
+            'task': pd.Series(dtype='string'),
+        })
+    frame = pd.DataFrame(index=raw.index)
+
+    if 'starts_at' in raw:
+        frame['start'] = _to_local_datetime(raw['starts_at'])
+        if 'ends_at' in raw:
+            frame['end'] = _to_local_datetime(raw['ends_at'])
+        else:
+            frame['end'] = frame['start']
+        duration = (frame['end'] - frame['start']).dt.total_seconds() // 60
+    else:
+        day = pd.to_datetime(raw['date']) if 'date' in raw else pd.Timestamp(default_date or date.today())
+        # 'HH:MM' 값은 최대 1440종이므로 고유값만 파싱 후 코드로 펼침
+        codes, uniques = pd.factorize(raw['time'].astype(str))
+        clock = pd.to_datetime(pd.Series(uniques), format='%H:%M')
+        minutes = (clock.dt.hour * 60 + clock.dt.minute).to_numpy()[codes]
+        frame['start'] = day + pd.to_timedelta(minutes, unit='m')
+        duration = raw['duration'] if 'duration' in raw else pd.Series(0, index=raw.index)
+        frame['end'] = frame['start'] + pd.to_timedelta(duration, unit='m')
+
+    frame['duration'] = pd.Series(duration, index=raw.index).fillna(0).clip(lower=0).astype('int64')
+    frame['date'] = frame['start'].dt.normalize()
+
+    category = raw['category'] if 'category' in raw else pd.Series('기타', index=raw.index)
+    frame['category'] = category.astype(CATEGORY_DTYPE).fillna('기타')
+    state = raw['state'] if 'state' in raw else pd.Series('scheduled', index=raw.index)
+    frame['state'] = state.astype(STATE_DTYPE)
+    if 'task' in raw:
+        tasks = raw['task']
+        if tasks.dtype == object and 'starts_at' in raw:
+            # 백엔드 형식은 task가 {'title': ...} dict
+            tasks = tasks.map(lambda t: t.get('title', '') if isinstance(t, dict) else t)
+        frame['task'] = tasks.astype('string')
+    else:
+        frame['task'] = pd.Series('', index=raw.index, dtype='string')
+
+    return frame[['date', 'start', 'end', 'duration', 'category', 'state', 'task']]
+
+
+def summarize_schedule(frame: pd.DataFrame, now: Optional[datetime] = None) -> pd.DataFrame:
+    """일별 지표를 한 번의 groupby로 계산
+
+    결과 (index: date): 카테고리별 분 합계 컬럼, total_minutes, balance_score, completed, blocks
+    완료 기준: state가 completed이거나 종료 시각이 now 이전
+    """
+    now = pd.Timestamp(now or datetime.now())
+
+    values = pd.get_dummies(frame['category'], dtype='int64').mul(frame['duration'], axis=0)
+    values['completed'] = ((frame['state'] == 'completed') | (frame['end'] <= now)).astype('int64')
+    values['blocks'] = 1
+
+    daily = values.groupby(frame['date']).sum()
+    daily['total_minutes'] = daily[SCHEDULE_CATEGORIES].sum(axis=1)
+    daily['balance_score'] = balance_score(daily['업무'], daily['휴식'], daily['total_minutes'])
+    return daily
+
+
+def category_totals(daily: pd.DataFrame) -> pd.Series:
+    """summarize_schedule 결과에서 기간 전체 카테고리별 분 합계"""
+    return daily[SCHEDULE_CATEGORIES].sum()
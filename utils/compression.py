@@ -0,0 +1,53 @@
+"""
+응답 압축 협상
+설치된 디코더(urllib3 기준: gzip/deflate 기본, brotli, zstd 선택)만 Accept-Encoding으로 알리고,
+큰 응답 본문은 스트리밍으로 받으며 청크 단위로 압축을 풀어 전송 크기(wire)와 본문 크기를 함께 반환
+
+선택 패키지: brotli(또는 brotlicffi) → br, Python 3.14 미만은 backports.zstd → zstd
+"""
+
+from typing import Tuple
+
+import requests
+from urllib3.util.request import ACCEPT_ENCODING as URLLIB3_ACCEPT_ENCODING
+
+# 선호 순서 (앞쪽일수록 높은 q 값) - zstd는 압축 해제가 가장 빠르고 br은 압축률이 가장 높음
+ENCODING_PREFERENCE = ("zstd", "br", "gzip", "deflate")
+# 이 프로세스에서 풀 수 있는 압축 (urllib3가 디코더를 찾은 것만)
+SUPPORTED_ENCODINGS = tuple(
+    name for name in ENCODING_PREFERENCE if name in URLLIB3_ACCEPT_ENCODING.split(",")
+)
+# 스트리밍 수신 청크 크기 (bytes) - requests 기본값(10 KB)보다 크게 잡아 큰 목록의 반복 횟수를 줄임
+STREAM_CHUNK_SIZE = 64 * 1024
+
+
+def accept_encoding_header() -> str:
+    """Accept-Encoding 헤더 값 (예: 'zstd, br;q=0.9, gzip;q=0.8, deflate;q=0.7')"""
+    values = []
+    for i, name in enumerate(SUPPORTED_ENCODINGS):
+        q = round(1.0 - i * 0.1, 1)
+        values.append(name if q == 1.0 else f"{name};q={q}")
+    return ", ".join(values) or "identity"
+
+
+# 요청마다 다시 만들지 않도록 미리 계산
+ACCEPT_ENCODING = accept_encoding_header()
+
+
+def read_body(response: requests.Response, chunk_size: int = STREAM_CHUNK_SIZE) -> Tuple[bytes, int, str]:
+    """stream=True 응답의 본문을 청크 단위로 받으며 압축 해제 (전체 압축 본문을 메모리에 두지 않음)
+
+    본문을 iter_content로 읽으므로 이후 response.content는 쓸 수 없고, 반환한 본문을 사용한다.
+    (본문, 전송 bytes, Content-Encoding) 반환 - 압축되지 않았으면 전송 bytes는 본문 길이와 같다.
+    """
+    encoding = response.headers.get("Content-Encoding", "identity").strip().lower() or "identity"
+    if response.raw is None:
+        body = response.content
+        return body, len(body), encoding
+    try:
+        # response.content와 같은 경로(iter_content)로 읽되 청크만 크게 - 디코딩 오류도 requests 예외로 변환됨
+        body = b"".join(response.iter_content(chunk_size))
+    except BaseException:
+        response.close()
+        raise
+    return body, response.raw.tell() or len(body), encoding
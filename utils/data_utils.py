@@ -5,6 +5,7 @@
 
 import pandas as pd
 from datetime import datetime
+from utils.analytics import balance_score
 
 
 def load_sample_data():
@@ -24,25 +25,10 @@ def load_sample_data():
 
 
 def calculate_worklife_score(df):
-    """워라벨 점수 계산"""
-    work_time = df[df['category'] == '업무']['duration'].sum()
-    rest_time = df[df['category'] == '휴식']['duration'].sum()
-    total_time = df['duration'].sum()
-    
-    if total_time == 0:
-        return 0
-    
-    work_ratio = work_time / total_time
-    rest_ratio = rest_time / total_time
-    
-    # 워라벨 점수 계산 (업무 60%, 휴식 40% 기준)
-    ideal_work_ratio = 0.6
-    ideal_rest_ratio = 0.4
-    
-    work_score = max(0, 100 - abs(work_ratio - ideal_work_ratio) * 200)
-    rest_score = max(0, 100 - abs(rest_ratio - ideal_rest_ratio) * 200)
-    
-    return int((work_score + rest_score) / 2)
+    """워라벨 점수 계산 (업무 60%, 휴식 40% 기준)"""
+    category_time = df.groupby('category')['duration'].sum()
+    # groupby는 분류가 없는(NaN) 행을 빼므로 전체 시간은 원본에서 합산
+    return balance_score(category_time.get('업무', 0), category_time.get('휴식', 0), df['duration'].sum())
 
 
 def get_current_time():
@@ -51,8 +37,9 @@ def get_current_time():
 
 
 def get_completed_tasks_count(df):
-    """완료된 일정 개수 계산"""
-    current_time = get_current_time()
-    completed_tasks = len(df[df['time'] <= current_time])
+    """완료된 일정 개수 계산 (시작 시각이 현재 시각 이전인 일정)"""
+    now = datetime.now()
+    start_minutes = pd.to_timedelta(df['time'].astype(str) + ':00').dt.total_seconds() // 60
+    completed_tasks = int((start_minutes <= now.hour * 60 + now.minute).sum())
     total_tasks = len(df)
     return completed_tasks, total_tasks
@@ -1,5 +1,5 @@
 from datetime import datetime, date, timedelta
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 import streamlit as st
 
 def format_datetime(dt_string: str) -> str:
@@ -131,6 +131,58 @@ def sort_tasks_by_deadline(tasks: List[Dict]) -> List[Dict]:
     """마감일별 태스크 정렬"""
     return sorted(tasks, key=lambda x: x.get('deadline', ''), reverse=False)
 
+def filter_tasks(tasks: List[Dict], sprint_id: Optional[int] = None, assignee_id: Optional[int] = None,
+                 search_term: str = "") -> List[Dict]:
+    """스프린트/담당자/제목 검색 필터를 한 번의 순회로 적용"""
+    term = search_term.lower() if search_term else ""
+    return [
+        t for t in tasks
+        if (sprint_id is None or t.get('sprint_id') == sprint_id)
+        and (assignee_id is None or t.get('assignee_id') == assignee_id)
+        and (not term or term in (t.get('title') or '').lower())
+    ]
+
+# 정렬 기준 (화면 표시 이름 → (정렬 키, 내림차순 여부))
+TASK_PRIORITY_ORDER = {'urgent': 4, 'high': 3, 'medium': 2, 'low': 1}
+TASK_STATUS_ORDER = {'in_progress': 3, 'pending': 2, 'completed': 1, 'cancelled': 0}
+TASK_SORT_KEYS = {
+    "생성일": (lambda x: x.get('created_at') or '', True),
+    "마감일": (lambda x: x.get('deadline') or '', False),
+    "우선순위": (lambda x: TASK_PRIORITY_ORDER.get(x.get('priority', 'medium'), 2), True),
+    "상태": (lambda x: TASK_STATUS_ORDER.get(x.get('status', 'pending'), 2), True),
+}
+
+def sort_tasks(tasks: List[Dict], sort_by: str) -> List[Dict]:
+    """정렬 기준 이름으로 태스크 정렬 (알 수 없는 기준은 생성일)"""
+    key, reverse = TASK_SORT_KEYS.get(sort_by, TASK_SORT_KEYS["생성일"])
+    return sorted(tasks, key=key, reverse=reverse)
+
+def get_schedule_start(schedule: Dict) -> Optional[datetime]:
+    """일정 시작 시각 파싱 (starts_at 또는 start_time, 실패 시 None)"""
+    starts_at = schedule.get('starts_at', '') or schedule.get('start_time', '')
+    try:
+        return datetime.fromisoformat(starts_at.replace('Z', '+00:00'))
+    except (AttributeError, ValueError):
+        return None
+
+def group_schedules_by_day(schedules: List[Dict], week_start: date) -> Dict[date, List[Dict]]:
+    """주 시작일부터 7일간 날짜별 일정 묶음 (범위 밖 일정은 제외)"""
+    week = {week_start + timedelta(days=i): [] for i in range(7)}
+    for schedule in schedules:
+        start_time = get_schedule_start(schedule)
+        if start_time and start_time.date() in week:
+            week[start_time.date()].append(schedule)
+    return week
+
+def group_schedules_by_hour(schedules: List[Dict]) -> Dict[int, List[Dict]]:
+    """시작 시각 순으로 정렬한 뒤 시간대(시)별 일정 묶음"""
+    slots = {}
+    for schedule in sorted(schedules, key=lambda x: x.get('starts_at', '') or x.get('start_time', '')):
+        start_time = get_schedule_start(schedule)
+        if start_time:
+            slots.setdefault(start_time.hour, []).append(schedule)
+    return dict(sorted(slots.items()))
+
 def get_habit_completion_rate(habits: List[Dict]) -> float:
     """습관 완료율 계산"""
     if not habits:
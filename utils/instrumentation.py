@@ -0,0 +1,263 @@
+"""
+리런 계측
+페이지 한 번 실행(rerun) 동안의 구간(span) 트리를 모아 개발자 오버레이로 보여주고,
+OpenTelemetry OTLP/JSON 형식으로 로컬 파일에 내보내기
+
+FLANDY_TRACE=1 이면 모든 리런을 기록해 파일로 내보내고,
+URL에 ?trace=1 을 붙이거나 FLANDY_TRACE_OVERLAY=1 이면 사이드바에 구간 트리를 표시.
+둘 다 꺼져 있으면 span()은 아무것도 기록하지 않는다.
+"""
+
+import contextvars
+import json
+import os
+import secrets
+import threading
+import time
+from contextlib import contextmanager
+from functools import wraps
+from typing import Any, Dict, List, Optional
+
+import streamlit as st
+from config.constants import LOCAL_CACHE_DIR
+
+# 모든 리런을 기록해 파일로 내보낼지 여부
+TRACE_ENABLED = os.environ.get("FLANDY_TRACE", "") not in ("", "0")
+# 오버레이 항상 표시 (개발용)
+TRACE_OVERLAY_ENABLED = os.environ.get("FLANDY_TRACE_OVERLAY", "") not in ("", "0")
+# 내보내기 파일 (리런 하나당 OTLP/JSON 한 줄)
+TRACE_EXPORT_PATH = os.environ.get("FLANDY_TRACE_FILE", os.path.join(LOCAL_CACHE_DIR, "traces.jsonl"))
+# 리런 하나에서 기록할 최대 구간 수 (반복문 안의 구간이 폭주하지 않도록)
+TRACE_MAX_SPANS = 500
+# 오버레이에서 이보다 짧은 구간은 생략 (ms)
+OVERLAY_MIN_DURATION_MS = 0.5
+# 내보내는 스팬의 서비스/계측 범위 이름
+TRACE_SERVICE_NAME = "flandy-frontend"
+
+_current_span: contextvars.ContextVar = contextvars.ContextVar("flandy_current_span", default=None)
+_export_lock = threading.Lock()
+
+
+class Span:
+    """측정 구간 하나 (시작/종료 시각, 속성, 하위 구간)"""
+
+    __slots__ = ("name", "trace", "span_id", "parent", "attributes", "children",
+                 "start_ns", "end_ns", "error")
+
+    def __init__(self, name: str, trace: "Trace", parent: Optional["Span"] = None,
+                 attributes: Optional[Dict[str, Any]] = None):
+        self.name = name
+        self.trace = trace
+        self.span_id = secrets.token_hex(8)
+        self.parent = parent
+        self.attributes = dict(attributes or {})
+        self.children: List["Span"] = []
+        self.start_ns = time.time_ns()
+        self.end_ns: Optional[int] = None
+        self.error: Optional[str] = None
+
+    def set_attribute(self, key: str, value: Any):
+        self.attributes[key] = value
+
+    @property
+    def duration_ms(self) -> float:
+        end_ns = self.end_ns if self.end_ns is not None else time.time_ns()
+        return (end_ns - self.start_ns) / 1e6
+
+    @property
+    def self_ms(self) -> float:
+        """하위 구간을 뺀 자체 시간 (Streamlit 요소 생성 등)"""
+        return max(0.0, self.duration_ms - sum(child.duration_ms for child in self.children))
+
+    def to_otlp(self) -> Dict:
+        """OTLP/JSON 스팬"""
+        span = {
+            "traceId": self.trace.trace_id,
+            "spanId": self.span_id,
+            "name": self.name,
+            "kind": 1,
+            "startTimeUnixNano": str(self.start_ns),
+            "endTimeUnixNano": str(self.end_ns if self.end_ns is not None else time.time_ns()),
+            "attributes": [_otlp_attribute(k, v) for k, v in self.attributes.items()],
+            "status": {"code": 2, "message": self.error} if self.error else {"code": 1},
+        }
+        if self.parent is not None:
+            span["parentSpanId"] = self.parent.span_id
+        return span
+
+
+class Trace:
+    """리런 하나의 구간 트리"""
+
+    def __init__(self, name: str, attributes: Optional[Dict[str, Any]] = None):
+        self.trace_id = secrets.token_hex(16)
+        self.span_count = 0
+        self.dropped = 0
+        self.root = Span(name, self, attributes=attributes)
+
+    def iter_spans(self):
+        stack = [self.root]
+        while stack:
+            span = stack.pop()
+            yield span
+            stack.extend(reversed(span.children))
+
+    def to_otlp(self) -> Dict:
+        """OTLP/JSON ExportTraceServiceRequest (collector의 file receiver로 읽을 수 있는 형식)"""
+        return {
+            "resourceSpans": [{
+                "resource": {"attributes": [_otlp_attribute("service.name", TRACE_SERVICE_NAME)]},
+                "scopeSpans": [{
+                    "scope": {"name": __name__},
+                    "spans": [span.to_otlp() for span in self.iter_spans()],
+                }],
+            }]
+        }
+
+
+def _otlp_attribute(key: str, value: Any) -> Dict:
+    if isinstance(value, bool):
+        typed = {"boolValue": value}
+    elif isinstance(value, int):
+        typed = {"intValue": str(value)}
+    elif isinstance(value, float):
+        typed = {"doubleValue": value}
+    else:
+        typed = {"stringValue": str(value)}
+    return {"key": key, "value": typed}
+
+
+def current_span() -> Optional[Span]:
+    """현재 열린 구간 (기록 중이 아니면 None)"""
+    return _current_span.get()
+
+
+@contextmanager
+def span(name: str, **attributes):
+    """구간 측정 컨텍스트 매니저 (현재 리런을 기록 중일 때만 동작)"""
+    parent = _current_span.get()
+    if parent is None:
+        yield None
+        return
+
+    trace = parent.trace
+    if trace.span_count >= TRACE_MAX_SPANS:
+        trace.dropped += 1
+        yield None
+        return
+    trace.span_count += 1
+
+    current = Span(name, trace, parent, attributes)
+    parent.children.append(current)
+    token = _current_span.set(current)
+    try:
+        yield current
+    except Exception as e:
+        current.error = type(e).__name__
+        raise
+    finally:
+        current.end_ns = time.time_ns()
+        _current_span.reset(token)
+
+
+def traced(name: Optional[str] = None):
+    """함수 실행을 구간으로 기록하는 데코레이터 (이름 생략 시 모듈.함수)"""
+    def decorator(func):
+        span_name = name or f"{func.__module__.rsplit('.', 1)[-1]}.{func.__name__}"
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            if _current_span.get() is None:
+                return func(*args, **kwargs)
+            with span(span_name):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def overlay_enabled() -> bool:
+    """개발자 오버레이 표시 여부 (환경 변수 또는 ?trace=1)"""
+    if TRACE_OVERLAY_ENABLED:
+        return True
+    try:
+        return st.query_params.get("trace") == "1"
+    except Exception:
+        return False
+
+
+@contextmanager
+def rerun_trace(name: str = "rerun"):
+    """스크립트 실행 전체를 루트 구간으로 기록하고 끝나면 내보내기
+
+    st.rerun()/st.stop()도 예외로 빠져나오므로 finally에서 마무리한다.
+    """
+    if not (TRACE_ENABLED or overlay_enabled()):
+        yield None
+        return
+
+    trace = Trace(name)
+    token = _current_span.set(trace.root)
+    try:
+        yield trace
+    except BaseException as e:
+        # st.rerun()/st.stop()의 제어 예외도 여기로 오므로 오류로 표시하지 않고 종류만 남김
+        trace.root.set_attribute("exit", type(e).__name__)
+        raise
+    finally:
+        trace.root.end_ns = time.time_ns()
+        _current_span.reset(token)
+        # 페이지는 사이드바 실행 후에 정해지므로 마지막에 기록
+        trace.root.set_attribute("streamlit.page", st.session_state.get("selected_page") or "")
+        if trace.dropped:
+            trace.root.set_attribute("spans.dropped", trace.dropped)
+        if TRACE_ENABLED:
+            export_trace(trace)
+
+
+def export_trace(trace: Trace, path: str = TRACE_EXPORT_PATH):
+    """OTLP/JSON 한 줄로 파일에 추가"""
+    line = json.dumps(trace.to_otlp(), ensure_ascii=False, separators=(",", ":"))
+    try:
+        with _export_lock:
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+            with open(path, "a", encoding="utf-8") as f:
+                f.write(line + "\n")
+    except OSError:
+        # 계측 때문에 앱이 실패하지 않도록 내보내기 실패는 무시
+        pass
+
+
+def format_span_tree(root: Span, min_duration_ms: float = OVERLAY_MIN_DURATION_MS) -> List[str]:
+    """구간 트리를 들여쓴 텍스트 줄로 변환 (전체 ms / 자체 ms)"""
+    lines = []
+
+    def visit(node: Span, depth: int):
+        if depth and node.duration_ms < min_duration_ms:
+            return
+        detail = ", ".join(f"{k}={v}" for k, v in node.attributes.items())
+        lines.append(
+            f"{'  ' * depth}{node.name:<{max(1, 40 - 2 * depth)}} "
+            f"{node.duration_ms:8.1f} ms  (self {node.self_ms:6.1f})"
+            + (f"  [{detail}]" if detail else "")
+            + (f"  !{node.error}" if node.error else "")
+        )
+        for child in node.children:
+            visit(child, depth + 1)
+
+    visit(root, 0)
+    return lines
+
+
+def show_trace_overlay():
+    """사이드바에 현재 리런의 구간 트리 표시 (오버레이가 켜진 경우만)
+
+    스크립트 끝에서 호출하므로 루트 구간은 호출 시점까지의 시간이다.
+    """
+    parent = _current_span.get()
+    if parent is None or not overlay_enabled():
+        return
+    root = parent.trace.root
+    with st.sidebar.expander(f"⏱ 리런 {root.duration_ms:.0f} ms", expanded=False):
+        st.code("\n".join(format_span_tree(root)), language=None)
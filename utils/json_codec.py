@@ -0,0 +1,65 @@
+"""
+JSON 코덱
+설치되어 있으면 msgspec 또는 orjson으로, 없으면 표준 json으로 응답 본문(bytes)을 바로 디코딩
+msgspec이 있으면 TypedDict 등 타입을 주어 디코딩과 검증을 한 번에 수행
+
+FLANDY_JSON_CODEC=json|orjson|msgspec 으로 사용할 구현을 강제할 수 있다.
+"""
+
+import json
+import os
+from typing import Any, Optional, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+# 선호 순서대로 사용 가능한 구현
+# (5 MB 태스크 목록 기준 msgspec이 orjson보다 빠름 - benchmarks.run_benchmarks --only json)
+_AVAILABLE = [name for name, module in (("msgspec", msgspec), ("orjson", orjson)) if module is not None] + ["json"]
+# 사용할 구현 (환경 변수로 지정한 구현이 없으면 선호 순서의 첫 번째)
+JSON_BACKEND = os.environ.get("FLANDY_JSON_CODEC", "")
+if JSON_BACKEND not in _AVAILABLE:
+    JSON_BACKEND = _AVAILABLE[0]
+
+# 디코딩/검증 실패 시 발생하는 예외 (모두 잡으려면 except DecodeError)
+DecodeError = (ValueError, msgspec.DecodeError) if msgspec is not None else (ValueError,)
+
+# 타입 → msgspec 디코더 (타입마다 한 번만 생성)
+_typed_decoders = {}
+
+if JSON_BACKEND == "orjson":
+    _loads = orjson.loads
+elif JSON_BACKEND == "msgspec":
+    _loads = msgspec.json.Decoder().decode
+else:
+    _loads = json.loads
+
+
+def loads(data: Union[bytes, bytearray, str]) -> Any:
+    """JSON 디코딩 (bytes를 문자열로 바꾸지 않고 바로 처리)"""
+    return _loads(data)
+
+
+def decode(data: Union[bytes, bytearray, str], schema: Optional[Any] = None) -> Any:
+    """JSON 디코딩, schema(타입)가 있으면 msgspec으로 검증까지 한 번에 수행
+
+    타입을 주면 결과에는 타입에 정의한 필드만 남는다 (msgspec이 나머지를 버림).
+    모든 필드가 필요하면 타입 없이 디코딩할 것. 검증 실패 시 msgspec.ValidationError (DecodeError에 포함).
+    msgspec이 없거나 FLANDY_JSON_CODEC=json이면 검증 없이 loads와 같다.
+    """
+    if schema is None or msgspec is None or JSON_BACKEND == "json":
+        return _loads(data)
+
+    decoder = _typed_decoders.get(schema)
+    if decoder is None:
+        decoder = _typed_decoders[schema] = msgspec.json.Decoder(schema)
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+    return decoder.decode(data)
@@ -0,0 +1,258 @@
+"""
+API 호출 메트릭
+프로세스 단위 레지스트리에 엔드포인트별 요청 수, 상태 코드, 응답 크기(본문/전송), 압축률,
+지연/디코딩 시간 히스토그램, 캐시 적중/미스를 모으고 Prometheus 텍스트 형식으로 제공
+
+- 주기적으로 LOCAL_CACHE_DIR/metrics.prom 파일에 덤프 (node_exporter textfile collector 형식)
+- FLANDY_METRICS_PORT를 지정하면 http://127.0.0.1:<port>/metrics 로도 제공
+"""
+
+import os
+import re
+import threading
+import time
+from collections import defaultdict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Optional, Tuple
+
+from config.constants import LOCAL_CACHE_DIR
+
+# 요청 지연 히스토그램 구간 (초)
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+# JSON 디코딩 시간 히스토그램 구간 (초)
+DECODE_BUCKETS = (0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5)
+# 압축률(본문 bytes / 전송 bytes) 히스토그램 구간
+COMPRESSION_RATIO_BUCKETS = (1.0, 1.5, 2.0, 3.0, 5.0, 8.0, 12.0, 20.0, 40.0)
+# 파일 덤프 간격 (초)
+METRICS_DUMP_INTERVAL = 60
+# 파일 덤프 경로
+METRICS_DUMP_PATH = os.environ.get("FLANDY_METRICS_FILE", os.path.join(LOCAL_CACHE_DIR, "metrics.prom"))
+# /metrics 엔드포인트 포트 (비어 있으면 띄우지 않음)
+METRICS_PORT = os.environ.get("FLANDY_METRICS_PORT", "")
+# 메트릭 이름 접두사
+METRICS_PREFIX = "flandy"
+
+# 경로의 ID/날짜를 자리표시자로 바꿔 라벨 종류가 늘어나지 않도록
+_ROUTE_ID = re.compile(r"/\d+(?=/|$)")
+_ROUTE_DATE = re.compile(r"/\d{4}-\d{2}-\d{2}(?=/|$)")
+_ROUTE_QUERY = re.compile(r"\?.*$")
+
+
+def normalize_route(endpoint: str) -> str:
+    """/teams/3/sprints?x=1 → /teams/{id}/sprints"""
+    route = _ROUTE_QUERY.sub("", endpoint)
+    route = _ROUTE_DATE.sub("/{date}", route)
+    return _ROUTE_ID.sub("/{id}", route)
+
+
+class Histogram:
+    """누적 구간 히스토그램 (Prometheus histogram과 같은 의미)"""
+
+    __slots__ = ("buckets", "counts", "sum", "count")
+
+    def __init__(self, buckets: Tuple[float, ...]):
+        self.buckets = buckets
+        self.counts = [0] * len(buckets)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float):
+        self.sum += value
+        self.count += 1
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                self.counts[i] += 1
+                break
+
+    def cumulative(self):
+        total = 0
+        for bound, count in zip(self.buckets, self.counts):
+            total += count
+            yield bound, total
+
+
+def _escape_label(value) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(labels: Tuple[Tuple[str, str], ...]) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{k}="{_escape_label(v)}"' for k, v in labels) + "}"
+
+
+def _format_value(value: float) -> str:
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+class MetricsRegistry:
+    """프로세스 단위 메트릭 저장소 (스레드 안전)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self._requests: Dict[Tuple, int] = defaultdict(int)
+            self._response_bytes: Dict[Tuple, int] = defaultdict(int)
+            self._wire_bytes: Dict[Tuple, int] = defaultdict(int)
+            self._compression: Dict[Tuple, Histogram] = {}
+            self._latency: Dict[Tuple, Histogram] = {}
+            self._decode: Dict[Tuple, Histogram] = {}
+            self._cache: Dict[Tuple, int] = defaultdict(int)
+            self._started_at = time.time()
+
+    def record_request(self, method: str, endpoint: str, status, duration: float,
+                       size: int = 0, page: str = "", wire_size: Optional[int] = None,
+                       encoding: str = "identity"):
+        """요청 한 건 기록 (status는 HTTP 상태 코드 또는 'error', duration은 초)
+
+        size는 압축을 푼 본문 크기, wire_size는 실제 전송 크기 (없으면 size와 같다고 봄).
+        """
+        route_key = (("method", method.upper()), ("route", normalize_route(endpoint)))
+        if wire_size is None:
+            wire_size = size
+        with self._lock:
+            self._requests[route_key + (("status", str(status)), ("page", page))] += 1
+            self._response_bytes[route_key] += size
+            self._wire_bytes[route_key + (("encoding", encoding),)] += wire_size
+            if encoding != "identity" and wire_size > 0:
+                if route_key not in self._compression:
+                    self._compression[route_key] = Histogram(COMPRESSION_RATIO_BUCKETS)
+                self._compression[route_key].observe(size / wire_size)
+            if route_key not in self._latency:
+                self._latency[route_key] = Histogram(LATENCY_BUCKETS)
+            self._latency[route_key].observe(duration)
+
+    def record_decode(self, endpoint: str, duration: float):
+        """응답 본문 JSON 디코딩 시간 기록 (초)"""
+        key = (("route", normalize_route(endpoint)),)
+        with self._lock:
+            if key not in self._decode:
+                self._decode[key] = Histogram(DECODE_BUCKETS)
+            self._decode[key].observe(duration)
+
+    def record_cache(self, cache: str, result: str):
+        """캐시 조회 결과 기록 (result: hit / miss / revalidated / delta_sync / full_sync)"""
+        with self._lock:
+            self._cache[(("cache", cache), ("result", result))] += 1
+
+    def request_counts_by_page(self) -> Dict[str, int]:
+        """페이지별 백엔드 요청 수 (많은 순)"""
+        totals: Dict[str, int] = defaultdict(int)
+        with self._lock:
+            for key, count in self._requests.items():
+                totals[dict(key)["page"]] += count
+        return dict(sorted(totals.items(), key=lambda item: -item[1]))
+
+    def render_prometheus(self) -> str:
+        """Prometheus text exposition format 0.0.4"""
+        p = METRICS_PREFIX
+        lines = []
+
+        def counter(name, help_text, values):
+            lines.append(f"# HELP {p}_{name} {help_text}")
+            lines.append(f"# TYPE {p}_{name} counter")
+            for labels, value in sorted(values.items()):
+                lines.append(f"{p}_{name}{_format_labels(labels)} {_format_value(value)}")
+
+        def histogram(name, help_text, values):
+            lines.append(f"# HELP {p}_{name} {help_text}")
+            lines.append(f"# TYPE {p}_{name} histogram")
+            for labels, hist in sorted(values.items()):
+                for bound, total in hist.cumulative():
+                    lines.append(f"{p}_{name}_bucket{_format_labels(labels + (('le', repr(bound)),))} {total}")
+                lines.append(f"{p}_{name}_bucket{_format_labels(labels + (('le', '+Inf'),))} {hist.count}")
+                lines.append(f"{p}_{name}_sum{_format_labels(labels)} {_format_value(hist.sum)}")
+                lines.append(f"{p}_{name}_count{_format_labels(labels)} {hist.count}")
+
+        with self._lock:
+            counter("api_requests_total", "Backend API requests by route, status and page.", self._requests)
+            counter("api_response_bytes_total", "Backend API response body bytes.", self._response_bytes)
+            counter("api_response_wire_bytes_total", "Backend API response bytes on the wire by content encoding.",
+                    self._wire_bytes)
+            histogram("api_response_compression_ratio", "Uncompressed / wire size of compressed responses.",
+                      self._compression)
+            histogram("api_request_duration_seconds", "Backend API request latency.", self._latency)
+            histogram("api_decode_duration_seconds", "JSON decode time of API responses.", self._decode)
+            counter("cache_lookups_total", "Client-side cache lookups by result.", self._cache)
+            lines.append(f"# HELP {p}_metrics_start_time_seconds Registry start (or reset) time.")
+            lines.append(f"# TYPE {p}_metrics_start_time_seconds gauge")
+            lines.append(f"{p}_metrics_start_time_seconds {_format_value(self._started_at)}")
+        return "\n".join(lines) + "\n"
+
+
+# 프로세스 전체에서 공유하는 레지스트리
+metrics = MetricsRegistry()
+
+_dump_lock = threading.Lock()
+_last_dump = 0.0
+_server_lock = threading.Lock()
+_server: Optional[ThreadingHTTPServer] = None
+
+
+def current_page() -> str:
+    """요청을 일으킨 페이지 (스크립트 스레드가 아니면 background)"""
+    from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+    ctx = get_script_run_ctx(suppress_warning=True)
+    if ctx is None:
+        return "background"
+    state = ctx.session_state
+    if "user_token" not in state or not state["user_token"]:
+        return "login"
+    # 로그인 직후 첫 실행처럼 페이지가 아직 정해지지 않은 경우
+    return (state["selected_page"] if "selected_page" in state else None) or "(none)"
+
+
+def dump_metrics_if_due(path: str = METRICS_DUMP_PATH, interval: float = METRICS_DUMP_INTERVAL) -> bool:
+    """마지막 덤프 후 interval초가 지났으면 Prometheus 텍스트를 파일로 저장 (원자적 교체)"""
+    global _last_dump
+    now = time.monotonic()
+    with _dump_lock:
+        if _last_dump and now - _last_dump < interval:
+            return False
+        _last_dump = now
+
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(metrics.render_prometheus())
+        os.replace(tmp_path, path)
+    except OSError:
+        # 메트릭 때문에 앱이 실패하지 않도록 덤프 실패는 무시
+        return False
+    return True
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path.split("?", 1)[0] != "/metrics":
+            self.send_error(404)
+            return
+        body = metrics.render_prometheus().encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_metrics_server(port: str = METRICS_PORT) -> Optional[ThreadingHTTPServer]:
+    """/metrics 엔드포인트 시작 (포트가 지정된 경우, 프로세스당 한 번)"""
+    global _server
+    if not port:
+        return None
+    with _server_lock:
+        if _server is None:
+            try:
+                _server = ThreadingHTTPServer(("127.0.0.1", int(port)), _MetricsHandler)
+            except (OSError, ValueError):
+                return None
+            threading.Thread(target=_server.serve_forever, daemon=True).start()
+    return _server
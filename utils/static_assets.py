@@ -0,0 +1,92 @@
+"""
+정적 자산 유틸리티
+CSS 최소화와 이미지 src 생성을 프로세스당 한 번만 수행
+정적 파일 서빙(server.enableStaticServing)이 켜져 있으면 이미지를 URL로,
+꺼져 있으면 캐시된 data URI로 제공
+"""
+
+import base64
+import mimetypes
+import os
+import re
+import shutil
+import threading
+from typing import Dict, Tuple
+
+import streamlit as st
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# Streamlit 정적 파일 폴더 (메인 스크립트 src/app.py 옆의 static)
+STATIC_DIR = os.path.join(PROJECT_ROOT, "src", "static")
+STATIC_URL_PREFIX = "app/static"
+
+# (경로, mtime) → 이미지 src
+_image_sources: Dict[Tuple[str, float, bool], str] = {}
+_image_lock = threading.Lock()
+
+_CSS_COMMENT = re.compile(r"/\*.*?\*/", re.S)
+_CSS_SPACE = re.compile(r"\s+")
+_CSS_PUNCTUATION = re.compile(r"\s*([{};,])\s*")
+
+
+def minify_css(css: str) -> str:
+    """주석/불필요한 공백 제거"""
+    css = _CSS_COMMENT.sub("", css)
+    css = _CSS_SPACE.sub(" ", css)
+    css = _CSS_PUNCTUATION.sub(r"\1", css)
+    return css.replace(";}", "}").strip()
+
+
+def static_serving_enabled() -> bool:
+    """Streamlit 정적 파일 서빙 활성화 여부"""
+    try:
+        return bool(st.get_option("server.enableStaticServing"))
+    except Exception:
+        return False
+
+
+def _publish_static(path: str, mtime: float) -> str:
+    """자산을 정적 폴더로 복사하고 URL 반환 (파일명에 mtime을 넣어 브라우저 캐시 무효화)"""
+    stem, ext = os.path.splitext(os.path.basename(path))
+    name = f"{stem}.{int(mtime):x}{ext}"
+    target = os.path.join(STATIC_DIR, name)
+    if not os.path.exists(target):
+        os.makedirs(STATIC_DIR, exist_ok=True)
+        shutil.copyfile(path, target)
+    return f"{STATIC_URL_PREFIX}/{name}"
+
+
+def _data_uri(path: str) -> str:
+    mime = mimetypes.guess_type(path)[0] or "application/octet-stream"
+    with open(path, "rb") as f:
+        return f"data:{mime};base64,{base64.b64encode(f.read()).decode()}"
+
+
+def image_src(path: str) -> str:
+    """<img src>에 넣을 값 (파일이 없으면 빈 문자열)
+
+    파일 mtime별로 한 번만 인코딩/복사하므로 리런마다 디스크를 읽지 않는다.
+    """
+    try:
+        mtime = os.path.getmtime(path)
+    except OSError:
+        return ""
+
+    serve_static = static_serving_enabled()
+    key = (os.path.abspath(path), mtime, serve_static)
+    with _image_lock:
+        cached = _image_sources.get(key)
+    if cached is not None:
+        return cached
+
+    try:
+        src = _publish_static(path, mtime) if serve_static else _data_uri(path)
+    except OSError:
+        # 정적 폴더에 쓸 수 없으면 data URI로 대체
+        try:
+            src = _data_uri(path)
+        except OSError:
+            src = ""
+    with _image_lock:
+        _image_sources[key] = src
+    return src
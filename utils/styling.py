@@ -3,19 +3,70 @@
 CSS 변수 기반 다크/라이트 테마 시스템
 """
 
+from functools import lru_cache
+
 import streamlit as st
 from config.constants import THEME_DARK, THEME_LIGHT
+from utils.static_assets import minify_css
+
+# 페이지 전용 스타일
+PAGE_CSS = {
+    'ai_assistant': """
+    /* 메인 콘텐츠 영역 최대 너비 해제 */
+    .main .block-container {
+        max-width: 100%;
+        padding-left: 2rem;
+        padding-right: 2rem;
+    }
+    /* 채팅 메시지 전체 너비 사용 */
+    .stChatMessage {
+        max-width: 100% !important;
+        width: 100% !important;
+    }
+    .stChatMessage > div {
+        max-width: 100% !important;
+    }
+    /* 채팅 메시지 내 텍스트 영역 */
+    .stChatMessage [data-testid="stMarkdownContainer"] {
+        max-width: 100% !important;
+    }
+    .stChatMessage [data-testid="stMarkdownContainer"] p {
+        max-width: 100% !important;
+        word-break: keep-all;
+        overflow-wrap: break-word;
+    }
+    /* 입력 영역 전체 너비 */
+    .stChatInput, .stForm {
+        max-width: 100% !important;
+    }
+    """,
+}
 
 
 def apply_custom_css():
     """테마 기반 CSS 변수 + 공통 컴포넌트 스타일 주입"""
     theme = st.session_state.get('theme', 'dark')
+    st.markdown(f"<style>{get_theme_css(theme)}</style>", unsafe_allow_html=True)
+
+
+def apply_page_css(page: str):
+    """페이지 전용 스타일 주입"""
+    st.markdown(f"<style>{_page_css(page)}</style>", unsafe_allow_html=True)
+
+
+@lru_cache(maxsize=None)
+def _page_css(page: str) -> str:
+    return minify_css(PAGE_CSS[page])
+
+
+@lru_cache(maxsize=None)
+def get_theme_css(theme: str) -> str:
+    """테마별 최소화된 CSS (프로세스당 테마마다 한 번 생성)"""
     palette = THEME_DARK if theme == 'dark' else THEME_LIGHT
 
     vars_css = "\n".join(f"    --{k.replace('_', '-')}: {v};" for k, v in palette.items())
 
-    st.markdown(f"""
-    <style>
+    return minify_css(f"""
         :root {{
             {vars_css}
         }}
@@ -127,5 +178,4 @@ def apply_custom_css():
             border: none !important;
             box-shadow: none !important;
         }}
-    </style>
-    """, unsafe_allow_html=True)
+    """)